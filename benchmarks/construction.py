@@ -0,0 +1,62 @@
+"""
+Construction cost of wide and deeply nested schemas, as paid at import time by modules that
+declare them. Names and examples are only built when they are first read, so the second
+column also reports the cost of reading the name and the example of the whole schema. Times are
+the fastest of the runs, the median is too noisy for builds this short:
+
+    python benchmarks/construction.py [--fields 1000] [--depth 300] [--runs 20]
+"""
+import argparse
+import sys
+import time
+
+from pycomb import combinators as c
+
+
+def _wide(fields):
+    return c.struct({'f{}'.format(i): c.maybe(c.list(c.Int)) for i in range(fields)})
+
+
+def _deep(depth):
+    result = c.Int
+    for i in range(depth):
+        result = c.maybe(c.struct({'value': c.Int, 'next': c.list(result)}))
+    return result
+
+
+def _first_use(combinator):
+    # The name of the root is built out of the names of all its children, and the same goes
+    # for its example.
+    combinator.meta['name']
+    combinator.example
+
+
+def _time(build, runs, read):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        combinator = build()
+        if read:
+            _first_use(combinator)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fields', type=int, default=1000)
+    parser.add_argument('--depth', type=int, default=300)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.depth * 20))
+
+    print('{:<30} {:>10} {:>16}'.format('schema', 'build', 'build + read'))
+    for label, build in (
+            ('wide struct, {} fields'.format(args.fields), lambda: _wide(args.fields)),
+            ('nested, depth {}'.format(args.depth), lambda: _deep(args.depth))):
+        print('{:<30} {:7.2f} ms {:13.2f} ms'.format(
+            label, _time(build, args.runs, False), _time(build, args.runs, True)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Enums of a large vocabulary: construction time, memory and validation of lists of codes, for each
+way of storing the values.
+
+    python benchmarks/enums.py [--values 300000] [--codes 100000] [--runs 3]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import pycomb
+from pycomb import combinators as c, vocabulary
+
+
+def _time(f, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--values', type=int, default=300000)
+    parser.add_argument('--codes', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    values = ['SKU{:08d}'.format(i) for i in range(args.values)]
+    codes = [values[i * 7919 % args.values] for i in range(args.codes)]
+    fd, path = tempfile.mkstemp()
+    with os.fdopen(fd, 'w') as f:
+        f.write('\n'.join(values))
+
+    try:
+        for label, build in (
+                ('dict', lambda: c.enum({x: x for x in values})),
+                ('enum.of', lambda: c.enum.of(values)),
+                ('sorted list', lambda: c.enum(vocabulary.SortedVocabulary(values))),
+                ('file', lambda: c.enum(vocabulary.FileVocabulary(path)))):
+            enum = build()
+            codes_list = c.list(enum)
+            print('{:<12} build {:8.1f} ms  size {:6.1f} MiB  element by element {:8.1f} ms  '
+                  'list.is_type {:8.1f} ms  list {:8.1f} ms'.format(
+                      label, _time(build, args.runs), pycomb.sizeof(enum) / 2 ** 20,
+                      _time(lambda: all(map(enum.is_type, codes)), args.runs),
+                      _time(lambda: codes_list.is_type(codes), args.runs),
+                      _time(lambda: codes_list(codes), args.runs)))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Validation of records whose status is a union of constants, and of dictionaries against a union
+of dictionary constants:
+
+    python benchmarks/literals.py [--literals 60] [--rows 100000] [--runs 3]
+"""
+import argparse
+import statistics
+import time
+
+from pycomb import combinators as c
+
+
+def _time(f, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--literals', type=int, default=60)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    statuses = ['STATUS_{}'.format(i) for i in range(args.literals)]
+    Status = c.union(*map(c.constant, statuses), name='Status')
+    Row = c.struct({'id': c.Int, 'status': Status}, name='Row')
+    rows = [{'id': i, 'status': statuses[i % args.literals]} for i in range(args.rows)]
+
+    # Dictionaries of different sizes: a value is only compared with the constant of its size.
+    presets = [{'key{}'.format(i): i for i in range(size)} for size in range(100, 100 + args.literals)]
+    Preset = c.union(*map(c.constant, presets), name='Preset')
+    values = [dict(presets[-1]) for _ in range(args.rows // 100)]
+
+    for label, f in (
+            ('Status.is_type', lambda: all(map(Status.is_type, (x['status'] for x in rows)))),
+            ('list(Row).is_type', lambda: c.list(Row).is_type(rows)),
+            ('list(Row)', lambda: c.list(Row)(rows)),
+            ('Preset.is_type', lambda: all(map(Preset.is_type, values)))):
+        print('{:<30} {:8.1f} ms'.format(label, _time(f, args.runs)))
+
+
+if __name__ == '__main__':
+    main()
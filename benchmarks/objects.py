@@ -0,0 +1,73 @@
+"""
+Validation of ORM-style rows with generic_object, one by one and with validate_all:
+
+    python benchmarks/objects.py [--rows 100000] [--runs 5]
+"""
+import argparse
+import statistics
+import time
+
+from pycomb import combinators as c
+
+
+class Row:
+    __slots__ = ('id', 'title', 'score', 'tags')
+
+    def __init__(self, i):
+        self.id = i
+        self.title = 'row {}'.format(i)
+        self.score = i / 3
+        self.tags = ('a', 'b')
+
+
+class DeferredRow(Row):
+    __slots__ = ()
+
+
+Rows = c.generic_object({
+    'id': c.Int,
+    'title': c.String,
+    'score': c.maybe(c.Float),
+    'tags': c.list(c.String)
+}, Row)
+
+
+def _time(f, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [Row(i) for i in range(args.rows)]
+
+    def one_by_one():
+        for row in rows:
+            Rows(row)
+
+    checks = [(k, v.is_type) for k, v in Rows.meta['fields'].items()]
+
+    def fields_only():
+        for row in rows:
+            for k, is_type in checks:
+                is_type(getattr(row, k))
+
+    results = [('fields is_type only', _time(fields_only, args.runs)),
+               ('one by one', _time(one_by_one, args.runs))]
+    if hasattr(Rows, 'validate_all'):
+        results.append(('validate_all', _time(lambda: Rows.validate_all(rows), args.runs)))
+
+    for label, ms in results:
+        print('{:<30} {:8.1f} ms'.format(label, ms))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Routing of log lines through a union of regexp groups, one per line format:
+
+    python benchmarks/regexp.py [--formats 40] [--lines 100000] [--runs 3]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from pycomb import combinators as c
+
+
+def _formats(count):
+    Level = c.enum.of(['DEBUG', 'INFO', 'WARN', 'ERROR'])
+    return [
+        c.regexp_group(r'(\d{{4}}-\d\d-\d\d) (\w+) svc{}: (\w+) took (\d+)ms'.format(i), c.String, Level,
+                       c.String, c.String, name='Format{}'.format(i))
+        for i in range(count)]
+
+
+def _time(f, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--formats', type=int, default=40)
+    parser.add_argument('--lines', type=int, default=100000)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    Line = c.union(*_formats(args.formats))
+    Lines = c.list(Line)
+    lines = ['2024-01-0{} INFO svc{}: query took {}ms'.format(i % 9 + 1, random.randrange(args.formats), i)
+             for i in range(args.lines)]
+
+    def validate():
+        for line in lines:
+            Line(line)
+
+    for label, f in (('is_type', lambda: Lines.is_type(lines)), ('validation', validate)):
+        print('{:<30} {:8.1f} ms'.format(label, _time(f, args.runs)))
+
+
+if __name__ == '__main__':
+    main()
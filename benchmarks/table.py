@@ -0,0 +1,51 @@
+"""
+Validation of a list of flat dictionaries, row by row with list(struct) and by columns with table:
+
+    python benchmarks/table.py [--rows 500000] [--runs 3]
+"""
+import argparse
+import statistics
+import time
+
+from pycomb import combinators as c, context
+
+Row = c.struct({
+    'id': c.Int,
+    'name': c.String,
+    'score': c.maybe(c.Float),
+    'country': c.enum.of(['IT', 'FR', 'DE']),
+    'visits': c.subtype(c.Int, lambda d: d >= 0),
+    'active': c.Boolean
+}, name='Row')
+
+
+def _time(f, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        f()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = [{'id': i, 'name': 'row {}'.format(i), 'score': i / 7 if i % 3 else None,
+             'country': ('IT', 'FR', 'DE')[i % 3], 'visits': i % 100, 'active': i % 2 == 0}
+            for i in range(args.rows)]
+    passthrough = context.create(output=context.PASSTHROUGH)
+
+    for label, f in (
+            ('list(struct)', lambda: c.list(Row)(rows)),
+            ('list(struct), passthrough', lambda: c.list(Row)(rows, ctx=passthrough)),
+            ('list(struct).is_type', lambda: c.list(Row).is_type(rows)),
+            ('table(struct)', lambda: c.table(Row)(rows))):
+        print('{:<30} {:8.1f} ms'.format(label, _time(f, args.runs)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,2 @@
+from pycomb.tracking import tracked
+from pycomb.memory import sizeof
@@ -1,8 +1,11 @@
+import array
+import operator
 import re
 from functools import wraps
 
 from pycomb import examples
-from pycomb import predicates as p, context
+from pycomb import lazy as lazy_views
+from pycomb import predicates as p, context, exceptions, records, sampling, trust, vocabulary
 
 _orig_list = list
 
@@ -16,27 +19,142 @@ def assert_type(guard, ctx, expected=None, found_type=None):
         ctx.notify_error(expected, found_type)
 
 
+def _resolving(method):
+    @wraps(method)
+    def _method(self, *a, **kw):
+        self.resolve()
+        return method(self, *a, **kw)
+    return _method
+
+
+class Meta(dict):
+    """
+    The metadata of a combinator. A default name is only built, by ``build_name(meta)``, the first
+    time it is read.
+    """
+    __slots__ = ('_build_name',)
+
+    # Arguments are positional: keyword arguments make construction twice as slow.
+    def __init__(self, items, name=None, build_name=None):
+        dict.__init__(self, items)
+        if name or build_name is None:
+            self['name'] = name
+            build_name = None
+        self._build_name = build_name
+
+    def set_default_name(self, build_name):
+        """
+        Builds the default name with ``build_name(meta)`` instead, unless a name was given.
+        """
+        if not dict.__contains__(self, 'name'):
+            self._build_name = build_name
+
+    def resolve(self):
+        build_name = self._build_name
+        if build_name is not None:
+            self._build_name = None
+            self['name'] = build_name(self)
+
+    def __missing__(self, key):
+        build_name = self._build_name
+        if key != 'name' or build_name is None:
+            raise KeyError(key)
+        self._build_name = None
+        name = self['name'] = build_name(self)
+        return name
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or (key == 'name' and self._build_name is not None)
+
+    __iter__ = _resolving(dict.__iter__)
+    __len__ = _resolving(dict.__len__)
+    __eq__ = _resolving(dict.__eq__)
+    __ne__ = _resolving(dict.__ne__)
+    __repr__ = _resolving(dict.__repr__)
+    keys = _resolving(dict.keys)
+    values = _resolving(dict.values)
+    items = _resolving(dict.items)
+    copy = _resolving(dict.copy)
+    __hash__ = None
+
+
+class Combinator:
+    """
+    A validating callable: ``combinator(x, ctx=None)`` validates ``x`` and returns it, or its
+    converted value, while ``combinator.is_type(x)`` only tells whether ``x`` is valid.
+
+    The example is built by ``build_example(combinator)`` the first time it is read. Combinators with other
+    attributes declare them in the ``__slots__`` of a subclass.
+    """
+    __slots__ = ('_validate', 'is_type', 'meta', '_example', '_build_example', '__weakref__')
+
+    def __init__(self, validate, is_type, meta, example=None, build_example=None):
+        self._validate = validate
+        self.is_type = is_type
+        self.meta = meta
+        self._example = example
+        self._build_example = build_example
+
+    # Calls go straight to the validating closure: the property getter is a C function, so no
+    # Python frame is added between the caller and the closure.
+    __call__ = property(operator.attrgetter('_validate'))
+
+    @property
+    def example(self):
+        build_example = self._build_example
+        if build_example is not None:
+            self._build_example = None
+            self._example = build_example(self)
+        return self._example
+
+    @example.setter
+    def example(self, value):
+        self._build_example = None
+        self._example = value
+
+
+# Returned by check() for invalid values.
+INVALID = type('Invalid', (), {'__repr__': lambda self: 'INVALID', '__bool__': lambda self: False})()
+
+_fast_failure_ctx = context.create(validation_error_observer=context.fast_failure_observer)
+
+
+def check(combinator, value):
+    """
+    Validates ``value`` without building any error message: returns the validated value, or INVALID.
+    """
+    # A single pass: the first error raises the same message-less exception.
+    try:
+        return combinator(value, ctx=_fast_failure_ctx)
+    except exceptions.PyCombValidationError as e:
+        if e is not exceptions.FAST_FAILURE:
+            raise
+        return INVALID
+
+
 def irreducible(predicate, example, name='Irreducible'):
-    def _irreducible(value, ctx=None):
+    def _validate(value, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return value
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_irreducible, value, new_ctx)
 
         if new_ctx.empty:
             new_ctx.append(name)
         new_ctx.validating_value = value
-        assert_type(_irreducible.is_type(value), ctx=new_ctx, expected=name, found_type=type(value))
+        if not _irreducible.is_type(value):
+            assert_type(False, ctx=new_ctx, expected=name, found_type=type(value))
 
         return value
 
-    _irreducible.is_type = predicate
-
-    _irreducible.meta = {
-        'name': name
-    }
-
-    _irreducible.example = example
-
+    _irreducible = Combinator(_validate, predicate, Meta({'kind': 'irreducible'}, name), example)
     return _irreducible
 
 
@@ -44,44 +162,235 @@ Int = irreducible(p.is_int, examples.Int, name='Int')
 Float = irreducible(p.is_float, examples.Float, name='Float')
 String = irreducible(p.is_string, examples.String, name='String')
 Boolean = irreducible(p.is_bool, True, name='Boolean')
+Bytes = irreducible(p.is_bytes, examples.Bytes, name='Bytes')
+# Any bytes-like value: bytes, bytearray or memoryview.
+ByteString = irreducible(p.is_byte_string, examples.Bytes, name='ByteString')
+
+
+# Builtin containers that can only be equal to containers of the same kind.
+_CONTAINER_KINDS = {dict: dict, list: list, set: set, frozenset: set, bytes: bytes, bytearray: bytes}
+
+
+def _fingerprint(value):
+    """
+    Returns the kind and the length of a builtin container, that equal containers share;
+    None for any other value.
+    """
+    kind = _CONTAINER_KINDS.get(type(value))
+    return None if kind is None else (kind, len(value))
+
+
+def _constant_name(meta):
+    return 'Constant({})'.format(meta['value'])
 
 
 def constant(value, name=None):
-    return irreducible(lambda d: d == value, value, name=name or 'Constant({})'.format(value))
+    """
+    A single value, compared with ==. Unions look their constants up by value or by fingerprint.
+    """
+    def _validate(x, ctx=None):
+        new_ctx = context.create(ctx)
+        if new_ctx.production_mode:
+            return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_constant, x, new_ctx)
+
+        if new_ctx.empty:
+            new_ctx.append(meta['name'])
+        new_ctx.validating_value = x
+        if not _constant.is_type(x):
+            assert_type(False, ctx=new_ctx, expected=meta['name'], found_type=type(x))
+
+        return x
+
+    meta = Meta({'kind': 'irreducible', 'value': value}, name, _constant_name)
+    _constant = Combinator(_validate, lambda d: d == value, meta, value)
+    return _constant
+
+
+def _to_array(x, typecode, ctx, expected):
+    if type(x) is array.array and x.typecode == typecode:
+        return x
+    try:
+        return array.array(typecode, x)
+    except OverflowError:
+        assert_type(False, ctx=ctx, expected=expected, found_type='int out of range of {!r} arrays'.format(typecode))
+        return x
+
+
+def _has_deadline(ctx):
+    limits = ctx.limits
+    return limits is not None and limits.deadline is not None
+
+
+def _sequence_result(x, result, changed, passthrough):
+    """
+    Builds the value returned by list and sequence out of the validated elements.
+    """
+    if not passthrough:
+        return tuple(result)
+    if not changed:
+        return x
+    return result if type(x) is _orig_list else tuple(result)
+
+
+_INT_TYPECODES = 'bBhHiIlLqQ'
+_FLOAT_TYPECODES = 'fd'
+
+
+def _numeric_element(combinator):
+    """
+    Returns the array typecodes, the predicate and the subtype conditions of Int or Float
+    (or of their subtypes), None for any other combinator.
+    """
+    conditions = []
+    while getattr(combinator, 'meta', {}).get('kind') == 'subtype':
+        conditions.append(combinator.meta['condition'])
+        combinator = combinator.meta['combinator']
+
+    if getattr(combinator, 'meta', {}).get('kind') != 'irreducible':
+        return None
+    if combinator.is_type is p.is_int:
+        return _INT_TYPECODES, p.is_int, conditions
+    if combinator.is_type is p.is_float:
+        return _FLOAT_TYPECODES, p.is_float, conditions
+    return None
+
+
+def _is_numeric_list(x, numeric):
+    typecodes, is_type, conditions = numeric
+    if type(x) is array.array:
+        # The typecode already tells the type of all the elements.
+        if x.typecode not in typecodes:
+            return False
+    elif type(x) not in (_orig_list, tuple) or not all(map(is_type, x)):
+        return False
+
+    return all(all(map(condition, x)) for condition in conditions)
+
+
+def _enum_element(combinator):
+    """
+    Returns the values of an enum, None for any other combinator.
+    """
+    meta = getattr(combinator, 'meta', {})
+    return meta['values'] if meta.get('kind') == 'enum' else None
+
+
+def _is_enum_list(x, values):
+    # A single set difference for the whole list; elements that cannot be hashed are not values.
+    try:
+        return not vocabulary.missing(values, x)
+    except TypeError:
+        return False
+
+
+def _enum_list_result(x, values, passthrough):
+    if isinstance(values, vocabulary.Vocabulary):
+        # Vocabularies map each value to itself.
+        return _sequence_result(x, x, False, passthrough)
+    result = _orig_list(map(values.__getitem__, x))
+    return _sequence_result(x, result, any(map(operator.is_not, result, x)), passthrough)
+
+
+# Names and examples are built from the metadata: no closure is kept for them.
+def _list_name(meta):
+    return 'List({})'.format(get_type_name(meta['element']))
+
+
+def _sequence_name(meta):
+    return 'Sequence({})'.format(get_type_name(meta['element']))
+
+
+def _sequence_example(combinator):
+    element = combinator.meta['element']
+    return [element.example for _ in range(examples.ListSize)]
 
 
 # noinspection PyShadowingBuiltins
-def list(combinator_element, name=None):
-    if not name:
-        name = 'List({})'.format(get_type_name(combinator_element))
+def list(combinator_element, name=None, output=None, typecode=None):
+    numeric = _numeric_element(combinator_element)
+    enum_values = _enum_element(combinator_element)
+    if typecode and (not numeric or typecode not in numeric[0]):
+        raise ValueError
+
+    def _validate(x, ctx=None):
+        if type(x) is tuple and trust.registry.is_trusted(x, _list):
+            return x
 
-    def _list(x, ctx=None):
         new_ctx_list = context.create(ctx)
         if new_ctx_list.production_mode:
             return x
+        if new_ctx_list.shadow:
+            return new_ctx_list.shadow.submit(_list, x, new_ctx_list)
 
+        if output:
+            new_ctx_list.output = output
+        passthrough = new_ctx_list.output == context.PASSTHROUGH
         if new_ctx_list.empty:
-            new_ctx_list.append(name)
+            new_ctx_list.append(meta['name'])
         new_ctx_list.validating_value = x
-        assert_type(x is not None, ctx=new_ctx_list, expected=name, found_type=type(None))
+        if x is None:
+            assert_type(False, ctx=new_ctx_list, expected=meta['name'], found_type=type(None))
         if not x:
-            return None
-        
+            if x is not None and typecode:
+                return array.array(typecode)
+            return x if passthrough else None
+        if _is_record_buffer(combinator_element, x):
+            return combinator_element.validate_buffer(x, new_ctx_list, expected=meta['name'])
+        if new_ctx_list.limits is not None:
+            new_ctx_list.enter(len(x) if hasattr(x, '__len__') else 0)
+
+        # Lists of numbers are checked in a single loop, the elements are validated one by one
+        # only to report errors.
+        if numeric and _is_numeric_list(x, numeric):
+            if typecode:
+                return _to_array(x, typecode, ctx=new_ctx_list, expected=meta['name'])
+            if passthrough or type(x) is array.array:
+                return x
+            result = tuple(x)
+            if new_ctx_list.trust:
+                trust.registry.mark(result, _list)
+            return result
+        if enum_values is not None and type(x) in (_orig_list, tuple) and _is_enum_list(x, enum_values):
+            result = _enum_list_result(x, enum_values, passthrough)
+            if type(result) is tuple and new_ctx_list.trust:
+                trust.registry.mark(result, _list)
+            return result
+
         result = []
+        changed = False
         i = 0
+        error_count = new_ctx_list.error_count
+        checks_deadline = _has_deadline(new_ctx_list)
 
         for d in x:
             new_ctx = context.create(new_ctx_list)
             new_ctx.append('[{}]'.format(i), separator='')
+            if checks_deadline and i and not i % context.DEADLINE_INTERVAL:
+                new_ctx.check_deadline()
 
-            result.append(combinator_element(d, ctx=new_ctx))
+            element = combinator_element(d, ctx=new_ctx)
+            changed = changed or element is not d
+            result.append(element)
             i += 1
 
-        return tuple(result)
+        result = _sequence_result(x, result, changed, passthrough)
+        if type(result) is tuple and new_ctx_list.trust and new_ctx_list.error_count == error_count:
+            trust.registry.mark(result, _list)
+        return result
 
     def _is_type(d):
+        if numeric and type(d) is array.array:
+            return _is_numeric_list(d, numeric)
+        if _is_record_buffer(combinator_element, d):
+            return combinator_element.is_buffer_type(d)
         if not type(d) in (_orig_list, tuple):
             return False
+        if trust.registry.is_trusted(d, _list):
+            return True
+        if enum_values is not None:
+            return _is_enum_list(d, enum_values)
 
         for x in d:
             if not combinator_element.is_type(x):
@@ -89,50 +398,83 @@ def list(combinator_element, name=None):
 
         return True
 
-    _list.is_type = _is_type
-    _list.meta = {
-        'name': name
-    }
-    _list.example = [combinator_element.example for _ in range(examples.ListSize)]
+    meta = Meta(
+        {'kind': 'list', 'element': combinator_element, 'typecode': typecode},
+        name, _list_name)
+    _list = Combinator(_validate, _is_type, meta, None, _sequence_example)
     return _list
 
 
 # noinspection PyShadowingBuiltins
-def sequence(combinator_element, name=None):
-    if not name:
-        name = 'Sequence({})'.format(get_type_name(combinator_element))
+def sequence(combinator_element, name=None, output=None, lazy=False):
+    enum_values = _enum_element(combinator_element)
+
+    def _validate(x, ctx=None):
+        if type(x) is tuple and trust.registry.is_trusted(x, _sequence):
+            return x
 
-    def _sequence(x, ctx=None):
         new_ctx_sequence = context.create(ctx)
         if new_ctx_sequence.production_mode:
             return x
+        if new_ctx_sequence.shadow:
+            return new_ctx_sequence.shadow.submit(_sequence, x, new_ctx_sequence)
 
+        if output:
+            new_ctx_sequence.output = output
+        passthrough = new_ctx_sequence.output == context.PASSTHROUGH
         if new_ctx_sequence.empty:
-            new_ctx_sequence.append(name)
+            new_ctx_sequence.append(meta['name'])
         new_ctx_sequence.validating_value = x
-        assert_type(x is not None, ctx=new_ctx_sequence, expected=name, found_type=type(None))
+        if x is None:
+            assert_type(False, ctx=new_ctx_sequence, expected=meta['name'], found_type=type(None))
         if not x:
-            return None
-
-        assert_type(
-            hasattr(x, '__getitem__') and hasattr(x, '__len__'),
-            ctx=new_ctx_sequence, expected=name, found_type=type(x))
+            return x if passthrough else None
+        if _is_record_buffer(combinator_element, x):
+            return combinator_element.validate_buffer(x, new_ctx_sequence, expected=meta['name'])
+
+        is_type = hasattr(x, '__getitem__') and hasattr(x, '__len__')
+        assert_type(is_type, ctx=new_ctx_sequence, expected=meta['name'], found_type=type(x))
+        if new_ctx_sequence.limits is not None:
+            new_ctx_sequence.enter(len(x) if is_type and not lazy else 0)
+        if lazy and is_type:
+            return lazy_views.LazySequence(_sequence, x, new_ctx_sequence)
+        if enum_values is not None and is_type and _is_enum_list(x, enum_values):
+            result = _enum_list_result(x, enum_values, passthrough)
+            if type(result) is tuple and new_ctx_sequence.trust:
+                trust.registry.mark(result, _sequence)
+            return result
 
         result = []
+        changed = False
         i = 0
+        error_count = new_ctx_sequence.error_count
+        checks_deadline = _has_deadline(new_ctx_sequence)
 
         for d in x:
             new_ctx = context.create(new_ctx_sequence)
             new_ctx.append('[{}]'.format(i), separator='')
+            if checks_deadline and i and not i % context.DEADLINE_INTERVAL:
+                new_ctx.check_deadline()
 
-            result.append(combinator_element(d, ctx=new_ctx))
+            element = combinator_element(d, ctx=new_ctx)
+            changed = changed or element is not d
+            result.append(element)
             i += 1
 
-        return tuple(result)
+        result = _sequence_result(x, result, changed, passthrough)
+        if type(result) is tuple and new_ctx_sequence.trust and new_ctx_sequence.error_count == error_count:
+            trust.registry.mark(result, _sequence)
+        return result
 
     def _is_type(d):
         if not hasattr(d, '__getitem__') or not hasattr(d, '__len__'):
             return False
+        if _is_record_buffer(combinator_element, d):
+            return combinator_element.is_buffer_type(d)
+        if type(d) is tuple and trust.registry.is_trusted(d, _sequence):
+            return True
+        if enum_values is not None:
+            return _is_enum_list(d, enum_values)
 
         for x in d:
             if not combinator_element.is_type(x):
@@ -140,46 +482,222 @@ def sequence(combinator_element, name=None):
 
         return True
 
-    _sequence.is_type = _is_type
-    _sequence.meta = {
-        'name': name
-    }
-    _sequence.example = [combinator_element.example for _ in range(examples.ListSize)]
+    meta = Meta(
+        {'kind': 'sequence', 'element': combinator_element},
+        name, _sequence_name)
+    _sequence = Combinator(_validate, _is_type, meta, None, _sequence_example)
     return _sequence
 
 
-def struct(combinators, name: str=None, strict: bool=False):
-    if not name:
-        base_name = strict and 'StrictStruct' or 'Struct'
-        name = '{}{{{}}}'.format(base_name, ''.join(
-            ', '.join(map(lambda k: '{}: {}'.format(k, get_type_name(combinators[k])), combinators))))
-        if strict:
-            name = '{}'.format(name)
+_RECORD_INT_CODES = _INT_TYPECODES + 'nN'
+_RECORD_FLOAT_CODES = 'efd'
+
+
+def _record_field_check(combinator, code):
+    """
+    Returns the predicate that a field unpacked with ``code`` must satisfy, None if the
+    format already guarantees the field is valid.
+    """
+    numeric = _numeric_element(combinator)
+    if numeric and code in (_RECORD_INT_CODES if numeric[0] is _INT_TYPECODES else _RECORD_FLOAT_CODES):
+        conditions = numeric[2]
+        if not conditions:
+            return None
+        return lambda v: all(condition(v) for condition in conditions)
+    return combinator.is_type
+
+
+class _Record(Combinator):
+    __slots__ = ('validate_buffer', 'is_buffer_type', 'layout')
+
+
+def _record_example(combinator):
+    fields = combinator.meta['fields']
+    return combinator.layout.pack_example([fields[x].example if x in fields else 0 for x in combinator.layout.names])
+
+
+def record(fmt_or_fields, name=None, byte_order='<'):
+    """
+    A fixed-layout binary record, read from a bytes-like object (bytes, bytearray, memoryview, mmap)
+    without copying it.
+
+    ``fmt_or_fields`` is either a ``struct`` format, whose fields are named by their position,
+    or a list of (field name, format) or (field name, format, combinator) tuples.
+    The validated value is a ``records.RecordView``; a list or sequence of records validates
+    a whole buffer of records and returns a ``records.RecordArray``.
+    """
+    if isinstance(fmt_or_fields, str):
+        byte_order, codes = records.parse_format(fmt_or_fields)
+        fields = []
+        position = 0
+        for code in codes:
+            if code.endswith('x'):
+                fields.append((None, code, None))
+            else:
+                fields.append((str(position), code, None))
+                position += 1
+    else:
+        fields = [tuple(x) + (None,) * (3 - len(x)) for x in fmt_or_fields]
+
+    layout = records.RecordLayout(byte_order, [(field_name, code) for field_name, code, _ in fields])
+    field_combinators = {}
+    checks = []
+    for field_name, code, combinator in fields:
+        if field_name is None:
+            continue
+        if combinator is None:
+            if code[-1] in _RECORD_INT_CODES:
+                combinator = Int
+            elif code[-1] in _RECORD_FLOAT_CODES:
+                combinator = Float
+            elif code == '?':
+                combinator = Boolean
+        if combinator is None:
+            continue
+        field_combinators[field_name] = combinator
+        check = _record_field_check(combinator, code)
+        if check:
+            checks.append((layout.positions[field_name], field_name, combinator, check))
+
+    def _check_values(values, ctx):
+        for position, field_name, combinator, check in checks:
+            if not check(values[position]):
+                field_ctx = context.create(ctx)
+                field_ctx.append(field_name)
+                combinator(values[position], ctx=field_ctx)
+
+    def _validate(x, ctx=None):
+        new_ctx = context.create(ctx)
+        if new_ctx.production_mode:
+            return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_record, x, new_ctx)
+
+        if new_ctx.empty:
+            new_ctx.append(meta['name'])
+        new_ctx.validating_value = x
+        is_type = records.is_buffer(x) and memoryview(x).nbytes == layout.size
+        assert_type(is_type, ctx=new_ctx, expected=meta['name'], found_type=type(x))
+        if not is_type:
+            return x
+
+        _check_values(layout.struct.unpack_from(x), new_ctx)
+        return records.RecordView(layout, x)
+
+    def _is_type(d):
+        if not records.is_buffer(d) or memoryview(d).nbytes != layout.size:
+            return False
+        values = layout.struct.unpack_from(d)
+        return all(check(values[position]) for position, _, _, check in checks)
+
+    def _validate_buffer(x, ctx, expected):
+        """
+        Validates a buffer of consecutive records for list and sequence.
+        The records are unpacked one at a time, only the fields that the format does not
+        guarantee are checked.
+        """
+        view = memoryview(x)
+        assert_type(
+            view.nbytes % layout.size == 0, ctx=ctx, expected=expected,
+            found_type='buffer of {} bytes'.format(view.nbytes))
+        view = view.cast('B')[:view.nbytes - view.nbytes % layout.size]
+        if ctx.limits is not None:
+            ctx.enter(view.nbytes // layout.size)
+        if checks:
+            checks_deadline = _has_deadline(ctx)
+            for i, values in enumerate(layout.struct.iter_unpack(view)):
+                if checks_deadline and i and not i % context.DEADLINE_INTERVAL:
+                    ctx.check_deadline()
+                for position, _, _, check in checks:
+                    if not check(values[position]):
+                        item_ctx = context.create(ctx)
+                        item_ctx.append('[{}]'.format(i), separator='')
+                        _check_values(values, item_ctx)
+                        break
+        return records.RecordArray(layout, view)
+
+    def _is_buffer_type(d):
+        view = memoryview(d)
+        if view.nbytes % layout.size:
+            return False
+        return all(
+            check(values[position])
+            for values in layout.struct.iter_unpack(view.cast('B'))
+            for position, _, _, check in checks)
+
+    meta = Meta(
+        {'kind': 'record', 'fields': field_combinators, 'format': layout.struct.format, 'size': layout.size},
+        name, lambda _: 'Record{{{}}}'.format(
+            ', '.join('{}: {}'.format(field_name, code) for field_name, code, _ in fields if field_name)))
+    _record = _Record(_validate, _is_type, meta, None, _record_example)
+    _record.validate_buffer = _validate_buffer
+    _record.is_buffer_type = _is_buffer_type
+    _record.layout = layout
+    return _record
+
+
+def _is_record_buffer(combinator_element, x):
+    return combinator_element.meta.get('kind') == 'record' and records.is_buffer(x)
 
-    def _struct(x, ctx=None):
+
+def _struct_name(meta):
+    return '{}{{{}}}'.format(meta['strict'] and 'StrictStruct' or 'Struct', ', '.join(
+        '{}: {}'.format(k, get_type_name(v)) for k, v in meta['fields'].items()))
+
+
+def _struct_example(combinator):
+    return {x: v.example for x, v in combinator.meta['fields'].items()}
+
+
+def struct(combinators, name: str=None, strict: bool=False, output=None, lazy: bool=False):
+    def _validate(x, ctx=None):
         ctx = context.create(ctx)
         if ctx.production_mode:
             return x
+        if ctx.shadow:
+            return ctx.shadow.submit(_struct, x, ctx)
 
+        if output:
+            ctx.output = output
         if ctx.empty:
-            ctx.append(name)
+            ctx.append(meta['name'])
 
         ctx.validating_value = x
-        is_type = _struct.is_type(x) or (type(x) is dict and (not strict or all(k in combinators for k in x.keys())))
-        assert_type(is_type, ctx=ctx, expected=name, found_type=type(x))
-
+        # The fields are checked one by one below, no need to walk them here too.
+        is_type = type(x) is p.StructType or \
+            (type(x) is dict and (not strict or all(k in combinators for k in x.keys())))
         # Cannot proceed, this is not even a struct.
         if not is_type:
+            assert_type(False, ctx=ctx, expected=meta['name'], found_type=type(x))
             return x
 
         if type(x) == p.StructType:
             return x
-
-        new_dict = {}
-        for k in combinators:
+        if ctx.limits is not None:
+            ctx.enter(0 if lazy else len(combinators))
+        if lazy:
+            return lazy_views.LazyStruct(_struct, x, ctx)
+
+        passthrough = ctx.output == context.PASSTHROUGH
+        new_dict = None if passthrough else {}
+        checks_deadline = _has_deadline(ctx)
+        for i, k in enumerate(combinators):
             new_ctx = context.create(ctx)
             new_ctx.append('[{}]'.format(k), separator='')
-            new_dict[k] = combinators[k](x.get(k), ctx=new_ctx)
+            if checks_deadline and i and not i % context.DEADLINE_INTERVAL:
+                new_ctx.check_deadline()
+            value = x.get(k)
+            field = combinators[k](value, ctx=new_ctx)
+            if not passthrough:
+                new_dict[k] = field
+            elif field is not value:
+                # Only the fields that have been converted need a copy of the dictionary.
+                if new_dict is None:
+                    new_dict = dict(x)
+                new_dict[k] = field
+
+        if passthrough:
+            return x if new_dict is None else new_dict
         return p.StructType(new_dict)
 
     def _is_type(d):
@@ -187,41 +705,226 @@ def struct(combinators, name: str=None, strict: bool=False):
                                type(d) == dict and all(combinators[k].is_type(d.get(k)) for k in combinators)
         return result and (not strict or all(k in combinators for k in d.keys()))
 
-    _struct.is_type = _is_type
-
-    _struct.meta = {
-        'name': name
-    }
-    _struct.example = {x: v.example for x, v in combinators.items()}
+    meta = Meta({'kind': 'struct', 'fields': combinators, 'strict': strict}, name, _struct_name)
+    _struct = Combinator(_validate, _is_type, meta, None, _struct_example)
     return _struct
 
 
-def maybe(combinator, name=None):
-    if not name:
-        name = 'Maybe ({})'.format(get_type_name(combinator))
+# Combinators that only check the type of the values, by their predicate.
+_TYPE_PREDICATES = {
+    p.is_int: frozenset([int]),
+    p.is_float: frozenset([float]),
+    p.is_string: frozenset([str]),
+    p.is_bool: frozenset([bool]),
+    p.is_bytes: frozenset([bytes]),
+    p.is_byte_string: frozenset([bytes, bytearray, memoryview])
+}
+
+
+def _accepted_types(combinator):
+    """
+    Returns the types of the values accepted by a combinator that checks nothing but their type,
+    None for any other combinator.
+    """
+    meta = getattr(combinator, 'meta', {})
+    kind = meta.get('kind')
+    if kind == 'irreducible':
+        return _TYPE_PREDICATES.get(combinator.is_type)
+    if kind == 'maybe':
+        types = _accepted_types(meta['combinator'])
+        return types and types | {type(None)}
+    if kind == 'union':
+        types = _orig_list(map(_accepted_types, meta['combinators']))
+        return None if None in types else frozenset().union(*types)
+    return None
+
+
+def _column_check(combinator):
+    """
+    Returns a function that tells whether all the values of a column are valid, in a single
+    loop over them.
+    """
+    meta = getattr(combinator, 'meta', {})
+    types = _accepted_types(combinator)
+    if types is not None:
+        return lambda column: types.issuperset(map(type, column))
+
+    if meta.get('kind') == 'subtype':
+        types, condition = _accepted_types(meta['combinator']), meta['condition']
+        if types is not None:
+            return lambda column: types.issuperset(map(type, column)) and all(map(condition, column))
+
+    if meta.get('kind') == 'enum':
+        values = meta['values']
+        return lambda column: _is_enum_list(column, values)
+
+    return lambda column: all(map(combinator.is_type, column))
+
+
+def _table_name(meta):
+    return 'Table({})'.format(get_type_name(meta['struct']))
+
 
-    def _maybe(x, ctx=None):
+def _table_example(combinator):
+    row = combinator.meta['struct'].example
+    return [row for _ in range(examples.ListSize)]
+
+
+def table(struct_combinator, name=None):
+    """
+    A list of the rows of a struct, validated by columns: the key set of each row is checked once,
+    then every column is checked in a single loop. Rows are returned as they are.
+    Errors are reported as Table(...)[row].field.
+    """
+    if getattr(struct_combinator, 'meta', {}).get('kind') != 'struct':
+        raise ValueError
+    fields, strict = struct_combinator.meta['fields'], struct_combinator.meta['strict']
+    names = _orig_list(fields)
+    keys = frozenset(names)
+    checks = [_column_check(fields[k]) for k in names]
+    getters = [operator.itemgetter(k) for k in names]
+
+    def _columns(rows):
+        # Dictionaries with as many keys as the fields, all of them, only need to be transposed.
+        if set(map(type, rows)) <= {dict} and set(map(len, rows)) <= {len(names)}:
+            try:
+                return [_orig_list(map(getter, rows)) for getter in getters]
+            except KeyError:
+                pass
+        return None
+
+    def _row_errors(i, row):
+        if type(row) is p.StructType:
+            return []
+        if type(row) is not dict or strict and not keys.issuperset(row.keys()):
+            return [(i, -1, row)]
+        return [(i, j, row.get(k)) for j, k in enumerate(names) if not fields[k].is_type(row.get(k))]
+
+    def _errors(x):
+        """
+        Returns the (row, field index, value) of the invalid values, in row order; the field index
+        is -1 for invalid rows.
+        """
+        columns, positions, irregular = _columns(x), None, []
+        if columns is None:
+            # The rows with other keys are validated one by one.
+            irregular = [i for i, row in enumerate(x) if type(row) is not dict or row.keys() != keys]
+            skipped = set(irregular)
+            positions = [i for i in range(len(x)) if i not in skipped]
+            columns = _columns([x[i] for i in positions])
+
+        errors = []
+        for j, (column, check) in enumerate(zip(columns, checks)):
+            if check(column):
+                continue
+            is_type = fields[names[j]].is_type
+            errors.extend(
+                (positions[r] if positions else r, j, value)
+                for r, value in enumerate(column) if not is_type(value))
+        for i in irregular:
+            errors.extend(_row_errors(i, x[i]))
+
+        errors.sort(key=lambda error: error[:2])
+        return errors
+
+    def _limited_errors(x, ctx):
+        # The rows are checked in chunks, the deadline between them.
+        errors = []
+        for start in range(0, len(x), context.DEADLINE_INTERVAL):
+            if start:
+                ctx.check_deadline()
+            errors.extend((start + i, j, value) for i, j, value in _errors(x[start:start + context.DEADLINE_INTERVAL]))
+        return errors
+
+    def _validate(x, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_table, x, new_ctx)
 
+        if new_ctx.empty:
+            new_ctx.append(meta['name'])
         new_ctx.validating_value = x
-        new_ctx.append(name)
-        assert_type(
-            _maybe.is_type(x), ctx=new_ctx,
-            found_type=type(x), expected='None or {}'.format(get_type_name(combinator)))
+        is_type = type(x) in (_orig_list, tuple)
+        assert_type(is_type, ctx=new_ctx, expected=meta['name'], found_type=type(x))
+        if not is_type:
+            return x
+        if new_ctx.limits is not None:
+            new_ctx.enter(len(x) * (len(names) + 1), depth=2)
+
+        for i, j, value in _limited_errors(x, new_ctx) if _has_deadline(new_ctx) else _errors(x):
+            row_ctx = context.create(new_ctx)
+            row_ctx.append('[{}]'.format(i), separator='')
+            if j < 0:
+                row_ctx.validating_value = value
+                assert_type(False, ctx=row_ctx, expected=get_type_name(struct_combinator), found_type=type(value))
+            else:
+                row_ctx.append(names[j])
+                fields[names[j]](value, ctx=row_ctx)
+        return x
+
+    def _is_type(d):
+        return type(d) in (_orig_list, tuple) and not _errors(d)
+
+    meta = Meta({'kind': 'table', 'struct': struct_combinator}, name, _table_name)
+    _table = Combinator(_validate, _is_type, meta, None, _table_example)
+    return _table
+
+
+def _maybe_name(meta):
+    return 'Maybe ({})'.format(get_type_name(meta['combinator']))
+
 
-        return combinator(x, new_ctx) if x else None
+def _wrapped_example(combinator):
+    return combinator.meta['combinator'].example
 
-    _maybe.is_type = lambda d: d is None or combinator.is_type(d)
 
-    _maybe.meta = {
-        'name': name
-    }
-    _maybe.example = combinator.example
+def maybe(combinator, name=None):
+    def _validate(x, ctx=None):
+        new_ctx = context.create(ctx)
+        if new_ctx.production_mode:
+            return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_maybe, x, new_ctx)
+
+        new_ctx.validating_value = x
+        new_ctx.append(meta['name'])
+        if new_ctx.limits is not None and x is not None:
+            # is_type would walk the whole value before any limit is checked.
+            valid, result = _first_valid(x, (combinator,), new_ctx)
+        else:
+            valid, result = _maybe.is_type(x), None
+        if not valid:
+            assert_type(
+                False, ctx=new_ctx,
+                found_type=type(x), expected='None or {}'.format(get_type_name(combinator)))
+
+        if not x:
+            return None
+        return result if valid and new_ctx.limits is not None else combinator(x, new_ctx)
+
+    meta = Meta(
+        {'kind': 'maybe', 'combinator': combinator},
+        name, _maybe_name)
+    _maybe = Combinator(_validate, lambda d: d is None or combinator.is_type(d), meta, None, _wrapped_example)
     return _maybe
 
 
+def _first_valid(x, combinators, ctx):
+    """
+    Validates x with each combinator in turn, in trial copies of ctx that share its limits, and
+    returns the first combinator that accepts it and its result, or (None, None).
+    """
+    for combinator in combinators:
+        try:
+            return combinator, combinator(x, ctx=ctx.trial())
+        except exceptions.PyCombValidationError as e:
+            if e is not exceptions.FAST_FAILURE:
+                raise
+    return None, None
+
+
 def _default_composite_dispatcher(x, combinators):
     for combinator in combinators:
         if combinator.is_type(x):
@@ -230,150 +933,519 @@ def _default_composite_dispatcher(x, combinators):
     return None
 
 
+def _struct_guard(combinator):
+    """
+    Returns a cheap necessary condition for ``combinator.is_type``, based on the keys of a struct.
+    """
+    meta = getattr(combinator, 'meta', {})
+    if meta.get('kind') != 'struct':
+        return None
+
+    fields, strict = meta['fields'], meta['strict']
+    required = set()
+    for k, field in fields.items():
+        try:
+            if not field.is_type(None):
+                required.add(k)
+        except Exception:
+            pass
+    fields_keys = frozenset(fields)
+
+    def _guard(d):
+        if type(d) is dict:
+            return required.issubset(d) and (not strict or fields_keys.issuperset(d))
+        return type(d) is p.StructType
+    return _guard
+
+
+def _struct_union_dispatcher(combinators):
+    """
+    Skips the structs of a union whose keys do not match, before checking their fields.
+    Returns None when the union has no structs.
+    """
+    guards = [_struct_guard(x) for x in combinators]
+    if all(guard is None for guard in guards):
+        return None
+    branches = tuple(zip(guards, combinators))
+
+    def _dispatch(x):
+        for guard, combinator in branches:
+            if (guard is None or guard(x)) and combinator.is_type(x):
+                return combinator
+        return None
+
+    return _dispatch
+
+
+def _first_example(combinators):
+    for x in combinators:
+        if x.example is not None:
+            return x.example
+    return None
+
+
+def _union_name(meta):
+    return 'Union({})'.format(', '.join(map(lambda d: get_type_name(d), meta['combinators'])))
+
+
+def _union_example(combinator):
+    return _first_example(combinator.meta['combinators'])
+
+
+class _RegexpGroup(Combinator):
+    __slots__ = ('remember',)
+
+
+def _regexp_groups(value, matcher, first, count):
+    """
+    Returns ``count`` groups of a match, starting from the group ``first``.
+    """
+    if type(value) in (str, bytes):
+        return matcher.groups()[first - 1:first - 1 + count]
+    # Slices of a bytearray or of a memoryview, the latter without copying the buffer.
+    value = value.cast('B') if type(value) is memoryview else value
+    return tuple(
+        None if start < 0 else value[start:end] for start, end in map(matcher.span, range(first, first + count)))
+
+
+def _groups_valid(combinators, groups):
+    for combinator, group in zip(combinators, groups):
+        if not combinator.is_type(group):
+            return False
+    return True
+
+
+# Numbered back references and conditions would refer to other groups once the patterns are joined.
+_GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+
+def _regexp_union_dispatcher(combinators):
+    """
+    Joins the patterns of a union of regexp groups into a single alternation, whose match tells
+    the branch and holds its groups. With ``remember`` the branch keeps the match for the
+    validation that follows. Returns None when the patterns cannot be joined.
+    """
+    if len(combinators) < 2 or any(getattr(x, 'meta', {}).get('kind') != 'regexp_group' for x in combinators):
+        return None
+    patterns = [x.meta['pattern'] for x in combinators]
+    text = type(patterns[0].pattern)
+    if any(type(x.pattern) is not text or x.flags != patterns[0].flags or x.groupindex for x in patterns) or \
+            any(_GROUP_REFERENCE.search(x.pattern if text is str else x.pattern.decode('latin-1')) for x in patterns):
+        return None
+
+    join = '|' if text is str else b'|'
+    branch = '(?P<_{}>{})' if text is str else b'(?P<_%d>%b)'
+    try:
+        joined = re.compile(join.join(
+            branch.format(i, x.pattern) if text is str else branch % (i, x.pattern)
+            for i, x in enumerate(patterns)), patterns[0].flags)
+    except re.error:
+        return None
+    value_types = str if text is str else (bytes, bytearray, memoryview)
+    branches = {'_{}'.format(i): (i, joined.groupindex['_{}'.format(i)] + 1) for i in range(len(combinators))}
+
+    def _dispatch(x, remember=False):
+        if not isinstance(x, value_types):
+            return None
+        matcher = joined.match(x)
+        if matcher is None:
+            return None
+        i, first = branches[matcher.lastgroup]
+        combinator = combinators[i]
+        groups = _regexp_groups(x, matcher, first, combinator.meta['pattern'].groups)
+        if _groups_valid(combinator.meta['combinators'], groups):
+            if remember:
+                combinator.remember(x, groups)
+            return combinator
+        # The pattern matched, but not the groups: the next branches can still match.
+        return _default_composite_dispatcher(x, combinators[i + 1:])
+
+    return _dispatch
+
+
+def _literals(combinators):
+    """
+    Returns the index of the first constant of each hashable value.
+    """
+    literals = {}
+    for i, combinator in enumerate(combinators):
+        meta = getattr(combinator, 'meta', {})
+        if meta.get('kind') != 'irreducible' or 'value' not in meta:
+            continue
+        value = meta['value']
+        try:
+            # NaN is equal to nothing, not even to itself.
+            if value == value:
+                literals.setdefault(value, i)
+        except TypeError:
+            pass
+    return literals
+
+
+def _literal_union_dispatcher(combinators):
+    """
+    Looks up the constants of a union in a dictionary, instead of comparing them one by one;
+    containers are only compared with the constants that share their fingerprint.
+    Returns None when the union has less than two constants.
+    """
+    literals = _literals(combinators)
+    containers = {}
+    for i, combinator in enumerate(combinators):
+        meta = getattr(combinator, 'meta', {})
+        fingerprint = _fingerprint(meta['value']) if meta.get('kind') == 'irreducible' and 'value' in meta else None
+        if fingerprint is not None:
+            containers.setdefault(fingerprint, []).append(i)
+    indexes = set(literals.values()).union(*containers.values())
+    if len(indexes) < 2:
+        return None
+    others = [(i, x) for i, x in enumerate(combinators) if i not in indexes]
+    none = len(combinators)
+
+    def _dispatch(x):
+        fingerprint = _fingerprint(x) if containers else None
+        try:
+            i = literals.get(x, none)
+        except TypeError:
+            if fingerprint is None:
+                return _default_composite_dispatcher(x, combinators)
+            i = none
+        if fingerprint is not None:
+            for j in containers.get(fingerprint, ()):
+                if j >= i:
+                    break
+                if combinators[j].is_type(x):
+                    i = j
+                    break
+        # The combinators declared before the constant still come first.
+        for j, combinator in others:
+            if j > i:
+                break
+            if combinator.is_type(x):
+                return combinator
+        return combinators[i] if i < none else None
+
+    return _dispatch
+
+
 def union(*combinators, name=None, dispatcher=None):
-    if not name:
-        name = 'Union({})'.format(', '.join(map(lambda d: get_type_name(d), combinators)))
+    # Unions of regexp groups or of constants find their branch in a single step,
+    # unions of structs skip the branches whose keys do not match.
+    regexp_dispatcher = None if dispatcher else _regexp_union_dispatcher(combinators)
+    joined_dispatcher = None if dispatcher else \
+        regexp_dispatcher or _literal_union_dispatcher(combinators) or _struct_union_dispatcher(combinators)
 
-    def _union(x, ctx=None):
+    def _validate(x, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_union, x, new_ctx)
 
         new_ctx.validating_value = x
         if new_ctx.empty:
-            new_ctx.append(name)
-        assert_type(_union.is_type(x), ctx=new_ctx,
-                    expected=' or '.join(map(lambda d: get_type_name(d), combinators)), found_type=type(x))
-
+            new_ctx.append(meta['name'])
+
+        # The dispatched combinator is checked first, the other ones only matter for the error message.
+        if new_ctx.limits is not None:
+            # is_type would walk the whole value before any limit is checked.
+            first = dispatcher(x) if dispatcher else None
+            default_combinator, result = _first_valid(
+                x, ((first,) if first else ()) + tuple(y for y in combinators if y is not first), new_ctx)
+            if default_combinator is None:
+                assert_type(False, ctx=new_ctx,
+                            expected=' or '.join(map(lambda d: get_type_name(d), combinators)), found_type=type(x))
+            return result
         if dispatcher:
             default_combinator = dispatcher(x)
             assert default_combinator in combinators
+            is_type = default_combinator.is_type(x) or _union.is_type(x)
         else:
-            default_combinator = _default_composite_dispatcher(x, combinators)
+            if regexp_dispatcher:
+                # The branch is validated right away, with the match of the joined pattern.
+                default_combinator = regexp_dispatcher(x, remember=True)
+            elif joined_dispatcher:
+                default_combinator = joined_dispatcher(x)
+            else:
+                default_combinator = _default_composite_dispatcher(x, combinators)
+            is_type = default_combinator is not None
+        if not is_type:
+            assert_type(False, ctx=new_ctx,
+                        expected=' or '.join(map(lambda d: get_type_name(d), combinators)), found_type=type(x))
 
         return default_combinator(x, ctx=new_ctx) if default_combinator else None
 
-    _union.is_type = lambda d: any(combinator.is_type(d) for combinator in combinators)
+    meta = Meta(
+        {'kind': 'union', 'combinators': combinators},
+        name, _union_name)
+    if joined_dispatcher:
+        _union = Combinator(_validate, lambda d: joined_dispatcher(d) is not None, meta, None, _union_example)
+    else:
+        _union = Combinator(
+            _validate, lambda d: any(combinator.is_type(d) for combinator in combinators), meta,
+            None, _union_example)
 
-    _union.meta = {
-        'name': name
-    }
+    return _union
 
-    _union.example = None
-    for x in combinators:
-        if x.example is not None:
-            _union.example = x.example
-            break
 
-    return _union
+def _struct_field(x, field, default=None):
+    if type(x) is dict:
+        return x.get(field, default)
+    return x.__dict__['x'].get(field, default)
 
 
-def intersection(*combinators, example=None, name=None, dispatcher=None):
-    if not name:
-        name = 'Intersection({})'.format(
-            ', '.join(map(lambda d: get_type_name(d), combinators)))
+class _TaggedUnion(Combinator):
+    __slots__ = ('dispatch',)
+
 
-    def _intersection(x, ctx=None):
+def _tagged_union_name(meta):
+    return 'TaggedUnion({})'.format(', '.join(map(lambda d: get_type_name(d), meta['combinators'].values())))
+
+
+def _tagged_union_example(combinator):
+    return _first_example(combinator.meta['combinators'].values())
+
+
+def tagged_union(tag, combinators: dict, name=None):
+    """
+    A union of structs that selects its branch by the value of the ``tag`` field.
+    """
+    tags = ' or '.join(sorted(map(str, combinators)))
+    missing = object()
+
+    def _validate(x, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_tagged_union, x, new_ctx)
 
         new_ctx.validating_value = x
-        new_ctx.append(name)
-        assert_type(_intersection.is_type(x), ctx=new_ctx,
-                    expected=' or '.join(map(lambda d: get_type_name(d), combinators)),
-                    found_type=type(x))
+        if new_ctx.empty:
+            new_ctx.append(meta['name'])
+        is_struct = type(x) in (dict, p.StructType)
+        assert_type(is_struct, ctx=new_ctx, expected=meta['name'], found_type=type(x))
+
+        # Cannot proceed, there is no tag to look at.
+        if not is_struct:
+            return x
+
+        tag_value = _struct_field(x, tag, missing)
+        combinator = _tagged_union.dispatch(tag_value)
+        if combinator is None:
+            new_ctx.append('[{}]'.format(tag), separator='')
+            assert_type(False, ctx=new_ctx, expected=tags,
+                        found_type='missing tag' if tag_value is missing else str(tag_value))
+            return x
+
+        return combinator(x, ctx=new_ctx)
+
+    def _dispatch(tag_value):
+        try:
+            return combinators.get(tag_value)
+        except TypeError:
+            return None
+
+    def _is_type(d):
+        if type(d) not in (dict, p.StructType):
+            return False
+        combinator = _dispatch(_struct_field(d, tag))
+        return combinator is not None and combinator.is_type(d)
+
+    meta = Meta(
+        {'kind': 'tagged_union', 'tag': tag, 'combinators': combinators},
+        name, _tagged_union_name)
+    _tagged_union = _TaggedUnion(_validate, _is_type, meta, None, _tagged_union_example)
+    _tagged_union.dispatch = _dispatch
+    return _tagged_union
+
+
+def _merge_structs(combinators, name):
+    """
+    Merges non strict structs into a single struct; fields declared by more than one of them
+    must satisfy all their combinators.
+    """
+    if not combinators or any(
+            getattr(x, 'meta', {}).get('kind') != 'struct' or x.meta['strict'] for x in combinators):
+        return None
+
+    fields = {}
+    for combinator in combinators:
+        for k, field in combinator.meta['fields'].items():
+            fields.setdefault(k, [])
+            if field not in fields[k]:
+                fields[k].append(field)
+
+    return struct(
+        {k: v[0] if len(v) == 1 else intersection(*v) for k, v in fields.items()},
+        name=name)
 
-        if dispatcher:
-            default_combinator = dispatcher(x)
-            assert default_combinator in combinators
-        else:
-            default_combinator = _default_composite_dispatcher(x, combinators)
 
-        return default_combinator(x, ctx=new_ctx)
+def _intersection_name(meta):
+    return 'Intersection({})'.format(', '.join(map(lambda d: get_type_name(d), meta['combinators'])))
 
-    _intersection.meta = {
-        'name': name
-    }
-    _intersection.is_type = lambda d: all(combinator.is_type(d) for combinator in combinators)
-    _intersection.example = example
 
+def intersection(*combinators, example=None, name=None, dispatcher=None):
+    # Intersections of structs are validated in a single pass over all the fields.
+    merged = None if dispatcher else _merge_structs(combinators, name)
+
+    def _validate(x, ctx=None):
+        new_ctx = context.create(ctx)
+        if new_ctx.production_mode:
+            return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_intersection, x, new_ctx)
+
+        new_ctx.validating_value = x
+        new_ctx.append(meta['name'])
+
+        if merged:
+            is_struct = type(x) in (dict, p.StructType)
+            assert_type(is_struct, ctx=new_ctx,
+                        expected=' or '.join(map(lambda d: get_type_name(d), combinators)),
+                        found_type=type(x))
+            return merged(x, ctx=new_ctx) if is_struct else x
+
+        # Every member validates the value once, the result is the one of the dispatched member.
+        default_combinator = dispatcher(x) if dispatcher else combinators[0]
+        assert default_combinator in combinators
+        result = x
+        for combinator in combinators:
+            combinator_result = combinator(x, ctx=new_ctx)
+            if combinator is default_combinator:
+                result = combinator_result
+        return result
+
+    meta = Meta(
+        {'kind': 'intersection', 'combinators': combinators, 'merged': merged},
+        name, _intersection_name)
+    if merged:
+        # The merged struct reports its errors under the name of the intersection.
+        merged.meta.set_default_name(lambda _: meta['name'])
+        is_type = merged.is_type
+    else:
+        is_type = lambda d: all(combinator.is_type(d) for combinator in combinators)
+
+    _intersection = Combinator(_validate, is_type, meta, example)
     return _intersection
 
 
-def subtype(combinator, condition, example=None, name=None):
-    if not name:
-        name = 'Subtype({})'.format(get_type_name(combinator))
+def _subtype_name(meta):
+    return 'Subtype({})'.format(get_type_name(meta['combinator']))
+
 
-    def _subtype(x, ctx=None):
+def subtype(combinator, condition, example=None, name=None):
+    def _validate(x, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_subtype, x, new_ctx)
 
         if new_ctx.empty:
-            new_ctx.append(name)
+            new_ctx.append(meta['name'])
         new_ctx.validating_value = x
-        combinator(x, new_ctx)
-        assert_type(condition(x), ctx=new_ctx, expected=name, found_type=type(x))
+        result = combinator(x, new_ctx)
+        if not condition(x):
+            assert_type(False, ctx=new_ctx, expected=meta['name'], found_type=type(x))
 
-        return combinator(x, new_ctx)
+        return result
+
+    meta = Meta(
+        {'kind': 'subtype', 'combinator': combinator, 'condition': condition},
+        name, _subtype_name)
+    _subtype = Combinator(
+        _validate, lambda d: combinator.is_type(d) and condition(d), meta,
+        example or None, None if example else _wrapped_example)
+    return _subtype
 
-    _subtype.is_type = lambda d: combinator.is_type(d) and condition(d)
 
-    _subtype.meta = {
-        'name': name
-    }
-    _subtype.example = example or combinator.example
+class _Enum(Combinator):
+    __slots__ = ()
 
-    return _subtype
+    def __getattr__(self, item):
+        # The values of an enum are its attributes: Color.red. Private names are not looked up:
+        # copy and pickle read them before the slots are set.
+        if item.startswith('_'):
+            raise AttributeError(item)
+        try:
+            return self.meta['values'][item]
+        except KeyError:
+            raise AttributeError(item) from None
 
 
-def enum(values, name=None):
-    sorted_enums = _orig_list(values.keys())
-    sorted_enums.sort()
+# Names and error messages list this many values at most.
+_ENUM_TEXT_LIMIT = 20
+
+
+def _enum_text(values, separator, format_value):
+    head = vocabulary.smallest(values, _ENUM_TEXT_LIMIT)
+    text = separator.join(map(format_value, head))
+    if len(values) > len(head):
+        text += '{}... ({} values)'.format(separator, len(values))
+    return text
 
-    if not name:
-        name = 'Enum({})'.format(', '.join(map(lambda k: '{}: {}'.format(k, values[k]), sorted_enums)))
 
-    def _enum(x, ctx=None):
+def _enum_name(meta):
+    values = meta['values']
+    return 'Enum({})'.format(_enum_text(values, ', ', lambda k: '{}: {}'.format(k, values[k])))
+
+
+def _enum_example(combinator):
+    values = combinator.meta['values']
+    if isinstance(values, vocabulary.Vocabulary):
+        # Vocabularies are not ordered by insertion: the smallest value is the same in every process.
+        return vocabulary.smallest(values, 1)[0]
+    return next(iter(values))
+
+
+def enum(values, name=None):
+    """
+    values: a dictionary, or a vocabulary.Vocabulary for large sets of values.
+    """
+    # The values expected by error messages, sorted the first time a value is rejected.
+    expected = []
+
+    def _validate(x, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_enum, x, new_ctx)
 
         if new_ctx.empty:
-            new_ctx.append(name)
+            new_ctx.append(meta['name'])
 
         new_ctx.validating_value = x
-        is_type = _enum.is_type(x)
-        assert_type(
-            is_type, ctx=new_ctx,
-            expected=' or '.join(sorted_enums),
-            found_type=str(x))
-
-        if not is_type:
-            return None
-        return values[x]
-
-    _enum.is_type = lambda d: d in values
-    _enum.meta = {
-        'name': name,
-        map: values
-    }
-
-    enum_dict = {}
-    enum_dict.update(_enum.__dict__)
-    enum_dict.update(values)
-    _enum.__dict__ = enum_dict
-    _enum.example = _orig_list(values.keys())[0]
+        if _enum.is_type(x):
+            return values[x]
+
+        if not expected:
+            expected.append(_enum_text(values, ' or ', str))
+        assert_type(False, ctx=new_ctx, expected=expected[0], found_type=str(x))
+        return None
+
+    meta = Meta(
+        {'kind': 'enum', 'values': values, map: values},
+        name, _enum_name)
+    _enum = _Enum(_validate, lambda d: d in values, meta, None, _enum_example)
     return _enum
 
-enum.of = lambda l, name=None: enum({k: k for k in l}, name=name)
+
+def _enum_of(l, name=None):
+    if not isinstance(l, vocabulary.Vocabulary):
+        l = vocabulary.SetVocabulary(l)
+    return enum(l, name)
+
+
+enum.of = _enum_of
 
 
-def _typedef(args, kwargs, ctx=None):
+def _typedef(args, kwargs, ctx=None, sampler=None):
+    base_ctx = ctx
+
     def wrapper(fun):
-        @wraps(fun)
-        def f(*inner_args, **inner_kwargs):
+        def check_arguments(call, ctx=None):
+            inner_args, inner_kwargs = call
             ctx.validating_value = fun
             assert_type(
                 len(args) == len(inner_args), ctx=ctx, expected='{} arguments'.format(len(args)),
@@ -385,6 +1457,22 @@ def _typedef(args, kwargs, ctx=None):
             for k in kwargs:
                 kwargs[k](inner_kwargs.get(k), ctx=ctx)
 
+        @wraps(fun)
+        def f(*inner_args, **inner_kwargs):
+            ctx = base_ctx
+            if sampler:
+                if not sampler.should_validate():
+                    return fun(*inner_args, **inner_kwargs)
+                ctx = sampler.context(base_ctx)
+
+            if ctx.shadow:
+                ctx.shadow.submit(check_arguments, (inner_args, inner_kwargs), ctx)
+                return fun(*inner_args, **inner_kwargs)
+
+            check_arguments((inner_args, inner_kwargs), ctx=ctx)
+            if sampler:
+                # Validated calls see the values they were given, as the skipped calls do.
+                return fun(*inner_args, **inner_kwargs)
             typesafe_args = (args[i](inner_args[i]) for i in range(len(args)))
             typesafe_kwargs = {k: kwargs[k](inner_kwargs[k]) for k in kwargs}
             return fun(*typesafe_args, **typesafe_kwargs)
@@ -393,193 +1481,310 @@ def _typedef(args, kwargs, ctx=None):
             'args': args,
             'kwargs': kwargs
         }
+        f.sampler = sampler
 
         return f
 
     return wrapper
 
 
-def function(*args, **kwargs):
-    name = 'Function({})'.format(', '.join(
+class _Function(Combinator):
+    __slots__ = ('pycomb_ctx', 'pycomb_sampler')
+
+    def with_context(self, new_ctx):
+        self.pycomb_ctx = new_ctx
+        return self
+
+    def with_sampling(self, sample, adaptive=False):
+        self.pycomb_sampler = sampling.create(sample, adaptive=adaptive)
+        return self
+
+
+def _function_name(meta):
+    args, kwargs = meta['args'], meta['kwargs']
+    return 'Function({})'.format(', '.join(
         _orig_list(map(lambda k: '{}'.format(get_type_name(k)), args)) +
         _orig_list(map(lambda k: '{}={}'.format(k, get_type_name(kwargs[k])), kwargs))))
 
-    def _function(x, ctx=None):
+
+def function(*args, **kwargs):
+    def _validate(x, ctx=None):
         new_ctx = context.create(base_ctx=_function.pycomb_ctx or ctx)
         if new_ctx.production_mode:
             return x
 
-        new_ctx.append(name)
+        new_ctx.append(meta['name'])
         new_ctx.validating_value = x
-        assert_type(_function.is_type(x), ctx=new_ctx, expected=name, found_type=type(x))
+        assert_type(_function.is_type(x), ctx=new_ctx, expected=meta['name'], found_type=type(x))
 
-        return x if '__pycomb__meta__' in dir(x) else _typedef(args, kwargs, ctx=new_ctx)(x)
+        return x if '__pycomb__meta__' in dir(x) else \
+            _typedef(args, kwargs, ctx=new_ctx, sampler=_function.pycomb_sampler)(x)
 
-    _function.is_type = lambda d: callable(d)
-    _function.meta = {
-        'name': name,
-        'args': args,
-        'kwargs': kwargs
-    }
-    _function.pycomb_ctx = None
+    meta = Meta(
+        {'kind': 'function', 'args': args, 'kwargs': kwargs},
+        None, _function_name)
     # TODO I should declare a function based on the combinators.
-    _function.example = lambda *a, **kw: None
-
-    def with_context(new_ctx):
-        _function.pycomb_ctx = new_ctx
-        return _function
-
-    _function.with_context = with_context
+    _function = _Function(_validate, lambda d: callable(d), meta, lambda *a, **kw: None)
+    _function.pycomb_ctx = None
+    _function.pycomb_sampler = None
     return _function
 
 
 Number = union(Int, Float, name='Number')
 
 
-def generic_object(fields_combinators: dict, object_type, example=None, name=None):
+def _object_example(combinator):
+    try:
+        result = combinator.meta['object_type']()
+        for field_name, field_combinator in combinator.meta['fields'].items():
+            setattr(result, field_name, field_combinator.example)
+    except:
+        result = None
+    return result
+
+
+class _GenericObject(Combinator):
+    __slots__ = ('validate_all',)
+
+
+def _attributes_getter(names):
+    """
+    Returns a function that reads all the attributes ``names`` of an object, as a tuple.
+    Missing attributes raise AttributeError, as getattr does.
+    """
+    if len(names) == 1:
+        single = operator.attrgetter(names[0])
+        return lambda x: (single(x),)
+    return operator.attrgetter(*names) if names else lambda x: ()
+
+
+def generic_object(fields_combinators: dict, object_type, example=None, name=None, trusted=False):
+    """
+    Validates the attributes of the instances of ``object_type``, subclasses and proxies that
+    claim it as their ``__class__`` included.
+    """
     name = name or object_type.__name__
+    fields = tuple(fields_combinators)
+    read_fields = _attributes_getter(fields)
+    subclasses = {}
+
+    def _accepts(x):
+        # issubclass is cached by type, the __class__ of proxies is checked by isinstance.
+        t = type(x)
+        result = subclasses.get(t)
+        if result is None:
+            result = subclasses[t] = issubclass(t, object_type)
+        return result or isinstance(x, object_type)
+
+    def _is_valid(x):
+        if not _accepts(x):
+            return False
+        for combinator, value in zip(fields_combinators.values(), read_fields(x)):
+            if not combinator.is_type(value):
+                return False
+        return True
+
+    def _validate(x, ctx=None):
+        if trusted and trust.registry.is_trusted(x, _object):
+            return x
 
-    def _object(x, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_object, x, new_ctx)
+
+        # Valid objects need no context per field. Limited contexts count every nested item.
+        if new_ctx.limits is None and _is_valid(x):
+            if trusted:
+                trust.registry.mark(x, _object)
+            return x
 
         if new_ctx.empty:
             new_ctx.append(name)
         new_ctx.validating_value = x
-        assert_type(type(x) == object_type, ctx=new_ctx, expected=name, found_type=type(x))
-
-        for field in fields_combinators:
-            cur_field_combinator = fields_combinators[field]
+        error_count = new_ctx.error_count
+        assert_type(_accepts(x), ctx=new_ctx, expected=name, found_type=type(x))
+        if new_ctx.limits is not None:
+            new_ctx.enter(len(fields))
 
+        for field, value in zip(fields, read_fields(x)):
             field_new_ctx = context.create(new_ctx)
             field_new_ctx.append(field)
-            cur_field_combinator(getattr(x, field), ctx=field_new_ctx)
+            fields_combinators[field](value, ctx=field_new_ctx)
 
+        if trusted and new_ctx.error_count == error_count:
+            trust.registry.mark(x, _object)
         return x
 
-    def _is_type(d):
-        return type(d) == object_type and \
-                               all(fields_combinators[k].is_type(getattr(d, k)) for k in fields_combinators)
+    def _validate_all(objects, ctx=None):
+        """
+        Validates an iterable of objects, e.g. the rows of a query, and returns them
+        (as a list if they have no length). Errors are reported as Name[index].field.
+        """
+        items = objects if hasattr(objects, '__len__') else _orig_list(objects)
+        new_ctx = context.create(ctx)
+        if new_ctx.production_mode:
+            return items
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_validate_all, items, new_ctx)
 
-    def _build_example():
-        try:
-            result = object_type()
-            for field_name, field_combinator in fields_combinators.items():
-                setattr(result, field_name, field_combinator.example)
-        except:
-            result = None
-        return result
+        if new_ctx.empty:
+            new_ctx.append(name)
+        new_ctx.validating_value = items
+        if new_ctx.limits is not None:
+            new_ctx.enter(len(items))
+        fast = new_ctx.limits is None
+        for i, x in enumerate(items):
+            if fast and _is_valid(x) and not trusted:
+                continue
+            item_ctx = context.create(new_ctx)
+            item_ctx.append('[{}]'.format(i), separator='')
+            _validate(x, ctx=item_ctx)
+        return items
 
-    _object.is_type = _is_type
-    _object.example = example or _build_example()
-    _object.meta = {
-        'name': name
-    }
+    def _is_type(d):
+        if trusted and trust.registry.is_trusted(d, _object):
+            return True
+        return _is_valid(d)
 
+    meta = Meta({'kind': 'object', 'fields': fields_combinators, 'object_type': object_type}, name)
+    _object = _GenericObject(_validate, _is_type, meta, example or None, None if example else _object_example)
+    _object.validate_all = _validate_all
     return _object
 
 
-def regexp_group(pattern: str, *combinators, example=None, name=None):
+def regexp_group(pattern, *combinators, example=None, name=None):
+    """
+    Matches a str pattern against str values, or a bytes pattern against bytes, bytearray and
+    memoryview values, without decoding them. The groups are validated by ``combinators``: they are
+    slices of the value, memoryview slices of a memoryview.
+    """
     name = name or 'RegexpGroup({})'.format(pattern)
-    if not pattern or not isinstance(pattern, str):
+    if not pattern or not isinstance(pattern, (str, bytes)):
         raise ValueError
 
-    pattern = '^' + pattern if pattern[0] != '^' else pattern
-    pattern = pattern + '$' if pattern[-1] != '$' else pattern
+    if isinstance(pattern, str):
+        caret, dollar, value_types = '^', '$', str
+    else:
+        caret, dollar, value_types = b'^', b'$', (bytes, bytearray, memoryview)
+    pattern = caret + pattern if pattern[:1] != caret else pattern
+    pattern = pattern + dollar if pattern[-1:] != dollar else pattern
     pattern = re.compile(pattern)
     if pattern.groups != len(combinators):
         raise ValueError
+    # The groups handed over by the union that has just chosen this branch, until validate
+    # consumes them. is_type keeps nothing: the value would stay alive after the call.
+    last = [(None, None)]
+
+    def _match(value):
+        cached = last[0]
+        if cached[0] is value:
+            return cached[1]
+        matcher = pattern.match(value)
+        return None if matcher is None else _regexp_groups(value, matcher, 1, len(combinators))
 
-    def _regexp_group(value, ctx=None):
+    def _remember(value, groups):
+        # Mutable values may have changed since their last match.
+        if type(value) in (str, bytes):
+            last[0] = (value, groups)
+
+    def _validate(value, ctx=None):
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return value
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_regexp_group, value, new_ctx)
 
         if new_ctx.empty:
             new_ctx.append(name)
 
         new_ctx.validating_value = value
-        if not isinstance(value, str):
-            assert_type(False, ctx=new_ctx, expected=name, found_type=type(value))
-        matcher = pattern.match(value)
-        if not matcher:
+        groups = _match(value) if isinstance(value, value_types) else None
+        # The match is consumed: the cache must not keep a large value alive.
+        last[0] = (None, None)
+        if groups is None:
             assert_type(False, ctx=new_ctx, expected=name, found_type=type(value))
-        idx = 0
-        for x in zip(combinators, matcher.groups()):
+            return value
+        for idx, (combinator, group) in enumerate(zip(combinators, groups)):
             sub_ctx = context.create(new_ctx)
             sub_ctx.append('[{}]'.format(idx), separator='')
-            combinator = x[0]
-            group = x[1]
             combinator(group, ctx=sub_ctx)
-            idx += 1
         return value
 
     def _is_type(d):
-        if not isinstance(d, str):
-            return False
-        matcher = pattern.match(d)
-        if not matcher:
+        if not isinstance(d, value_types):
             return False
-        groups = matcher.groups()
+        groups = _match(d)
+        return groups is not None and _groups_valid(combinators, groups)
 
-        return all(
-            (x[0].is_type(x[1]) for x in zip(combinators, groups))
-        )
+    meta = Meta({'kind': 'regexp_group', 'pattern': pattern, 'combinators': combinators}, name)
+    _regexp_group = _RegexpGroup(_validate, _is_type, meta, example)
+    _regexp_group.remember = _remember
+    return _regexp_group
 
-    _regexp_group.is_type = _is_type
 
-    _regexp_group.meta = {
-        'name': name
-    }
-    _regexp_group.example = example
-    return _regexp_group
+def _dictionary_name(meta):
+    return 'dictionary({}: {})'.format(meta['key'].meta['name'], meta['value'].meta['name'])
+
 
+def _dictionary_example(combinator):
+    try:
+        result = {combinator.meta['key'].example: combinator.meta['value'].example}
+    except:
+        result = None
+    return result
 
-def dictionary(key_combinator, value_combinator, example=None, name=None):
-    name = name or 'dictionary({}: {})'.format(key_combinator.meta['name'], value_combinator.meta['name'])
 
-    def _dictionary(x, ctx=None):
+def dictionary(key_combinator, value_combinator, example=None, name=None, trusted=False, lazy=False):
+    def _validate(x, ctx=None):
+        if trusted and trust.registry.is_trusted(x, _dictionary):
+            return x
+
         new_ctx = context.create(ctx)
         if new_ctx.production_mode:
             return x
+        if new_ctx.shadow:
+            return new_ctx.shadow.submit(_dictionary, x, new_ctx)
 
         if new_ctx.empty:
-            new_ctx.append(name)
+            new_ctx.append(meta['name'])
 
         new_ctx.validating_value = x
         is_type = hasattr(x, '__getitem__') and hasattr(x, 'items') and callable(x.items)
-        assert_type(is_type, ctx=new_ctx, expected=name, found_type=type(x))
+        assert_type(is_type, ctx=new_ctx, expected=meta['name'], found_type=type(x))
 
         # Cannot proceed, this has no '[]' access.
         if not is_type:
             return x
-
-        for k, v in x.items():
+        if new_ctx.limits is not None:
+            new_ctx.enter(0 if lazy else len(x))
+        if lazy:
+            return lazy_views.LazyDictionary(_dictionary, x, new_ctx)
+
+        error_count = new_ctx.error_count
+        checks_deadline = _has_deadline(new_ctx)
+        for i, (k, v) in enumerate(x.items()):
             field_new_ctx_key = context.create(new_ctx)
             field_new_ctx_value = context.create(new_ctx)
             field_new_ctx_key.append(k)
             field_new_ctx_value.append('[{}]'.format(k), separator='')
+            if checks_deadline and i and not i % context.DEADLINE_INTERVAL:
+                field_new_ctx_value.check_deadline()
             key_combinator(k, ctx=field_new_ctx_key)
             value_combinator(v, ctx=field_new_ctx_value)
 
+        if trusted and new_ctx.error_count == error_count:
+            trust.registry.mark(x, _dictionary)
         return x
 
     def _is_type(d):
+        if trusted and trust.registry.is_trusted(d, _dictionary):
+            return True
         return hasattr(d, '__getitem__') and hasattr(d, 'items') and callable(d.items) and \
                all(key_combinator.is_type(k) and value_combinator.is_type(v) for k, v in d.items())
 
-    def _build_example():
-        try:
-            result = {key_combinator.example: value_combinator.example}
-        except:
-            result = None
-        return result
-
-    _dictionary.is_type = _is_type
-    _dictionary.example = example or _build_example()
-    _dictionary.meta = {
-        'name': name
-    }
-
+    meta = Meta({'kind': 'dictionary', 'key': key_combinator, 'value': value_combinator}, name, _dictionary_name)
+    _dictionary = Combinator(
+        _validate, _is_type, meta, example or None, None if example else _dictionary_example)
     return _dictionary
@@ -1,4 +1,6 @@
 import abc
+import time
+
 from pycomb import exceptions
 
 
@@ -19,9 +21,33 @@ class ValidationErrorObservable(metaclass=abc.ABCMeta):
 
 
 class ValidationContext(ValidationErrorObservable, metaclass=abc.ABCMeta):
+    # The pycomb.shadow.ShadowValidator that validates on behalf of this context, if any.
+    shadow = None
+    # How containers are returned: None to build new ones, PASSTHROUGH to return the
+    # validated object itself unless some of its items have been converted.
+    output = None
+    # The limits of the validation cost, see create().
+    limits = None
+    # Whether the tuples built by list and sequence are recorded in pycomb.trust.registry.
+    trust = False
+
     def __init__(self):
         self.validating_value = None
 
+    def enter(self, items=0, depth=1):
+        """
+        Called by the container combinators before validating ``items`` nested values,
+        ``depth`` levels below the current one, when the context has ``limits``.
+        """
+        pass
+
+    def check_deadline(self):
+        """
+        Called by the container combinators every ``DEADLINE_INTERVAL`` nested values, when the
+        context has a deadline.
+        """
+        pass
+
     @abc.abstractmethod
     def append(self, path_element):
         pass  # pragma: no cover
@@ -41,18 +67,58 @@ class ValidationContext(ValidationErrorObservable, metaclass=abc.ABCMeta):
         pass  # pragma: no cover
 
 
+PASSTHROUGH = 'passthrough'
+
+# The number of items validated by a container between two checks of the deadline.
+DEADLINE_INTERVAL = 1000
+
+
+_new_context = object.__new__
+
+
+class _Limits:
+    def __init__(self, max_items, max_depth, deadline):
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.deadline = None if deadline is None else time.monotonic() + deadline
+        self.items = 0
+        # The items counted at the last check of the deadline.
+        self.checked = 0
+
+
 class ValidationContextImpl(ValidationContext):
-    def __init__(self, production_mode):
-        self._path = []
-        self._path_str = None
-        self._error_observers = []
-        self._production_mode = production_mode
+    # Every combinator copies its context: the attributes that keep their class default cost
+    # nothing to copy, and the path and the observers are tuples shared until they change.
+    _path = ()
+    _path_str = None
+    _error_observers = ()
+    _depth = 0
+    empty = True
+    production_mode = False
+
+    def __init__(self, production_mode, shadow=None, output=None, limits=None, trust=False):
+        if production_mode:
+            self.production_mode = production_mode
+        if shadow is not None:
+            self.shadow = shadow
+        if output is not None:
+            self.output = output
+        if trust:
+            self.trust = trust
+        # Shared by all the copies of a context, so that a combinator can tell whether
+        # its nested combinators reported any error.
+        self._error_count = [0]
+        # As for the error count, the limits are shared by all the copies; the depth is not.
+        if limits is not None:
+            self.limits = limits
 
     def append(self, path_element, separator='.'):
         self._path_str = None
         if self._path:
-            self._path.append(separator)
-        self._path.append(path_element)
+            self._path += (separator, path_element)
+        else:
+            self._path = (path_element,)
+            self.empty = False
 
     @property
     def path(self):
@@ -61,26 +127,65 @@ class ValidationContextImpl(ValidationContext):
         return self._path_str
 
     @property
-    def empty(self):
-        return not bool(self._path)
+    def path_parts(self):
+        """
+        The elements of the path, to be joined only when the path is needed.
+        """
+        return (self._path_str,) if self._path_str is not None else self._path
 
     def copy(self):
-        result = ValidationContextImpl(self.production_mode)
-        result._path = [x for x in self._path]
-        result._path_str = self._path_str
-        result._error_observers = [x for x in self._error_observers]
+        result = _new_context(ValidationContextImpl)
+        result.__dict__.update(self.__dict__)
         return result
 
-    def add_error_observer(self, error_observer):
-        self._error_observers.append(error_observer)
+    def trial(self):
+        """
+        Returns a copy that raises ``FAST_FAILURE`` at its first error, without counting it
+        among the errors of this context. The limits are still shared.
+        """
+        result = self.copy()
+        result._error_observers = (fast_failure_observer,)
+        result._error_count = [0]
+        return result
+
+    def enter(self, items=0, depth=1):
+        limits = self.limits
+        if limits is None:
+            return
+        self._depth += depth
+        limits.items += items
+        if limits.max_depth is not None and self._depth > limits.max_depth:
+            self._limit_exceeded('max_depth', limits.max_depth)
+        if limits.max_items is not None and limits.items > limits.max_items:
+            self._limit_exceeded('max_items', limits.max_items)
+        if limits.deadline is not None and time.monotonic() > limits.deadline:
+            self._limit_exceeded('deadline', None)
+
+    def check_deadline(self):
+        limits = self.limits
+        if limits is not None and limits.deadline is not None and time.monotonic() > limits.deadline:
+            self._limit_exceeded('deadline', None)
+
+    def _limit_exceeded(self, limit, value):
+        raise exceptions.PyCombLimitExceeded(
+            _generate_error_message(self, msg='{} exceeded'.format(
+                limit if value is None else '{} ({})'.format(limit, value))),
+            limit=limit, path=self.path)
+
+    def add_error_observer(self, error_observer, first=False):
+        if first:
+            self._error_observers = (error_observer,) + self._error_observers
+        else:
+            self._error_observers += (error_observer,)
 
     def notify_error(self, expected_type, found_type):
+        self._error_count[0] += 1
         for l in self._error_observers:
             l.on_error(self, expected_type, found_type)
 
     @property
-    def production_mode(self):
-        return self._production_mode
+    def error_count(self):
+        return self._error_count[0]
 
 
 def _generate_error_message(ctx, expected=None, found_type=None, msg=None):
@@ -92,16 +197,44 @@ def _generate_error_message(ctx, expected=None, found_type=None, msg=None):
 class _DefaultValidationErrorObserver(ValidationErrorObserver):
     def on_error(self, ctx, expected_type, found_type):
         found_type = found_type if type(found_type) is str else found_type.__name__
-        raise exceptions.PyCombValidationError(
-            _generate_error_message(ctx, expected_type, found_type),
-            expected_type=expected_type, found_type=found_type)
+        # The message is formatted only if somebody reads it.
+        path = ctx.path_parts if hasattr(ctx, 'path_parts') else (ctx.path,)
+        raise exceptions.PyCombValidationError(expected_type=expected_type, found_type=found_type, path=path)
 
 _default_validation_error_observer = _DefaultValidationErrorObserver()
 
 
+class _FastFailureObserver(ValidationErrorObserver):
+    def on_error(self, ctx, expected_type, found_type):
+        raise exceptions.FAST_FAILURE.with_traceback(None)
+
+# Raises the same exception, with no message, on every error: for callers that only need pass/fail.
+fast_failure_observer = _FastFailureObserver()
+
+
 def create(base_ctx=None, validation_error_observer=_default_validation_error_observer,
-           production_mode=False):
-    result = base_ctx.copy() if base_ctx else ValidationContextImpl(production_mode)
-    if not base_ctx:
-        result.add_error_observer(validation_error_observer)
+           production_mode=False, shadow=None, output=None, max_items=None, max_depth=None, deadline=None,
+           trust=False):
+    """
+    Creates a validation context, or a copy of ``base_ctx``.
+
+    ``max_items`` bounds the total number of items of the validated containers, ``max_depth``
+    their nesting and ``deadline`` the seconds spent validating, starting from now.
+    When one of them is exceeded, ``PyCombLimitExceeded`` is raised whatever the error observer.
+
+    With ``trust`` the tuples returned by ``list`` and ``sequence`` are recorded in
+    ``pycomb.trust.registry``, and accepted at once when they are validated again.
+    """
+    if base_ctx:
+        return base_ctx.copy()
+    limits = None
+    if max_items is not None or max_depth is not None or deadline is not None:
+        limits = _Limits(max_items, max_depth, deadline)
+    if production_mode or shadow is not None or output is not None or limits is not None or trust:
+        result = ValidationContextImpl(production_mode, shadow, output, limits, trust)
+    else:
+        # The common case, without the constructor call.
+        result = _new_context(ValidationContextImpl)
+        result._error_count = [0]
+    result._error_observers = (validation_error_observer,)
     return result
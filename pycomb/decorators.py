@@ -1,12 +1,23 @@
-from pycomb import context
+from pycomb import context, sampling
 
 
-def returning(combinator, ctx=None):
+def returning(combinator, ctx=None, sample=None, adaptive=False):
+    sampler = sampling.create(sample, adaptive=adaptive)
+
     def wrapper(fun):
         def f(*inner_args, **inner_kwargs):
             result = fun(*inner_args, **inner_kwargs)
 
+            if sampler:
+                if not sampler.should_validate():
+                    return result
+                # Validated calls return the result as it is, as the skipped calls do.
+                combinator(result, ctx=sampler.context(ctx))
+                return result
+
             return combinator(result, ctx=ctx or context.create())
+
+        f.sampler = sampler
         return f
 
     return wrapper
@@ -1,4 +1,5 @@
 String = 'Lorem 1p$um'
+Bytes = b'Lorem 1p$um'
 Int = -11235
 Float = -0.12345
 Boolean = True
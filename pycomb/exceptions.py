@@ -1,5 +1,45 @@
 class PyCombValidationError(Exception):
-    def __init__(self, *a, expected_type=None, found_type=None, **kw):
+    """
+    A validation error. When raised by the default error observer the message is built
+    from ``path``, ``expected_type`` and ``found_type`` only when it is read.
+    """
+    def __init__(self, *a, expected_type=None, found_type=None, path=None, **kw):
         self.expected_type = expected_type
         self.found_type = found_type
+        self._path = path
+        self._args = a
         Exception.__init__(self, *a, **kw)
+
+    @property
+    def path(self):
+        return ''.join(self._path) if self._path is not None else None
+
+    @property
+    def args(self):
+        if not self._args and self._path is not None:
+            self._args = ('Error on {}: expected {} but was {}'.format(
+                self.path, self.expected_type, self.found_type),)
+        return self._args
+
+    @args.setter
+    def args(self, value):
+        self._args = tuple(value)
+
+    def __str__(self):
+        args = self.args
+        if not args:
+            return ''
+        return str(args[0]) if len(args) == 1 else str(args)
+
+    def __reduce__(self):
+        return self.__class__, self.args, self.__dict__
+
+
+class PyCombLimitExceeded(PyCombValidationError):
+    def __init__(self, *a, limit=None, **kw):
+        self.limit = limit
+        PyCombValidationError.__init__(self, *a, **kw)
+
+
+# Raised over and over by context.fast_failure_observer: it has no message to format.
+FAST_FAILURE = PyCombValidationError('Validation failed')
@@ -0,0 +1,84 @@
+"""
+Hash-consed combinators: the factories of this module return the same combinator when called
+with equal arguments, as long as somebody still uses it.
+
+Combinators given as arguments are compared by identity, so building a schema out of interned
+combinators only shares whole subtrees that are built from the same interned parts:
+
+    from pycomb import interning as ic
+    ic.list(ic.maybe(ic.Int)) is ic.list(ic.maybe(ic.Int))  # True
+
+Interned combinators are shared: their ``meta`` must not be changed.
+"""
+import threading
+import weakref
+from functools import wraps
+
+from pycomb import combinators as c
+
+_interned = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+def _key(value):
+    if callable(value):
+        return value
+    if isinstance(value, dict):
+        return dict, tuple((_key(k), _key(v)) for k, v in value.items())
+    if isinstance(value, (tuple, frozenset)) or type(value) is type([]):
+        return type(value), tuple(_key(x) for x in value)
+    # The type tells 1 from True and 1.0.
+    return type(value), value
+
+
+def interned(factory):
+    """
+    Wraps a combinator factory so that it returns a canonical combinator for equal arguments.
+    Arguments that cannot be hashed build a new combinator, as the factory would.
+    """
+    @wraps(factory)
+    def _factory(*args, **kwargs):
+        key = (factory, _key(args), _key(dict(sorted(kwargs.items()))))
+        try:
+            result = _interned.get(key)
+        except TypeError:
+            return factory(*args, **kwargs)
+        if result is not None:
+            return result
+
+        result = factory(*args, **kwargs)
+        with _lock:
+            return _interned.setdefault(key, result)
+
+    return _factory
+
+
+def size():
+    """
+    Returns the number of interned combinators still alive.
+    """
+    return len(_interned)
+
+
+Int = c.Int
+Float = c.Float
+String = c.String
+Boolean = c.Boolean
+Number = c.Number
+
+irreducible = interned(c.irreducible)
+constant = interned(c.constant)
+list = interned(c.list)
+sequence = interned(c.sequence)
+struct = interned(c.struct)
+maybe = interned(c.maybe)
+union = interned(c.union)
+tagged_union = interned(c.tagged_union)
+intersection = interned(c.intersection)
+subtype = interned(c.subtype)
+enum = interned(c.enum)
+enum.of = interned(c.enum.of)
+dictionary = interned(c.dictionary)
+generic_object = interned(c.generic_object)
+regexp_group = interned(c.regexp_group)
+record = interned(c.record)
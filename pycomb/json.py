@@ -0,0 +1,446 @@
+"""
+Schema-aware JSON decoding.
+
+``loads(combinator, data)`` returns the same value as ``combinator(json.loads(data))``,
+but validation happens while the document is parsed: structs, lists, sequences,
+maybes and dictionaries are decoded by following the combinator tree, the
+scalar values and the arrays of scalars are decoded by the C scanner of the
+standard library and checked as soon as they are read. The first error is
+reported before the rest of the document is decoded. Errors are reported at the same paths, but for the
+objects and arrays of a maybe: their first invalid nested value is reported, not
+the ``None or ...`` error of the maybe itself.
+Any other combinator receives the decoded JSON value of its subtree.
+
+``dumps(combinator, value)`` is the other way round: it encodes a value that
+has already been validated by ``combinator`` with the C encoder of the standard
+library. Only the parts of the tree it cannot encode by itself, such as enums
+and generic objects, are converted first, by a function generated from the
+combinator tree.
+"""
+import array
+import json as _json
+import weakref
+from json import decoder as _decoder
+
+from pycomb import context, predicates as p, trust, vocabulary
+from pycomb.combinators import assert_type, _struct_field, _to_array
+
+JSONDecodeError = _json.JSONDecodeError
+
+_scan_once = _json.JSONDecoder().scan_once
+_scanstring = _decoder.scanstring
+_ws = _decoder.WHITESPACE.match
+
+_LEAF_KINDS = ('irreducible', 'enum', 'maybe')
+
+
+def _is_leaf(combinator):
+    kind = combinator.meta.get('kind')
+    if kind == 'maybe':
+        return _is_leaf(combinator.meta['combinator'])
+    return kind in ('irreducible', 'enum')
+
+
+def _leaf_result(combinator, value):
+    kind = combinator.meta.get('kind')
+    if kind == 'enum':
+        return combinator.meta['values'][value]
+    if kind == 'maybe':
+        return _leaf_result(combinator.meta['combinator'], value) if value else None
+    return value
+
+
+class _Decoder:
+    def __init__(self, s, ctx):
+        self.s = s
+        self.ctx = ctx
+        self.path = []
+        self.limits = ctx.limits
+        self.depth = 0
+
+    def decode(self, combinator):
+        result, end = self.value(combinator, _ws(self.s, 0).end())
+        end = _ws(self.s, end).end()
+        if end != len(self.s):
+            raise JSONDecodeError('Extra data', self.s, end)
+        return result
+
+    def value(self, combinator, idx):
+        kind = combinator.meta.get('kind')
+        if kind == 'struct':
+            return self.struct(combinator, idx)
+        if kind in ('list', 'sequence'):
+            return self.list(combinator, idx)
+        if kind == 'dictionary':
+            return self.dictionary(combinator, idx)
+        if kind == 'maybe' and combinator.meta['combinator'].meta.get('kind') not in _LEAF_KINDS:
+            return self.maybe(combinator, idx)
+
+        value, end = self.scan(idx)
+        if kind in _LEAF_KINDS and combinator.is_type(value):
+            return _leaf_result(combinator, value), end
+        return combinator(value, ctx=self.current_ctx()), end
+
+    def struct(self, combinator, idx):
+        s = self.s
+        if s[idx:idx + 1] != '{':
+            return self.fallback(combinator, idx)
+
+        meta = combinator.meta
+        fields, strict = meta['fields'], meta['strict']
+        entered = self.enter(meta['name'])
+        if self.limits is not None:
+            self.charge(self.limits, len(fields))
+        result = {}
+        idx = _ws(s, idx + 1).end()
+        if s[idx:idx + 1] == '}':
+            idx += 1
+        else:
+            while True:
+                key, idx = self.key(idx)
+                field = fields.get(key)
+                if field is None:
+                    if strict:
+                        assert_type(False, ctx=self.current_ctx(), expected=meta['name'], found_type=dict)
+                    _, idx = self.scan(idx)
+                else:
+                    self.path.append((key, None))
+                    result[key], idx = self.value(field, idx)
+                    self.path.pop()
+                idx, done = self.next_item(idx, '}')
+                if done:
+                    break
+
+        for k, field in fields.items():
+            if k not in result:
+                self.path.append((k, None))
+                result[k] = field(None, ctx=self.current_ctx())
+                self.path.pop()
+        self.leave(entered)
+        return p.StructType({k: result[k] for k in fields}), idx
+
+    def list(self, combinator, idx):
+        s = self.s
+        if s[idx:idx + 1] != '[':
+            return self.fallback(combinator, idx)
+
+        element = combinator.meta['element']
+        if self.limits is None and _is_leaf(element):
+            # The C scanner decodes the whole array, and list checks its items in bulk.
+            return self.fallback(combinator, idx)
+
+        entered = self.enter(combinator.meta['name'])
+        limits = self.limits
+        error_count = self.ctx.error_count
+        result = []
+        idx = _ws(s, idx + 1).end()
+        if s[idx:idx + 1] == ']':
+            idx += 1
+        else:
+            while True:
+                self.path.append((len(result), None))
+                if limits is not None:
+                    self.charge(limits)
+                value, idx = self.value(element, idx)
+                result.append(value)
+                self.path.pop()
+                idx, done = self.next_item(idx, ']')
+                if done:
+                    break
+        typecode = combinator.meta.get('typecode')
+        if typecode and self.ctx.error_count == error_count:
+            # As list does, integers out of the range of the typecode are reported.
+            result = _to_array(result, typecode, ctx=self.current_ctx(), expected=combinator.meta['name'])
+            self.leave(entered)
+            return result, idx
+        self.leave(entered)
+        if not result:
+            return None, idx
+        result = tuple(result)
+        if self.ctx.trust and self.ctx.error_count == error_count:
+            trust.registry.mark(result, combinator)
+        return result, idx
+
+    def dictionary(self, combinator, idx):
+        s = self.s
+        if s[idx:idx + 1] != '{':
+            return self.fallback(combinator, idx)
+
+        meta = combinator.meta
+        key_combinator, value_combinator = meta['key'], meta['value']
+        entered = self.enter(meta['name'])
+        limits = self.limits
+        result = {}
+        idx = _ws(s, idx + 1).end()
+        if s[idx:idx + 1] == '}':
+            idx += 1
+        else:
+            while True:
+                key, idx = self.key(idx)
+                if limits is not None:
+                    self.path.append((key, None))
+                    self.charge(limits)
+                    self.path.pop()
+                if not key_combinator.is_type(key):
+                    self.path.append((key, '.'))
+                    key_combinator(key, ctx=self.current_ctx())
+                    self.path.pop()
+                value, idx = self.scan(idx)
+                if not value_combinator.is_type(value):
+                    self.path.append((key, None))
+                    value_combinator(value, ctx=self.current_ctx())
+                    self.path.pop()
+                result[key] = value
+                idx, done = self.next_item(idx, '}')
+                if done:
+                    break
+        self.leave(entered)
+        return result, idx
+
+    def maybe(self, combinator, idx):
+        s = self.s
+        if s.startswith('null', idx):
+            return None, idx + 4
+        k = _ws(s, idx + 1).end()
+        empty = s[k:k + 1] in ('}', ']')
+        if s[idx:idx + 1] not in ('{', '[') or empty:
+            return self.fallback(combinator, idx)
+
+        self.path.append((combinator.meta['name'], '.'))
+        result = self.value(combinator.meta['combinator'], idx)
+        self.path.pop()
+        return result
+
+    def fallback(self, combinator, idx):
+        value, end = self.scan(idx)
+        return combinator(value, ctx=self.current_ctx()), end
+
+    def scan(self, idx):
+        try:
+            value, end = _scan_once(self.s, idx)
+        except StopIteration as err:
+            raise JSONDecodeError('Expecting value', self.s, err.value) from None
+        return value, _ws(self.s, end).end()
+
+    def key(self, idx):
+        s = self.s
+        if s[idx:idx + 1] != '"':
+            raise JSONDecodeError('Expecting property name enclosed in double quotes', s, idx)
+        key, idx = _scanstring(s, idx + 1)
+        idx = _ws(s, idx).end()
+        if s[idx:idx + 1] != ':':
+            raise JSONDecodeError("Expecting ':' delimiter", s, idx)
+        return key, _ws(s, idx + 1).end()
+
+    def next_item(self, idx, terminator):
+        """
+        Returns the index of the next item, or the index after the terminator and True.
+        """
+        s = self.s
+        idx = _ws(s, idx).end()
+        c = s[idx:idx + 1]
+        if c == terminator:
+            return idx + 1, True
+        if c != ',':
+            raise JSONDecodeError("Expecting ',' delimiter", s, idx)
+        return _ws(s, idx + 1).end(), False
+
+    def enter(self, name):
+        self.depth += 1
+        entered = not self.path and self.ctx.empty
+        if entered:
+            self.path.append((name, '.'))
+        if self.limits is not None:
+            self.current_ctx().enter(0, depth=self.depth)
+        return entered
+
+    def leave(self, entered):
+        self.depth -= 1
+        if entered:
+            self.path.pop()
+
+    def charge(self, limits, items=1):
+        limits.items += items
+        if limits.max_items is not None and limits.items > limits.max_items:
+            # Raises the error with the current path.
+            self.current_ctx().enter(0, depth=0)
+        if limits.deadline is not None and limits.items - limits.checked >= context.DEADLINE_INTERVAL:
+            limits.checked = limits.items
+            self.current_ctx().check_deadline()
+
+    def current_ctx(self):
+        result = context.create(self.ctx)
+        for path_element, separator in self.path:
+            if separator is None:
+                # Item of a container, formatted only when needed.
+                result.append('[{}]'.format(path_element), separator='')
+            else:
+                result.append(path_element, separator=separator)
+        return result
+
+
+def loads(combinator, data, ctx=None):
+    """
+    Decodes the JSON document ``data`` (str, bytes or bytearray) validating it against ``combinator``.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode(_json.detect_encoding(data), 'surrogatepass')
+    ctx = context.create(ctx)
+    if ctx.production_mode or ctx.shadow:
+        return combinator(_json.loads(data), ctx=ctx)
+
+    return _Decoder(data, ctx).decode(combinator)
+
+
+def _default(o):
+    if isinstance(o, p.StructType):
+        return o.__dict__['x']
+    if isinstance(o, array.array):
+        return o.tolist()
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(o).__name__))
+
+
+class _PrepareCompiler:
+    """
+    Compiles, for the parts of a combinator tree the C encoder cannot encode by itself, a function
+    that returns the JSON-ready value: enum keys in place of their values, attributes of generic
+    objects, empty lists in place of None. The compiled function is None where the value is
+    encoded as it is, so that a tree without such parts is left entirely to the C encoder.
+    """
+    def compile(self, combinator):
+        meta = getattr(combinator, 'meta', {})
+        kind = meta.get('kind')
+        if kind in ('list', 'sequence'):
+            return self.list(self.compile(meta['element']))
+        if kind == 'struct':
+            return self.struct(meta['fields'])
+        if kind == 'object':
+            return self.object(meta['fields'])
+        if kind == 'maybe':
+            return self.field(meta['combinator'])
+        if kind == 'subtype':
+            return self.compile(meta['combinator'])
+        if kind == 'enum':
+            return self.enum(meta['values'])
+        if kind == 'dictionary':
+            return self.dictionary(self.compile(meta['value']))
+        if kind == 'tagged_union':
+            return self.tagged_union(meta['tag'], {k: self.compile(v) for k, v in meta['combinators'].items()})
+        return None
+
+    def field(self, combinator):
+        """
+        Compiles a value that may be None, encoded as null.
+        """
+        meta = getattr(combinator, 'meta', {})
+        if meta.get('kind') in ('list', 'sequence'):
+            prepare = self.compile(meta['element'])
+            return None if prepare is None else self.maybe(lambda value: [prepare(x) for x in value])
+        return self.maybe(self.compile(combinator))
+
+    @staticmethod
+    def maybe(prepare):
+        if prepare is None:
+            return None
+        return lambda value: None if value is None else prepare(value)
+
+    @staticmethod
+    def list(prepare):
+        # Empty lists are validated as None.
+        if prepare is None:
+            return lambda value: () if value is None else value
+        return lambda value: () if value is None else [prepare(x) for x in value]
+
+    def struct(self, fields):
+        prepared = tuple((k, prepare) for k, prepare in ((k, self.field(v)) for k, v in fields.items())
+                         if prepare is not None)
+        if not prepared:
+            return None
+
+        def prepare_struct(value):
+            result = dict(value.__dict__['x'] if type(value) is p.StructType else value)
+            for k, prepare in prepared:
+                result[k] = prepare(result.get(k))
+            return result
+        return prepare_struct
+
+    def object(self, fields):
+        prepared = tuple((k, self.field(v)) for k, v in fields.items())
+
+        def prepare_object(value):
+            result = {}
+            for k, prepare in prepared:
+                x = getattr(value, k)
+                result[k] = x if prepare is None else prepare(x)
+            return result
+        return prepare_object
+
+    @staticmethod
+    def enum(values):
+        if isinstance(values, vocabulary.Vocabulary):
+            # Each value is its own key.
+            return None
+        # The key of each value, built at the first encoding.
+        keys = []
+
+        def prepare_enum(value):
+            if not keys:
+                built = {}
+                try:
+                    for k in values:
+                        built.setdefault(values[k], k)
+                except TypeError:
+                    # Unhashable values, they can only be looked up by key.
+                    built = {}
+                keys.append(built)
+            try:
+                return keys[0].get(value, value)
+            except TypeError:
+                return value
+        return prepare_enum
+
+    @staticmethod
+    def dictionary(prepare):
+        if prepare is None:
+            return None
+        return lambda value: {k: prepare(x) for k, x in value.items()}
+
+    @staticmethod
+    def tagged_union(tag, branches):
+        if all(prepare is None for prepare in branches.values()):
+            return None
+
+        def prepare_tagged_union(value):
+            try:
+                prepare = branches.get(_struct_field(value, tag))
+            except TypeError:
+                return value
+            return value if prepare is None else prepare(value)
+        return prepare_tagged_union
+
+
+_prepares = weakref.WeakKeyDictionary()
+_json_encoders = {}
+
+
+def _get_prepare(combinator):
+    try:
+        return _prepares[combinator]
+    except KeyError:
+        prepare = _prepares[combinator] = _PrepareCompiler().compile(combinator)
+        return prepare
+
+
+def dumps(combinator, value, ensure_ascii=True, separators=(', ', ': ')):
+    """
+    Encodes ``value``, already validated by ``combinator``, as JSON.
+
+    Enums are encoded by key, so that ``loads`` gives back the same value.
+    """
+    options = (ensure_ascii, tuple(separators))
+    encode = _json_encoders.get(options)
+    if encode is None:
+        encode = _json_encoders[options] = _json.JSONEncoder(
+            ensure_ascii=ensure_ascii, separators=separators, default=_default).encode
+    prepare = _get_prepare(combinator)
+    return encode(value if prepare is None else prepare(value))
@@ -0,0 +1,95 @@
+"""
+Views that validate the items of a value when they are read for the first time.
+"""
+from collections import abc
+
+from pycomb import context
+
+_MISSING = object()
+
+
+class _Lazy:
+    def __init__(self, combinator, data, ctx):
+        self._combinator = combinator
+        self._data = data
+        self._ctx = ctx
+        self._cache = {}
+
+    def _validate(self, cache_key, combinator, value, path_element, separator=''):
+        result = self._cache.get(cache_key, _MISSING)
+        if result is _MISSING:
+            item_ctx = context.create(self._ctx)
+            item_ctx.append(path_element, separator=separator)
+            result = combinator(value, ctx=item_ctx)
+            self._cache[cache_key] = result
+        return result
+
+
+class LazyStruct(_Lazy, abc.Mapping):
+    """
+    The fields of a struct, validated when they are read.
+    """
+    def __getitem__(self, key):
+        field = self._combinator.meta['fields'].get(key)
+        if field is None:
+            return self._data[key]
+        return self._validate(key, field, self._data.get(key), '[{}]'.format(key))
+
+    def __getattr__(self, item):
+        if item.startswith('_'):
+            raise AttributeError(item)
+        try:
+            return self[item]
+        except KeyError:
+            raise AttributeError(item)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return 'LazyStruct({!r})'.format(self._data)
+
+
+class LazyDictionary(_Lazy, abc.Mapping):
+    """
+    A dictionary whose keys and values are validated when they are read.
+    """
+    def __getitem__(self, key):
+        meta = self._combinator.meta
+        value = self._data[key]
+        self._validate(('key', key), meta['key'], key, '{}'.format(key), separator='.')
+        return self._validate(('value', key), meta['value'], value, '[{}]'.format(key))
+
+    def __iter__(self):
+        key_combinator = self._combinator.meta['key']
+        for key in self._data.keys():
+            self._validate(('key', key), key_combinator, key, '{}'.format(key), separator='.')
+            yield key
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return 'LazyDictionary({} items)'.format(len(self._data))
+
+
+class LazySequence(_Lazy, abc.Sequence):
+    """
+    A sequence whose elements are validated when they are read.
+    """
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self._data))))
+        value = self._data[index]
+        if index < 0:
+            index += len(self._data)
+        return self._validate(index, self._combinator.meta['element'], value, '[{}]'.format(index))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return 'LazySequence({} elements)'.format(len(self._data))
@@ -0,0 +1,36 @@
+"""
+Memory used by schemas.
+"""
+import gc
+import sys
+import types
+
+# Shared by every combinator: never counted.
+_SHARED_TYPES = (type, types.ModuleType, types.CodeType, types.BuiltinFunctionType, types.MethodDescriptorType)
+
+
+def _referents(obj):
+    if type(obj) is types.FunctionType:
+        # The code, the globals and the names belong to the module that defines the function.
+        shared = (obj.__code__, obj.__globals__, obj.__builtins__, obj.__name__, obj.__qualname__, obj.__module__)
+        return [x for x in gc.get_referents(obj) if not any(x is y for y in shared)]
+    return gc.get_referents(obj)
+
+
+def sizeof(schema):
+    """
+    Returns the number of bytes used by a schema: its combinators, their metadata and closures,
+    and everything that they reference but classes, modules and code. Objects shared by several
+    combinators of the schema are counted once.
+    """
+    seen = set()
+    pending = [schema]
+    size = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        pending.extend(_referents(obj))
+    return size
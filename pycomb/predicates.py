@@ -14,6 +14,14 @@ def is_bool(x):
     return type(x) == bool
 
 
+def is_bytes(x):
+    return type(x) == bytes
+
+
+def is_byte_string(x):
+    return type(x) in (bytes, bytearray, memoryview)
+
+
 def is_list_of(d, combinator_element):
     return type(d) in (list, tuple) and all(combinator_element.is_type(element) for element in d)
 
@@ -0,0 +1,148 @@
+"""
+Views over fixed-layout binary records, as validated by ``combinators.record``.
+"""
+import re
+import struct
+
+_BYTE_ORDERS = '<>!='
+_FORMAT = re.compile(r'\s*(\d*)([xcbB?hHiIlLqQnNefdsp])')
+
+
+def parse_format(fmt):
+    """
+    Splits a struct format in its byte order and the formats of the single values.
+    """
+    byte_order = fmt[0] if fmt and fmt[0] in _BYTE_ORDERS + '@' else '<'
+    if byte_order == '@':
+        raise ValueError('Native alignment is not supported')
+    body = fmt[1:] if fmt and fmt[0] == byte_order else fmt
+
+    codes = []
+    pos = 0
+    for match in _FORMAT.finditer(body):
+        if match.start() != pos:
+            break
+        pos = match.end()
+        count, code = match.groups()
+        if code in 'sp':
+            codes.append(count + code)
+        elif code == 'x':
+            codes.append(count + code)
+        else:
+            codes.extend([code] * int(count or 1))
+    if body[pos:].strip():
+        raise ValueError('Invalid format: {}'.format(fmt))
+    return byte_order, codes
+
+
+def is_buffer(x):
+    return type(x) not in (str, list, tuple) and hasattr(x, '__len__') and _supports_buffer(x)
+
+
+def _supports_buffer(x):
+    try:
+        memoryview(x)
+    except TypeError:
+        return False
+    return True
+
+
+class RecordLayout:
+    def __init__(self, byte_order, fields):
+        """
+        ``fields`` is a list of (name, format) pairs; a None name is a padding.
+        """
+        self.byte_order = byte_order
+        self.struct = struct.Struct(byte_order + ''.join(code for _, code in fields))
+        self.size = self.struct.size
+        self.names = []
+        self.offsets = {}
+        self.field_structs = {}
+        self.positions = {}
+        offset = 0
+        position = 0
+        for field_name, code in fields:
+            field_struct = struct.Struct(byte_order + code)
+            if field_name is not None:
+                self.names.append(field_name)
+                self.offsets[field_name] = offset
+                self.field_structs[field_name] = field_struct
+                self.positions[field_name] = position
+                position += 1
+            offset += field_struct.size
+
+    def pack_example(self, values):
+        try:
+            return self.struct.pack(*values)
+        except struct.error:
+            return bytes(self.size)
+
+
+class RecordView:
+    """
+    A record inside a buffer: fields are unpacked when they are read, the buffer is never copied.
+    """
+    __slots__ = ('_layout', '_buffer', '_offset')
+
+    def __init__(self, layout, buffer, offset=0):
+        self._layout = layout
+        self._buffer = buffer
+        self._offset = offset
+
+    def __getattr__(self, item):
+        layout = self._layout
+        try:
+            field_struct = layout.field_structs[item]
+        except KeyError:
+            raise AttributeError(item)
+        return field_struct.unpack_from(self._buffer, self._offset + layout.offsets[item])[0]
+
+    def __getitem__(self, item):
+        if type(item) is int:
+            return self.values()[item]
+        try:
+            return self.__getattr__(item)
+        except AttributeError:
+            raise KeyError(item)
+
+    def values(self):
+        return self._layout.struct.unpack_from(self._buffer, self._offset)
+
+    def _asdict(self):
+        return dict(zip(self._layout.names, self.values()))
+
+    def __eq__(self, other):
+        return isinstance(other, RecordView) and self.values() == other.values()
+
+    def __repr__(self):
+        return 'RecordView({!r})'.format(self._asdict())
+
+
+class RecordArray:
+    """
+    A sequence of records laid out one after the other in a buffer.
+    """
+    __slots__ = ('_layout', '_buffer')
+
+    def __init__(self, layout, buffer):
+        self._layout = layout
+        self._buffer = buffer
+
+    def __len__(self):
+        return len(self._buffer) // self._layout.size
+
+    def __getitem__(self, index):
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(index)
+        return RecordView(self._layout, self._buffer, index * self._layout.size)
+
+    def __iter__(self):
+        layout = self._layout
+        for offset in range(0, len(self) * layout.size, layout.size):
+            yield RecordView(layout, self._buffer, offset)
+
+    def __repr__(self):
+        return 'RecordArray({} records)'.format(len(self))
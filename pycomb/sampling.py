@@ -0,0 +1,86 @@
+import random
+import threading
+
+from pycomb import context
+
+
+class _SamplerErrorObserver(context.ValidationErrorObserver):
+    def __init__(self, sampler):
+        self._sampler = sampler
+
+    def on_error(self, ctx, expected_type, found_type):
+        self._sampler.on_error()
+
+
+class Sampler:
+    """
+    Decides which calls of a decorated function get validated.
+
+    A fraction ``rate`` of the calls is validated, the others are passed through
+    untouched. In adaptive mode the rate is raised to ``max_rate`` as soon as an
+    error is seen, and then it is halved every ``decay_every`` calls until it is
+    back to ``rate``.
+    """
+    def __init__(self, rate, adaptive=False, max_rate=1.0, decay_every=1000, rng=random.random):
+        if not 0 <= rate <= 1 or not 0 <= max_rate <= 1:
+            raise ValueError
+        self.base_rate = rate
+        self.rate = rate
+        self.adaptive = adaptive
+        self.max_rate = max(rate, max_rate)
+        self.decay_every = decay_every
+        self.validated = 0
+        self.skipped = 0
+        self.errors = 0
+        self._rng = rng
+        self._calls_since_change = 0
+        self._error_observer = _SamplerErrorObserver(self)
+        # Guards the rate and the counters, which concurrent calls update.
+        self._lock = threading.Lock()
+
+    def should_validate(self):
+        with self._lock:
+            if self.adaptive and self.rate > self.base_rate:
+                self._calls_since_change += 1
+                if self._calls_since_change >= self.decay_every:
+                    self._calls_since_change = 0
+                    self.rate = max(self.base_rate, self.rate / 2)
+
+            if self.rate >= 1 or self._rng() < self.rate:
+                self.validated += 1
+                return True
+
+            self.skipped += 1
+            return False
+
+    def on_error(self):
+        with self._lock:
+            self.errors += 1
+            if self.adaptive:
+                self.rate = self.max_rate
+                self._calls_since_change = 0
+
+    def context(self, ctx=None):
+        """
+        Returns a copy of ``ctx`` that reports its errors to this sampler before
+        forwarding them to the original observers.
+        """
+        result = context.create(ctx)
+        result.add_error_observer(self._error_observer, first=True)
+        return result
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'validated': self.validated,
+                'skipped': self.skipped,
+                'errors': self.errors
+            }
+
+
+def create(sample, adaptive=False):
+    if sample is None:
+        return None
+    return sample if isinstance(sample, Sampler) else Sampler(sample, adaptive=adaptive)
@@ -0,0 +1,118 @@
+import copy
+import queue
+import threading
+
+DROP_NEWEST = 'drop_newest'
+DROP_OLDEST = 'drop_oldest'
+BLOCK = 'block'
+
+_POLICIES = (DROP_NEWEST, DROP_OLDEST, BLOCK)
+
+
+class ShadowValidator:
+    """
+    Validates values in background threads.
+
+    A context created with ``context.create(shadow=ShadowValidator())`` makes the
+    combinators return their input immediately; the value (or a deep copy of it,
+    if ``snapshot`` is set) is queued and validated by a pool of ``workers``
+    threads. Errors are notified to the observers of the context, from the
+    worker threads.
+    When the queue already holds ``max_queue`` values, ``when_full`` decides
+    whether the new value is dropped, the oldest one is dropped or the caller
+    blocks.
+    """
+    def __init__(self, workers=1, max_queue=1024, snapshot=False, when_full=DROP_NEWEST):
+        if when_full not in _POLICIES or workers < 1:
+            raise ValueError
+        self.workers = workers
+        self.snapshot = snapshot
+        self.when_full = when_full
+        self.submitted = 0
+        self.dropped = 0
+        self.validated = 0
+        self.raised = 0
+        self._queue = queue.Queue(max_queue)
+        self._threads = []
+        # Guards the threads and the counters, which the workers update concurrently.
+        self._lock = threading.Lock()
+
+    def submit(self, combinator, value, ctx):
+        job_ctx = ctx.copy()
+        job_ctx.shadow = None
+        job = (combinator, copy.deepcopy(value) if self.snapshot else value, job_ctx)
+
+        self._start()
+        with self._lock:
+            self.submitted += 1
+        if self.when_full == BLOCK:
+            self._queue.put(job)
+            return value
+
+        while True:
+            try:
+                self._queue.put_nowait(job)
+                return value
+            except queue.Full:
+                with self._lock:
+                    self.dropped += 1
+                if self.when_full == DROP_NEWEST:
+                    return value
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except queue.Empty:  # pragma: no cover
+                pass
+
+    def join(self):
+        """
+        Waits until every queued value has been validated.
+        """
+        self._queue.join()
+
+    def close(self):
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for t in threads:
+            t.join()
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'dropped': self.dropped,
+                'validated': self.validated,
+                'raised': self.raised,
+                'queued': self._queue.qsize()
+            }
+
+    def _start(self):
+        if self._threads:
+            return
+        with self._lock:
+            while len(self._threads) < self.workers:
+                t = threading.Thread(target=self._run, name='pycomb-shadow', daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                combinator, value, ctx = job
+                raised = 0
+                try:
+                    combinator(value, ctx=ctx)
+                except Exception:
+                    # The default observer reports errors by raising.
+                    raised = 1
+                with self._lock:
+                    self.raised += raised
+                    self.validated += 1
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+
+from pycomb import combinators as c, context
+from pycomb.test import util
+
+
+class TestBytes(unittest.TestCase):
+    def test_irreducibles(self):
+        self.assertTrue(c.Bytes.is_type(b'a'))
+        self.assertFalse(c.Bytes.is_type(bytearray(b'a')))
+        self.assertFalse(c.Bytes.is_type('a'))
+        for value in (b'a', bytearray(b'a'), memoryview(b'a')):
+            self.assertTrue(c.ByteString.is_type(value))
+        self.assertFalse(c.ByteString.is_type('a'))
+        with util.throws_with_message('Error on Bytes: expected Bytes but was str'):
+            c.Bytes('a')
+        self.assertTrue(c.list(c.ByteString).is_type([b'a', bytearray(b'a'), memoryview(b'a')]))
+        self.assertFalse(c.list(c.ByteString).is_type([b'a', 'b']))
+
+    def test_regexp_group(self):
+        Header = c.regexp_group(rb'([A-Z]+): (\d+)', c.ByteString, c.subtype(c.ByteString, lambda d: len(d) < 4))
+        for value in (b'SIZE: 123', bytearray(b'SIZE: 123'), memoryview(b'SIZE: 123')):
+            self.assertTrue(Header.is_type(value))
+            self.assertIs(value, Header(value))
+        self.assertFalse(Header.is_type(b'SIZE: 1234'))
+        self.assertFalse(Header.is_type('SIZE: 123'))
+        with util.throws_with_message("Error on RegexpGroup(b'([A-Z]+): (\\\\d+)'): expected "
+                                      "RegexpGroup(b'([A-Z]+): (\\\\d+)') but was bytes"):
+            Header(b'size: 1')
+        with self.assertRaises(ValueError):
+            c.regexp_group(rb'(a)')
+
+        # With an observer that does not raise, values of the wrong type are not matched.
+        observer = mock.Mock()
+        Name = c.regexp_group('(a+)', c.String)
+        for value in (b'a', 1):
+            self.assertIs(value, Name(value, ctx=context.create(validation_error_observer=observer)))
+        self.assertEqual(2, observer.on_error.call_count)
+
+    def test_groups_are_slices(self):
+        groups = []
+        Capture = c.irreducible(lambda d: groups.append(d) or True, None)
+        Pair = c.regexp_group(rb'(\w+)=(\w+)?', Capture, c.maybe(c.ByteString))
+
+        buffer = bytearray(b'key=')
+        Pair(memoryview(buffer))
+        self.assertIsInstance(groups[-1], memoryview)
+        self.assertIs(buffer, groups[-1].obj)
+        self.assertEqual(b'key', groups[-1].tobytes())
+
+        Pair(b'key=value')
+        self.assertEqual(b'key', groups[-1])
+        Pair(bytearray(b'key=value'))
+        self.assertEqual(bytearray(b'key'), groups[-1])
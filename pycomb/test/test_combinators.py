@@ -320,13 +320,13 @@ class TestCombinators(TestCase):
 
         d = my_type({'name': 'mirko', 'age': 36})
         self.assertEqual('mirko', d.name)
+        self.assertEqual(36, d.age)
 
         with self.assertRaises(exceptions.PyCombValidationError) as e:
             my_type({'name': 'mirko', 'age': '36'})
         e = e.exception
         self.assertEqual(
-            'Error on Intersection(Struct{name: String}, Struct{age: Int}): '
-            'expected Struct{name: String} or Struct{age: Int} but was dict',
+            'Error on Intersection(Struct{name: String}, Struct{age: Int})[age]: expected Int but was str',
             e.args[0])
 
         with self.assertRaises(exceptions.PyCombValidationError) as e:
@@ -344,7 +344,7 @@ class TestCombinators(TestCase):
         observer = Mock()
         ctx = context.create(validation_error_observer=observer)
         my_type({'name': 'mirko', 'age': '36'}, ctx=ctx)
-        observer.on_error.assert_called_once_with(_ANY_CONTEXT, 'Struct{name: String} or Struct{age: Int}', dict)
+        observer.on_error.assert_called_once_with(_ANY_CONTEXT, 'Int', str)
 
     def test_intersection_dispatcher(self):
         name_type = c.struct({'name': c.String})
@@ -358,8 +358,14 @@ class TestCombinators(TestCase):
             my_type({'name': 'mirko', 'age': '36'})
         e = e.exception
         self.assertEqual(
-            'Error on Intersection(Struct{name: String}, Struct{age: Int}): '
-            'expected Struct{name: String} or Struct{age: Int} but was dict',
+            'Error on Intersection(Struct{name: String}, Struct{age: Int})[age]: expected Int but was str',
+            e.args[0])
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            my_type({'name': 1, 'age': 36})
+        e = e.exception
+        self.assertEqual(
+            'Error on Intersection(Struct{name: String}, Struct{age: Int})[name]: expected String but was int',
             e.args[0])
 
     def test_named_intersection(self):
@@ -373,10 +379,7 @@ class TestCombinators(TestCase):
         with self.assertRaises(exceptions.PyCombValidationError) as e:
             my_type({'name': 'mirko', 'age': '36'})
         e = e.exception
-        self.assertEqual(
-            'Error on MyType: '
-            'expected Struct{name: String} or Struct{age: Int} but was dict',
-            e.args[0])
+        self.assertEqual('Error on MyType[age]: expected Int but was str', e.args[0])
 
     def test_enums(self):
         Enum = c.enum({'V1': '1', 'V2': '2', 'V3': '3'})
@@ -841,3 +844,109 @@ class TestCombinators(TestCase):
         with self.assertRaises(exceptions.PyCombValidationError) as e:
             s(Outer('hello'))
         self.assertEqual('Error on Outer.f: expected Inner but was str', e.exception.args[0])
+
+    def test_tagged_union(self):
+        create = c.struct({'type': c.constant('create'), 'name': c.String}, name='Create')
+        delete = c.struct({'type': c.constant('delete'), 'id': c.Int}, name='Delete')
+        event = c.tagged_union('type', {'create': create, 'delete': delete}, name='Event')
+
+        self.assertEqual(3, event({'type': 'delete', 'id': 3}).id)
+        self.assertEqual('John', event(StructType({'type': 'create', 'name': 'John'})).name)
+        self.assertTrue(event.is_type({'type': 'create', 'name': 'John'}))
+        self.assertFalse(event.is_type({'type': 'create', 'id': 3}))
+        self.assertFalse(event.is_type({'type': 'update'}))
+        self.assertFalse(event.is_type({'type': []}))
+        self.assertFalse(event.is_type('create'))
+        self.assertIs(delete, event.dispatch('delete'))
+        self.assertEqual({'type': 'create', 'name': 'Lorem 1p$um'}, event.example)
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            event({'type': 'delete', 'id': '3'})
+        self.assertEqual('Error on Event[id]: expected Int but was str', e.exception.args[0])
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            event({'type': 'update'})
+        self.assertEqual('Error on Event[type]: expected create or delete but was update', e.exception.args[0])
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            event({'id': 3})
+        self.assertEqual('Error on Event[type]: expected create or delete but was missing tag', e.exception.args[0])
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            event(['delete'])
+        self.assertEqual('Error on Event: expected Event but was list', e.exception.args[0])
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            c.list(event)([{'type': 'delete', 'id': 1}, {'type': 'create', 'name': 1}])
+        self.assertEqual('Error on List(Event)[1][name]: expected String but was int', e.exception.args[0])
+
+    def test_tagged_union_custom_error(self):
+        observer = Mock()
+        ctx = context.create(validation_error_observer=observer)
+        event = c.tagged_union('type', {1: c.struct({'a': c.Int})})
+        event({'type': 2}, ctx=ctx)
+        observer.on_error.assert_called_once_with(_ANY_CONTEXT, '1', '2')
+
+    def test_tagged_union_production(self):
+        event = c.tagged_union('type', {1: c.struct({'a': c.Int})})
+        self.assertEqual('hello', event('hello', ctx=context.create(production_mode=True)))
+
+    def test_union_skips_structs_by_keys(self):
+        condition = Mock(return_value=True)
+        a = c.struct({'a': c.subtype(c.Int, condition)}, name='A')
+        b = c.struct({'b': c.Int}, name='B')
+        ab = c.struct({'a': c.Int, 'b': c.maybe(c.Int)}, name='AB')
+        u = c.union(c.String, a, b, ab)
+
+        for _ in range(3):
+            self.assertEqual(1, u({'b': 1}).b)
+        self.assertFalse(u.is_type({'c': 1}))
+        self.assertEqual(0, condition.call_count)
+
+        # Both A and AB match: A is declared first, so it wins.
+        self.assertEqual({'a': 1}, u({'a': 1, 'b': 2}).__dict__['x'])
+        self.assertEqual('hello', u('hello'))
+        self.assertTrue(u.is_type({'a': 1}))
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            u(1)
+        self.assertEqual(
+            'Error on Union(String, A, B, AB): expected String or A or B or AB but was int',
+            e.exception.args[0])
+
+    def test_intersection_of_structs_is_merged(self):
+        condition = Mock(return_value=True)
+        base = c.struct({'id': c.subtype(c.Int, condition), 'name': c.String})
+        extension = c.struct({'id': c.Int, 'version': c.maybe(c.Int)})
+        versioned = c.intersection(base, extension, name='Versioned')
+
+        d = versioned({'id': 1, 'name': 'a', 'version': 2})
+        self.assertEqual((1, 'a', 2), (d.id, d.name, d.version))
+        self.assertEqual(1, condition.call_count)
+        self.assertTrue(versioned.is_type({'id': 1, 'name': 'a'}))
+        self.assertFalse(versioned.is_type({'id': 1, 'name': 'a', 'version': 'x'}))
+
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            versioned({'id': 1, 'name': 'a', 'version': '2'})
+        self.assertEqual('Error on Versioned[version].Maybe (Int): expected None or Int but was str',
+                         e.exception.args[0])
+
+        condition.return_value = False
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            versioned({'id': 1, 'name': 'a'})
+        self.assertEqual('Error on Versioned[id].Intersection(Subtype(Int), Int): expected Subtype(Int) but was int',
+                         e.exception.args[0])
+
+    def test_intersection_runs_each_member_once(self):
+        positive = c.subtype(c.Number, lambda d: d > 0, name='Positive')
+        small = c.subtype(c.Number, lambda d: d < 10, name='Small')
+        checker = Mock(side_effect=lambda d: d % 2 == 0)
+        even = c.subtype(c.Int, checker, name='Even')
+        my_type = c.intersection(positive, small, even)
+
+        self.assertEqual(4, my_type(4))
+        self.assertEqual(1, checker.call_count)
+
+        observer = Mock()
+        my_type(12, ctx=context.create(validation_error_observer=observer))
+        observer.on_error.assert_called_once_with(_ANY_CONTEXT, 'Small', int)
@@ -0,0 +1,71 @@
+import pickle
+import unittest
+from unittest import mock
+
+from pycomb import combinators as c, context, exceptions
+
+
+class TestLazyErrors(unittest.TestCase):
+    def setUp(self):
+        self.Point = c.struct({'x': c.Int, 'y': c.Int}, name='Point')
+
+    def test_message_is_formatted_on_demand(self):
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            c.list(self.Point)([{'x': 1, 'y': 2}, {'x': 1, 'y': 'a'}])
+        error = e.exception
+        self.assertEqual((), error._args)
+        self.assertEqual('List(Point)[1][y]', error.path)
+        self.assertEqual('Int', error.expected_type)
+        self.assertEqual('str', error.found_type)
+        self.assertEqual('Error on List(Point)[1][y]: expected Int but was str', str(error))
+        self.assertEqual(('Error on List(Point)[1][y]: expected Int but was str',), error.args)
+
+    def test_pickle(self):
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            self.Point({'x': None})
+        error = pickle.loads(pickle.dumps(e.exception))
+        self.assertEqual('Error on Point[x]: expected Int but was NoneType', str(error))
+        self.assertEqual('Point[x]', error.path)
+
+    def test_plain_messages(self):
+        self.assertEqual('a message', str(exceptions.PyCombValidationError('a message')))
+        self.assertEqual('', str(exceptions.PyCombValidationError()))
+        self.assertIsNone(exceptions.PyCombValidationError('a message').path)
+
+
+class TestFastFailure(unittest.TestCase):
+    def test_check(self):
+        Point = c.struct({'x': c.Int, 'y': c.Int}, name='Point')
+        Points = c.list(c.union(Point, c.String))
+
+        result = c.check(Points, [{'x': 1, 'y': 2}, 'a'])
+        self.assertEqual(2, result[0].y)
+        self.assertEqual('a', result[1])
+        self.assertIs(c.INVALID, c.check(Points, [{'x': 1, 'y': 'a'}]))
+        self.assertIs(c.INVALID, c.check(c.Int, 'a'))
+        self.assertFalse(c.INVALID)
+        self.assertEqual(0, c.check(c.Int, 0))
+
+        # Valid values are walked once.
+        condition = mock.Mock(return_value=True)
+        self.assertEqual((1,), c.check(c.list(c.subtype(c.Int, condition)), [1]))
+        self.assertEqual(1, condition.call_count)
+
+    def test_same_exception(self):
+        ctx = context.create(validation_error_observer=context.fast_failure_observer)
+        errors = []
+        for value in ('a', None):
+            try:
+                c.Int(value, ctx=ctx)
+            except exceptions.PyCombValidationError as e:
+                errors.append(e)
+        self.assertIs(errors[0], errors[1])
+        self.assertIs(exceptions.FAST_FAILURE, errors[0])
+
+    def test_other_errors_are_raised(self):
+        def limited(x, ctx=None):
+            raise exceptions.PyCombLimitExceeded('Error on Limited: max_items (1) exceeded', limit='max_items')
+        limited.is_type = lambda d: True
+
+        with self.assertRaises(exceptions.PyCombLimitExceeded):
+            c.check(limited, [1, 2])
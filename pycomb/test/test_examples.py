@@ -48,4 +48,30 @@ class TestExamples(unittest.TestCase):
         expected_example.a = 12
         expected_example.b = 'Hello'
         o = c.generic_object({'a': c.Int, 'b': c.String}, MyObject, example=expected_example)
-        self.assertEqual(expected_example, o.example)
\ No newline at end of file
+        self.assertEqual(expected_example, o.example)
+
+    def test_built_on_first_access(self):
+        calls = []
+
+        class MyObject:
+            def __init__(self):
+                calls.append(1)
+
+        o = c.list(c.generic_object({}, MyObject))
+        self.assertEqual([], calls)
+        self.assertEqual(3, len(o.example))
+        self.assertIs(o.example, o.example)
+        self.assertEqual([1], calls)
+
+        o.example = []
+        self.assertEqual([], o.example)
+
+    def test_lazy_name(self):
+        s = c.struct({'a': c.maybe(c.list(c.Int)), 'b': c.enum.of(['x'])})
+        self.assertIn('name', s.meta)
+        self.assertEqual('Struct{a: Maybe (List(Int)), b: Enum(x: x)}', s.meta['name'])
+        self.assertEqual('Maybe (List(Int))', c.maybe(c.list(c.Int)).meta.get('name'))
+        self.assertEqual(
+            {'name': 'List(Int)', 'kind': 'list', 'element': c.Int, 'typecode': None},
+            dict(c.list(c.Int).meta.items()))
+        self.assertEqual('x', c.enum.of(['x']).x)
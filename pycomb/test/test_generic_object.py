@@ -0,0 +1,84 @@
+import unittest
+
+from pycomb import combinators as c, context
+from pycomb.test import util
+
+
+class Point:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y=None):
+        self.x = x
+        if y is not None:
+            self.y = y
+
+
+class Point3D(Point):
+    __slots__ = ('z',)
+
+
+class Proxy:
+    def __init__(self, target):
+        self._target = target
+
+    @property
+    def __class__(self):
+        return type(self._target)
+
+    def __getattr__(self, item):
+        return getattr(self._target, item)
+
+
+class TestGenericObject(unittest.TestCase):
+    def setUp(self):
+        self.Point = c.generic_object({'x': c.Int, 'y': c.maybe(c.Int)}, Point)
+
+    def test_slots(self):
+        self.Point(Point(1, 2))
+        self.assertTrue(self.Point.is_type(Point(1, 2)))
+        # Unset slots are missing attributes, whatever the combinator of the field.
+        with self.assertRaises(AttributeError):
+            self.Point.is_type(Point(1))
+        with self.assertRaises(AttributeError):
+            self.Point(Point(1))
+
+    def test_attribute_errors(self):
+        class Broken(Point):
+            __slots__ = ()
+
+            @property
+            def y(self):
+                raise AttributeError('broken')
+
+        with self.assertRaises(AttributeError) as e:
+            self.Point(Broken(1))
+        self.assertEqual('broken', e.exception.args[0])
+
+    def test_subclasses_and_proxies(self):
+        self.assertTrue(self.Point.is_type(Point3D(1, 2)))
+        self.assertTrue(self.Point.is_type(Proxy(Point(1, 2))))
+        self.assertFalse(self.Point.is_type(Proxy(Point('1', 2))))
+        self.Point(Proxy(Point3D(1, 2)))
+        with util.throws_with_message('Error on Point: expected Point but was Proxy'):
+            self.Point(Proxy('1'))
+
+    def test_validate_all(self):
+        rows = [Point(i, i) for i in range(10)]
+        self.assertIs(rows, self.Point.validate_all(rows))
+        self.assertEqual(rows, self.Point.validate_all(iter(rows)))
+
+        rows[7] = Point(7, '7')
+        with util.throws_with_message('Error on Point[7].y.Maybe (Int): expected None or Int but was str'):
+            self.Point.validate_all(rows)
+        with util.throws_with_message('Error on Point[3]: expected Point but was int'):
+            self.Point.validate_all([Point(1, 1), Point(2, 2), Point(3, 3), 4])
+
+        errors = []
+        observer = type('Observer', (), {'on_error': lambda _, ctx, expected, found: errors.append(ctx.path)})()
+        rows = [Point(0, 0), Point('1', 1), Point(2, 2), Point('3', 3)]
+        self.Point.validate_all(rows, ctx=context.create(validation_error_observer=observer))
+        self.assertEqual(['Point[1].x', 'Point[3].x'], errors)
+
+    def test_validate_all_production(self):
+        rows = [None]
+        self.assertIs(rows, self.Point.validate_all(rows, ctx=context.create(production_mode=True)))
@@ -0,0 +1,50 @@
+import gc
+import unittest
+
+from pycomb import combinators as c, interning as ic
+from pycomb.test import util
+
+
+class TestInterning(unittest.TestCase):
+    def test_same_instance(self):
+        self.assertIs(ic.list(ic.String), ic.list(ic.String))
+        self.assertIs(ic.maybe(ic.list(ic.Int)), ic.maybe(ic.list(ic.Int)))
+        self.assertIs(
+            ic.struct({'name': ic.String, 'tags': ic.list(ic.String)}, name='Item'),
+            ic.struct({'name': ic.String, 'tags': ic.list(ic.String)}, name='Item'))
+        self.assertIs(ic.union(ic.Int, ic.String), ic.union(ic.Int, ic.String))
+        self.assertIs(ic.enum.of(['a', 'b']), ic.enum.of(['a', 'b']))
+
+    def test_different_arguments(self):
+        self.assertIsNot(ic.list(ic.String), ic.list(ic.Int))
+        self.assertIsNot(ic.list(ic.String), ic.list(ic.String, name='Names'))
+        self.assertIsNot(ic.struct({'a': ic.Int}), ic.struct({'a': ic.Int}, strict=True))
+        self.assertIsNot(ic.constant(1), ic.constant(True))
+        self.assertIsNot(ic.constant(1), ic.constant(1.0))
+        self.assertIsNot(ic.union(ic.Int, ic.String), ic.union(ic.String, ic.Int))
+
+    def test_unhashable_arguments(self):
+        class Example:
+            __hash__ = None
+
+        example = Example()
+        Items = ic.list(ic.Int, name='Items')
+        first = ic.dictionary(ic.String, Items, example=example)
+        second = ic.dictionary(ic.String, Items, example=example)
+        self.assertIsNot(first, second)
+        self.assertIs(example, first.example)
+
+    def test_collected(self):
+        before = ic.size()
+        names = ic.list(ic.String, name='Collected')
+        self.assertEqual(before + 1, ic.size())
+        del names
+        gc.collect()
+        self.assertEqual(before, ic.size())
+
+    def test_validation(self):
+        Items = ic.list(ic.struct({'n': ic.Int}, name='Item'))
+        self.assertEqual(1, Items([{'n': 1}])[0].n)
+        with util.throws_with_message('Error on List(Item)[0][n]: expected Int but was str'):
+            Items([{'n': '1'}])
+        self.assertIs(c.Int, ic.Int)
@@ -0,0 +1,194 @@
+import array
+import json
+import unittest
+from unittest import mock
+
+from pycomb import combinators as c, context, exceptions
+from pycomb import json as pjson
+from pycomb.predicates import StructType
+from pycomb.test import util
+
+
+def _plain(value):
+    if isinstance(value, StructType):
+        return {k: _plain(v) for k, v in value.x.items()}
+    if isinstance(value, tuple):
+        return tuple(_plain(x) for x in value)
+    return value
+
+
+class TestJsonLoads(unittest.TestCase):
+    def setUp(self):
+        self.Point = c.struct({'x': c.Int, 'y': c.Int}, name='Point')
+        self.Shape = c.struct({
+            'name': c.String,
+            'kind': c.enum({'P': 'polygon', 'C': 'circle'}),
+            'points': c.list(self.Point),
+            'tags': c.maybe(c.list(c.String)),
+            'color': c.maybe(c.String),
+            'attributes': c.dictionary(c.String, c.Number),
+            'id': c.union(c.Int, c.String)
+        }, name='Shape')
+
+    def _assert_same(self, combinator, data):
+        self.assertEqual(_plain(combinator(json.loads(data))), _plain(pjson.loads(combinator, data)))
+
+    def test_loads(self):
+        data = '''{
+            "name": "square", "kind": "P", "id": 12, "extra": [1, {"a": null}],
+            "points": [{"x": 0, "y": 0}, {"x": 1, "y": 0}, {"x": 1, "y": 1}],
+            "attributes": {"area": 1.0, "sides": 4}, "color": ""
+        }'''
+        result = pjson.loads(self.Shape, data)
+        self._assert_same(self.Shape, data)
+        self.assertEqual('polygon', result.kind)
+        self.assertEqual(1, result.points[2].y)
+        self.assertIsNone(result.tags)
+        self.assertIsNone(result.color)
+        self.assertEqual({'area': 1.0, 'sides': 4}, result.attributes)
+
+    def test_loads_maybe(self):
+        self._assert_same(c.list(c.maybe(c.list(c.Int))), '[[1], [ ], null, [2, 3], [\n]]')
+        self._assert_same(c.list(c.maybe(self.Point)), '[{"x": 1, "y": 2}, null, {"x": 3, "y": 4}]')
+
+    def test_loads_scalar_lists(self):
+        self._assert_same(c.list(c.enum({'P': 'polygon', 'C': 'circle'})), '["C", "P"]')
+        self._assert_same(c.list(c.maybe(c.String)), '["a", null, ""]')
+        self._assert_same(c.list(c.Float, typecode='d'), '[1.5, 2.0]')
+        with util.throws_with_message('Error on List(Int)[1]: expected Int but was str'):
+            pjson.loads(c.list(c.Int), '[1, "2", 3]')
+
+    def test_loads_typed_array(self):
+        Ints = c.list(c.Int, typecode='q')
+        self.assertEqual(array.array('q', [1, 2]), pjson.loads(Ints, '[1, 2]'))
+        self.assertEqual(array.array('q'), pjson.loads(Ints, '[]'))
+        with util.throws_with_message("Error on List(Int): expected List(Int) but was int out of range of 'q' arrays"):
+            pjson.loads(Ints, '[99999999999999999999999]')
+
+        observer = mock.Mock()
+        ctx = context.create(validation_error_observer=observer)
+        self.assertEqual((1.5,), pjson.loads(Ints, '[1.5]', ctx=ctx))
+        self.assertEqual(1, observer.on_error.call_count)
+
+    def test_loads_bytes(self):
+        result = pjson.loads(c.list(c.Int), b' [1, 2, 3] ')
+        self.assertEqual((1, 2, 3), result)
+        self.assertIsNone(pjson.loads(c.list(c.Int), '[]'))
+
+    def test_field_error(self):
+        with util.throws_with_message('Error on Shape[points][1][y]: expected Int but was str'):
+            pjson.loads(self.Shape, '{"points": [{"x": 0, "y": 0}, {"x": 1, "y": "0"}, {"x": [}]}')
+
+        with util.throws_with_message('Error on Shape[attributes][area]: expected Int or Float but was str'):
+            pjson.loads(self.Shape, '{"attributes": {"area": "big"}}')
+
+        with util.throws_with_message('Error on Shape[kind]: expected C or P but was X'):
+            pjson.loads(self.Shape, '{"kind": "X"}')
+
+        with util.throws_with_message('Error on Shape[tags].Maybe (List(String))[0]: expected String but was int'):
+            pjson.loads(self.Shape, '{"tags": [1]}')
+
+        with util.throws_with_message('Error on Shape[name]: expected String but was NoneType'):
+            pjson.loads(self.Shape, '{"points": [{"x": 0, "y": 0}]}')
+
+        with util.throws_with_message('Error on Point: expected Point but was list'):
+            pjson.loads(self.Point, '[1, 2]')
+
+    def test_strict(self):
+        Strict = c.struct({'name': c.String}, strict=True)
+        self.assertEqual('John', pjson.loads(Strict, '{"name": "John"}').name)
+        with util.throws_with_message(
+                'Error on StrictStruct{name: String}: expected StrictStruct{name: String} but was dict'):
+            pjson.loads(Strict, '{"name": "John", "age": ]')
+
+    def test_custom_context(self):
+        errors = []
+
+        class Observer(context.ValidationErrorObserver):
+            def on_error(self, ctx, expected_type, found_type):
+                errors.append((ctx.path, expected_type, found_type))
+
+        ctx = context.create(validation_error_observer=Observer())
+        result = pjson.loads(c.list(self.Point), '[{"x": "a", "y": 1}, {"x": 1, "y": 2.0}]', ctx=ctx)
+        self.assertEqual(2, len(result))
+        self.assertEqual(
+            [('List(Point)[0][x]', 'Int', str), ('List(Point)[1][y]', 'Int', float)],
+            errors)
+
+    def test_production(self):
+        ctx = context.create(production_mode=True)
+        self.assertEqual([1, 'a'], pjson.loads(c.list(c.Int), '[1, "a"]', ctx=ctx))
+
+    def test_malformed(self):
+        for data in ('{"name": "a",}', '[1 2]', '{"x" 1}', '[1] 2', '{1: 2}', ''):
+            with self.assertRaises(pjson.JSONDecodeError, msg=data):
+                pjson.loads(c.maybe(c.list(c.Int)), data)
+
+    def test_not_json_errors(self):
+        with self.assertRaises(exceptions.PyCombValidationError):
+            pjson.loads(c.Int, '"hello"')
+
+
+class TestJsonDumps(unittest.TestCase):
+    def setUp(self):
+        self.Point = c.struct({'x': c.Int, 'y': c.Float}, name='Point')
+        self.Shape = c.struct({
+            'name': c.String,
+            'kind': c.enum({'P': 'polygon', 'C': 'circle'}),
+            'points': c.list(self.Point),
+            'tags': c.maybe(c.sequence(c.String)),
+            'visible': c.Boolean,
+            'attributes': c.dictionary(c.String, c.Number),
+            'id': c.union(c.Int, c.String),
+            'code': c.regexp_group('([A-Z]+)', c.String),
+            'extra': c.union(self.Point, c.String)
+        }, name='Shape')
+
+    def test_dumps(self):
+        value = {
+            'name': 'sqèare "1"', 'kind': 'P', 'visible': True, 'id': 'a1', 'code': 'AB',
+            'points': [{'x': 0, 'y': 0.5}, {'x': 1, 'y': float('inf')}],
+            'attributes': {'area': 1.0, 'sides': 4},
+            'extra': {'x': 2, 'y': 3.0}
+        }
+        validated = self.Shape(value)
+        result = pjson.dumps(self.Shape, validated)
+        expected = dict(value, tags=None, kind='P')
+        self.assertEqual(expected, json.loads(result))
+        self.assertTrue(result.startswith('{"name": "sq\\u00e8are \\"1\\"", "kind": "P", "points": [{"x": 0, '))
+        self.assertEqual(_plain(validated), _plain(pjson.loads(self.Shape, result)))
+
+    def test_dumps_options(self):
+        Tags = c.list(c.String)
+        self.assertEqual('["è",1]', pjson.dumps(c.list(c.union(c.String, c.Int)), ('è', 1),
+                                                     ensure_ascii=False, separators=(',', ':')))
+        self.assertEqual('[]', pjson.dumps(Tags, Tags([])))
+        self.assertEqual('{"1": 2}', pjson.dumps(c.dictionary(c.Int, c.Int), {1: 2}))
+        self.assertEqual('{}', pjson.dumps(c.struct({}), {}))
+        Matrix = c.list(c.list(c.Int))
+        self.assertEqual('[[], [1]]', pjson.dumps(Matrix, Matrix([[], [1]])))
+        Floats = c.struct({'values': c.list(c.Float, typecode='d')})
+        self.assertEqual('{"values": [0.5]}', pjson.dumps(Floats, Floats({'values': [0.5]})))
+
+    def test_dumps_enums(self):
+        Color = c.enum({'r': (255, 0, 0), 'g': 'green'})
+        self.assertEqual('["r", "g", "b"]', pjson.dumps(c.list(Color), ((255, 0, 0), 'green', 'b')))
+        Sku = c.enum.of(['A1', 'B2'])
+        self.assertEqual('{"A1": ["B2"]}', pjson.dumps(c.dictionary(Sku, c.list(Sku)), {'A1': ('B2',)}))
+
+    def test_dumps_generic_object(self):
+        class Item:
+            def __init__(self, a, b):
+                self.a, self.b = a, b
+
+        Items = c.list(c.generic_object({'a': c.Int, 'b': c.enum.of(['X', 'Y'])}, Item))
+        self.assertEqual('[{"a": 1, "b": "X"}]', pjson.dumps(Items, [Item(1, 'X')]))
+
+    def test_dumps_tagged_union(self):
+        Event = c.tagged_union('type', {
+            'a': c.struct({'type': c.constant('a'), 'x': c.Int}),
+            'b': c.struct({'type': c.constant('b'), 'y': c.maybe(c.Int)})
+        })
+        self.assertEqual(
+            '[{"type": "b", "y": null}, {"type": "a", "x": 1}]',
+            pjson.dumps(c.list(Event), c.list(Event)([{'type': 'b'}, {'type': 'a', 'x': 1}])))
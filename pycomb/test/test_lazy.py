@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+from pycomb import combinators as c, context
+from pycomb.lazy import LazyDictionary, LazySequence, LazyStruct
+from pycomb.test import util
+
+
+class TestLazy(unittest.TestCase):
+    def test_dictionary(self):
+        value = mock.Mock(side_effect=lambda x, ctx=None: x, meta={'name': 'Value'})
+        Scores = c.dictionary(c.String, value, name='Scores', lazy=True)
+        data = {'k{}'.format(i): i for i in range(1000)}
+        data['bad'] = 'x'
+
+        result = Scores(data)
+        self.assertIsInstance(result, LazyDictionary)
+        self.assertEqual(0, value.call_count)
+
+        self.assertEqual(12, result['k12'])
+        self.assertEqual(12, result['k12'])
+        self.assertEqual(1, value.call_count)
+        self.assertEqual(1001, len(result))
+
+        with util.throws_with_message('Error on Scores[bad]: expected Int but was str'):
+            c.dictionary(c.String, c.Int, name='Scores', lazy=True)(data)['bad']
+
+        with util.throws_with_message('Error on Scores.1: expected String but was int'):
+            _ = [x for x in c.dictionary(c.String, c.Int, name='Scores', lazy=True)({1: 1})]
+
+    def test_sequence(self):
+        Numbers = c.sequence(c.Int, lazy=True)
+        result = Numbers([1, 2, 'a', 4])
+        self.assertIsInstance(result, LazySequence)
+        self.assertEqual(2, result[1])
+        self.assertEqual(4, result[-1])
+        self.assertEqual((1, 2), result[:2])
+        self.assertEqual(4, len(result))
+
+        with util.throws_with_message('Error on Sequence(Int)[2]: expected Int but was str'):
+            _ = result[2]
+        with util.throws_with_message('Error on Sequence(Int)[2]: expected Int but was str'):
+            _ = result[-2]
+        with self.assertRaises(IndexError):
+            _ = result[4]
+
+    def test_struct(self):
+        Point = c.struct({'x': c.Int, 'y': c.Int}, name='Point', lazy=True)
+        result = Point({'x': 1, 'y': 'a'})
+        self.assertIsInstance(result, LazyStruct)
+        self.assertEqual(1, result.x)
+        self.assertEqual(1, result['x'])
+        with util.throws_with_message('Error on Point[y]: expected Int but was str'):
+            _ = result.y
+
+        with util.throws_with_message('Error on Point: expected Point but was list'):
+            Point([1, 2])
+        with util.throws_with_message('Error on StrictStruct{x: Int}: expected StrictStruct{x: Int} but was dict'):
+            c.struct({'x': c.Int}, strict=True, lazy=True)({'x': 1, 'z': 2})
+
+    def test_nested_paths(self):
+        Point = c.struct({'x': c.Int}, name='Point', lazy=True)
+        Points = c.dictionary(c.String, Point, name='Points', lazy=True)
+        errors = []
+
+        class Observer(context.ValidationErrorObserver):
+            def on_error(self, ctx, expected_type, found_type):
+                errors.append(ctx.path)
+
+        result = Points({'a': {'x': 'one'}}, ctx=context.create(validation_error_observer=Observer()))
+        self.assertEqual('one', result['a'].x)
+        self.assertEqual(['Points[a][x]'], errors)
+
+    def test_production_mode(self):
+        data = [1, 'a']
+        self.assertIs(data, c.sequence(c.Int, lazy=True)(data, ctx=context.create(production_mode=True)))
@@ -0,0 +1,115 @@
+import unittest
+from unittest import mock
+
+from pycomb import combinators as c, context, exceptions
+from pycomb import json as pjson
+from pycomb.test import util
+
+
+def _nested(depth):
+    value = None
+    for _ in range(depth):
+        value = {'child': value}
+    return value
+
+
+class TestLimits(unittest.TestCase):
+    def setUp(self):
+        self.Node = c.struct({'child': c.Int}, name='Node')
+        self.Node.meta['fields']['child'] = c.maybe(self.Node)
+
+    def test_max_items(self):
+        Numbers = c.list(c.Int)
+        Numbers(list(range(10)), ctx=context.create(max_items=10))
+        with util.throws_with_message('Error on List(Int): max_items (10) exceeded'):
+            Numbers(list(range(11)), ctx=context.create(max_items=10))
+
+        Matrix = c.list(c.list(c.Int), name='Matrix')
+        with util.throws_with_message('Error on Matrix[1]: max_items (5) exceeded'):
+            Matrix([[1, 2], [3, 4]], ctx=context.create(max_items=5))
+
+        Scores = c.dictionary(c.String, c.Int, name='Scores')
+        with util.throws_with_message('Error on Scores: max_items (1) exceeded'):
+            Scores({'a': 1, 'b': 2}, ctx=context.create(max_items=1))
+
+    def test_max_depth(self):
+        self.Node(_nested(5), ctx=context.create(max_depth=5))
+        with util.throws_with_message(
+                'Error on Node[child].Maybe (Node)[child].Maybe (Node)[child].Maybe (Node): max_depth (3) exceeded'):
+            self.Node(_nested(5), ctx=context.create(max_depth=3))
+
+    def test_deadline(self):
+        with mock.patch('pycomb.context.time.monotonic', side_effect=[0, 0, 0.5, 2]):
+            with self.assertRaises(exceptions.PyCombLimitExceeded) as e:
+                c.list(c.list(c.Int))([[1], [2]], ctx=context.create(deadline=1))
+        self.assertEqual('deadline', e.exception.limit)
+        self.assertEqual('List(List(Int))[1]', e.exception.path)
+
+    def test_deadline_in_loops(self):
+        for combinator, value, path in (
+                (c.list(c.String), ['a'] * 1500, 'List(String)[1000]'),
+                (c.sequence(c.String), ['a'] * 1500, 'Sequence(String)[1000]'),
+                (c.dictionary(c.Int, c.String), {i: 'a' for i in range(1500)}, 'dictionary(Int: String)[1000]')):
+            with mock.patch('pycomb.context.time.monotonic', side_effect=[0, 0, 2]):
+                with self.assertRaises(exceptions.PyCombLimitExceeded) as e:
+                    combinator(value, ctx=context.create(deadline=1))
+            self.assertEqual('deadline', e.exception.limit)
+            self.assertEqual(path, e.exception.path)
+
+        with mock.patch('pycomb.context.time.monotonic', side_effect=[0, 0, 2]):
+            with self.assertRaises(exceptions.PyCombLimitExceeded) as e:
+                pjson.loads(c.list(c.String), '[' + ', '.join(['"a"'] * 1500) + ']', ctx=context.create(deadline=1))
+        self.assertEqual('deadline', e.exception.limit)
+
+    def test_no_walk_before_limits(self):
+        numbers = [1] * 100
+        for combinator, path in (
+                (c.maybe(c.list(c.Int)), 'Maybe (List(Int))'),
+                (c.union(c.String, c.list(c.Int)), 'Union(String, List(Int))')):
+            with mock.patch.object(c.Int, 'is_type', side_effect=AssertionError):
+                with self.assertRaises(exceptions.PyCombLimitExceeded) as e:
+                    combinator(numbers, ctx=context.create(max_items=10))
+            self.assertEqual('max_items', e.exception.limit)
+            self.assertEqual(path, e.exception.path)
+
+        self.assertEqual((1, 2), c.maybe(c.list(c.Int))([1, 2], ctx=context.create(max_items=10)))
+        self.assertIsNone(c.maybe(c.Int)(None, ctx=context.create(max_items=10)))
+        self.assertEqual((1,), c.union(c.String, c.list(c.Int))([1], ctx=context.create(max_items=10)))
+        with util.throws_with_message('Error on Maybe (Int): expected None or Int but was str'):
+            c.maybe(c.Int)('a', ctx=context.create(max_items=10))
+        with util.throws_with_message('Error on Union(String, Int): expected String or Int but was float'):
+            c.union(c.String, c.Int)(1.5, ctx=context.create(max_items=10))
+
+    def test_deadline_in_bulk_loops(self):
+        Row = c.struct({'a': c.Int}, name='Row')
+        Pair = c.record([('a', 'i', c.subtype(c.Int, lambda d: d >= 0))], name='Pair')
+        for combinator, value in (
+                (c.table(Row), [{'a': 1}] * 1500),
+                (c.list(Pair), bytes(4 * 1500))):
+            with mock.patch('pycomb.context.time.monotonic', side_effect=[0, 0, 2]):
+                with self.assertRaises(exceptions.PyCombLimitExceeded) as e:
+                    combinator(value, ctx=context.create(deadline=1))
+            self.assertEqual('deadline', e.exception.limit)
+
+    def test_limits_ignore_observer(self):
+        observer = mock.Mock()
+        ctx = context.create(validation_error_observer=observer, max_items=1)
+        with self.assertRaises(exceptions.PyCombLimitExceeded):
+            c.list(c.Int)([1, 'a'], ctx=ctx)
+        observer.on_error.assert_not_called()
+        self.assertIsInstance(exceptions.PyCombLimitExceeded(), exceptions.PyCombValidationError)
+
+    def test_no_limits_in_production(self):
+        ctx = context.create(production_mode=True, max_items=1)
+        self.assertEqual([1, 2], c.list(c.Int)([1, 2], ctx=ctx))
+
+    def test_json(self):
+        data = '{"child": ' * 2000 + 'null' + '}' * 2000
+        with util.throws_with_message('Error on Node[child].Maybe (Node)[child].Maybe (Node): max_depth (2) exceeded'):
+            pjson.loads(self.Node, data, ctx=context.create(max_depth=2))
+
+        with util.throws_with_message('Error on List(Int)[3]: max_items (3) exceeded'):
+            pjson.loads(c.list(c.Int), '[1, 2, 3, 4, 5]', ctx=context.create(max_items=3))
+
+        with util.throws_with_message('Error on dictionary(String: Int)[b]: max_items (1) exceeded'):
+            pjson.loads(c.dictionary(c.String, c.Int), '{"a": 1, "b": 2}', ctx=context.create(max_items=1))
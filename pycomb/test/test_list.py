@@ -1,3 +1,9 @@
+import array
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 from pycomb import combinators as t, context as ctx
 from pycomb.test import util
 from unittest.case import TestCase
@@ -94,3 +100,39 @@ class TestList(TestCase):
                 'expected List(Struct{y: Number, x: Number}) but was NoneType'
         ):
             self.PathOfPoint(None)
+
+    def test_typed_array(self):
+        Ints = t.list(t.Int, typecode='q')
+        result = Ints([1, 2, 3])
+        self.assertEqual(array.array('q', [1, 2, 3]), result)
+        self.assertIs(result, Ints(result))
+        self.assertEqual(array.array('q'), Ints([]))
+        self.assertEqual(array.array('d', [0.5]), t.list(t.Float, typecode='d')((0.5,)))
+
+        with util.throws_with_message('Error on List(Int)[1]: expected Int but was float'):
+            Ints([1, 2.0])
+        with util.throws_with_message("Error on List(Int): expected List(Int) but was int out of range of 'q' arrays"):
+            Ints([2 ** 70])
+        with self.assertRaises(ValueError):
+            t.list(t.String, typecode='q')
+        with self.assertRaises(ValueError):
+            t.list(t.Int, typecode='d')
+
+    def test_array_input(self):
+        condition = mock.Mock(side_effect=lambda d: 0 <= d < 100)
+        Percentages = t.list(t.subtype(t.Int, condition, name='Percentage'))
+        values = array.array('i', range(100))
+        self.assertIs(values, Percentages(values))
+        self.assertEqual(100, condition.call_count)
+        self.assertTrue(Percentages.is_type(values))
+        self.assertFalse(Percentages.is_type(array.array('d', [1.0])))
+        self.assertFalse(t.list(t.String).is_type(array.array('i', [1])))
+        self.assertEqual((1, 2), Percentages([1, 2]))
+
+        values[50] = 100
+        with util.throws_with_message('Error on List(Percentage)[50]: expected Percentage but was int'):
+            Percentages(values)
+        self.assertFalse(Percentages.is_type(values))
+
+        with util.throws_with_message('Error on List(Float)[0]: expected Float but was int'):
+            t.list(t.Float)(array.array('i', [1]))
@@ -0,0 +1,79 @@
+import unittest
+
+from pycomb import combinators as c
+from pycomb.test import util
+
+
+class _Uncomparable:
+    def __eq__(self, other):
+        raise AssertionError
+
+    __hash__ = object.__hash__
+
+
+class TestLiterals(unittest.TestCase):
+    def setUp(self):
+        self.codes = ['S{}'.format(i) for i in range(60)]
+        self.Status = c.union(*map(c.constant, self.codes), name='Status')
+
+    def _count_calls(self, combinators):
+        calls = []
+        for combinator in combinators:
+            def _is_type(d, is_type=combinator.is_type, value=combinator.meta['value']):
+                calls.append(value)
+                return is_type(d)
+            combinator.is_type = _is_type
+        return calls
+
+    def test_lookup(self):
+        calls = self._count_calls(self.Status.meta['combinators'])
+        self.assertEqual('S59', self.Status('S59'))
+        self.assertTrue(self.Status.is_type('S0'))
+        self.assertFalse(self.Status.is_type('S60'))
+        # Only the constant found by the lookup checks the value again, when validating it.
+        self.assertEqual(['S59'], calls)
+        self.assertFalse(self.Status.is_type(['S0']))
+        with util.throws_with_message('Error on Status: expected Constant(S0) or Constant(S1) or Constant(S2) or '
+                                      + ' or '.join('Constant({})'.format(x) for x in self.codes[3:]) +
+                                      ' but was str'):
+            self.Status('S60')
+
+    def test_declaration_order(self):
+        # Enums are not looked up with the constants, they tell which branch validated the value.
+        self.assertEqual('one', c.union(c.enum({1: 'one'}), c.constant(1), c.constant(2))(1))
+        self.assertEqual(1, c.union(c.constant(1), c.constant(2), c.enum({1: 'one'}))(1))
+        self.assertIs(True, c.union(c.constant(1), c.constant(True), c.enum({True: 'yes'}))(True))
+        self.assertEqual('three', c.union(c.constant(1), c.constant(2), c.enum({3: 'three'}))(3))
+
+    def test_special_values(self):
+        Values = c.union(c.constant(b'a'), c.constant(float('nan')), c.constant(None), c.constant({'a': 1}))
+        self.assertTrue(Values.is_type(bytearray(b'a')))
+        self.assertTrue(Values.is_type(None))
+        self.assertTrue(Values.is_type({'a': 1}))
+        self.assertFalse(Values.is_type(float('nan')))
+        self.assertFalse(Values.is_type(Values.meta['combinators'][1].meta['value']))
+        self.assertFalse(Values.is_type([]))
+        self.assertEqual({'a': 1}, Values.meta['combinators'][3].meta['value'])
+
+        self.assertTrue(c.list(Values).is_type([b'a', bytearray(b'a'), None, {'a': 1}]))
+        self.assertFalse(c.list(Values).is_type([b'b']))
+        self.assertFalse(c.list(Values).is_type([[]]))
+
+    def test_fingerprint(self):
+        Constant = c.constant({'a': _Uncomparable(), 'b': 2})
+        self.assertFalse(Constant.is_type({'a': 1}))
+        self.assertFalse(Constant.is_type(['a', 'b']))
+        self.assertFalse(Constant.is_type(None))
+        with self.assertRaises(AssertionError):
+            Constant.is_type({'a': 1, 'b': 2})
+
+        Defaults = c.union(Constant, c.constant([_Uncomparable()]), c.constant({'a': 1}), c.constant('a'))
+        self.assertTrue(Defaults.is_type({'a': 1}))
+        self.assertFalse(Defaults.is_type({'b': 1}))
+        self.assertFalse(Defaults.is_type([1, 2]))
+
+        self.assertTrue(c.constant([1, 2]).is_type([1, 2]))
+        self.assertFalse(c.constant([1, 2]).is_type((1, 2)))
+        self.assertTrue(c.constant({1, 2}).is_type(frozenset({1, 2})))
+        self.assertTrue(c.constant(bytearray(b'ab')).is_type(b'ab'))
+
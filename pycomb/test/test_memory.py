@@ -0,0 +1,33 @@
+import copy
+import unittest
+
+import pycomb
+from pycomb import combinators as c
+
+
+class TestMemory(unittest.TestCase):
+    def test_sizeof(self):
+        item = c.struct({'name': c.String, 'tags': c.list(c.String)}, name='Item')
+        self.assertGreater(pycomb.sizeof(item), pycomb.sizeof(c.String))
+        self.assertGreater(pycomb.sizeof(c.list(item)), pycomb.sizeof(item))
+
+        # Shared combinators are counted once.
+        shared = c.struct({'a': item, 'b': item})
+        copied = c.struct({'a': item, 'b': c.struct({'name': c.String, 'tags': c.list(c.String)}, name='Item')})
+        self.assertLess(pycomb.sizeof(shared), pycomb.sizeof(copied))
+
+    def test_slots(self):
+        for combinator in (c.Int, c.list(c.Int), c.struct({'a': c.Int}), c.union(c.Int, c.String),
+                           c.enum.of(['a']), c.function(c.Int)):
+            self.assertFalse(hasattr(combinator, '__dict__'), msg=combinator.meta['name'])
+            self.assertIsInstance(combinator, c.Combinator)
+
+    def test_enum_values(self):
+        e = c.enum({'a': 1, 'b': 2})
+        self.assertEqual(1, e.a)
+        self.assertEqual(2, e.b)
+        with self.assertRaises(AttributeError):
+            e.c
+        with self.assertRaises(AttributeError):
+            e._c
+        self.assertEqual(1, copy.copy(e).a)
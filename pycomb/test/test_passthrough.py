@@ -0,0 +1,49 @@
+import unittest
+
+from pycomb import combinators as c, context, exceptions
+
+
+class TestPassthrough(unittest.TestCase):
+    def setUp(self):
+        self.ctx = context.create(output=context.PASSTHROUGH)
+        self.Point = c.struct({'x': c.Int, 'y': c.Int})
+        self.Gender = c.enum({'M': 'male', 'F': 'female'})
+
+    def test_unchanged(self):
+        points = [{'x': 1, 'y': 2}, {'x': 3, 'y': 4}]
+        self.assertIs(points, c.list(self.Point)(points, ctx=self.ctx))
+        self.assertIs(points, c.sequence(self.Point)(points, ctx=self.ctx))
+        empty = []
+        self.assertIs(empty, c.list(c.Int)(empty, ctx=self.ctx))
+
+        nested = {'points': points, 'extra': 1}
+        self.assertIs(nested, c.struct({'points': c.list(self.Point)})(nested, ctx=self.ctx))
+
+    def test_changed(self):
+        Person = c.struct({'name': c.String, 'gender': self.Gender, 'tags': c.list(c.String)})
+        people = [
+            {'name': 'John', 'gender': 'M', 'tags': ['a']},
+            {'name': 'Jane', 'gender': 'F', 'tags': ['b'], 'extra': 1}
+        ]
+        result = c.list(Person)(people, ctx=self.ctx)
+        self.assertIsNot(people, result)
+        self.assertEqual(list, type(result))
+        self.assertEqual('male', result[0]['gender'])
+        self.assertEqual(1, result[1]['extra'])
+        self.assertIs(people[0]['tags'], result[0]['tags'])
+        self.assertEqual('M', people[0]['gender'])
+
+        self.assertEqual(('male', 'female'), c.list(self.Gender)(('M', 'F'), ctx=self.ctx))
+
+    def test_combinator_option(self):
+        Points = c.list(self.Point, output=context.PASSTHROUGH)
+        points = [{'x': 1, 'y': 2}]
+        self.assertIs(points, Points(points))
+        self.assertIs(points, c.struct({'p': Points}, output=context.PASSTHROUGH)({'p': points})['p'])
+        self.assertEqual(tuple, type(c.list(self.Point)(points)))
+
+    def test_errors(self):
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            c.list(self.Point)([{'x': 1, 'y': '2'}], ctx=self.ctx)
+        self.assertEqual('Error on List(Struct{x: Int, y: Int})[0][y]: expected Int but was str',
+                         e.exception.args[0])
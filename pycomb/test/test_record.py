@@ -0,0 +1,94 @@
+import mmap
+import struct
+import tempfile
+import unittest
+
+from pycomb import combinators as c, context, records
+from pycomb.test import util
+
+
+class TestRecord(unittest.TestCase):
+    def setUp(self):
+        self.Temperature = c.subtype(c.Float, lambda d: -50 <= d <= 60, name='Temperature')
+        self.Telemetry = c.record([
+            ('id', 'I'),
+            ('temperature', 'f', self.Temperature),
+            ('ok', '?')
+        ], name='Telemetry')
+        self.packer = struct.Struct('<If?')
+
+    def test_record(self):
+        data = bytearray(self.packer.pack(7, 21.5, True))
+        result = self.Telemetry(data)
+        self.assertIsInstance(result, records.RecordView)
+        self.assertEqual(7, result.id)
+        self.assertEqual(21.5, result.temperature)
+        self.assertTrue(result['ok'])
+        self.assertEqual((7, 21.5, True), result.values())
+
+        # The view reads the buffer, nothing has been copied.
+        data[0] = 8
+        self.assertEqual(8, result.id)
+
+        self.assertTrue(self.Telemetry.is_type(data))
+        self.assertEqual(9, self.Telemetry.meta['size'])
+        self.assertEqual(9, len(self.Telemetry.example))
+
+    def test_record_errors(self):
+        with util.throws_with_message('Error on Telemetry.temperature: expected Temperature but was float'):
+            self.Telemetry(self.packer.pack(7, 99, True))
+
+        with util.throws_with_message('Error on Telemetry: expected Telemetry but was bytes'):
+            self.Telemetry(b'\x00' * 4)
+
+        with util.throws_with_message('Error on Telemetry: expected Telemetry but was str'):
+            self.Telemetry('a')
+
+        self.assertFalse(self.Telemetry.is_type(self.packer.pack(7, 99, True)))
+        self.assertFalse(self.Telemetry.is_type(b''))
+
+    def test_format(self):
+        Pair = c.record('>hxxd')
+        self.assertEqual('Record{0: h, 1: d}', Pair.meta['name'])
+        result = Pair(struct.pack('>hxxd', -3, 1.5))
+        self.assertEqual({'0': -3, '1': 1.5}, result._asdict())
+
+        with self.assertRaises(ValueError):
+            c.record('@i')
+        with self.assertRaises(ValueError):
+            c.record('<i?z')
+
+    def test_sequence_of_records(self):
+        values = [(i, i % 50, True) for i in range(2000)]
+        values[1234] = (1234, 61.0, False)
+        with tempfile.TemporaryFile() as f:
+            f.write(b''.join(self.packer.pack(*x) for x in values))
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with util.throws_with_message('Error on Sequence(Telemetry)[1234].temperature: '
+                                              'expected Temperature but was float'):
+                    c.sequence(self.Telemetry)(mapped)
+
+                result = c.list(self.Telemetry)(mapped, ctx=context.create(
+                    validation_error_observer=_Ignore()))
+                self.assertEqual(2000, len(result))
+                self.assertEqual(1999, result[-1].id)
+                self.assertEqual([0, 1], [x.id for x in result][:2])
+                self.assertFalse(c.sequence(self.Telemetry).is_type(mapped))
+                del result
+
+    def test_list_of_records(self):
+        Records = c.list(self.Telemetry)
+        data = self.packer.pack(1, 1.0, True) + self.packer.pack(2, 2.0, False)
+        self.assertTrue(Records.is_type(data))
+        self.assertEqual(2, Records(data)[1].id)
+        self.assertIsNone(Records(b''))
+
+        with util.throws_with_message('Error on List(Telemetry): expected List(Telemetry) but was buffer of 19 bytes'):
+            Records(data + b'\x00')
+        self.assertFalse(Records.is_type(data + b'\x00'))
+
+
+class _Ignore(context.ValidationErrorObserver):
+    def on_error(self, ctx, expected_type, found_type):
+        pass
@@ -0,0 +1,85 @@
+import re
+import sys
+import unittest
+from unittest import mock
+
+from pycomb import combinators as c
+from pycomb.test import util
+
+_compile = re.compile
+
+
+class _CountingPattern:
+    matches = 0
+
+    def __init__(self, pattern, flags=0):
+        self._pattern = _compile(pattern, flags)
+        self.groups, self.pattern = self._pattern.groups, self._pattern.pattern
+        self.flags, self.groupindex = self._pattern.flags, self._pattern.groupindex
+
+    def match(self, value):
+        _CountingPattern.matches += 1
+        return self._pattern.match(value)
+
+
+class TestRegexp(unittest.TestCase):
+    def setUp(self):
+        _CountingPattern.matches = 0
+        with mock.patch('re.compile', _CountingPattern):
+            self.Pair = c.regexp_group(r'(\d+)-(\d+)', c.String, c.subtype(c.String, lambda d: int(d) < 10),
+                                       name='Pair')
+            self.Word = c.regexp_group(r'(\d+)-(\w+)', c.String, c.String, name='Word')
+            self.Letter = c.regexp_group(r'x(\w)', c.String, name='Letter')
+
+    def test_no_value_kept(self):
+        # is_type keeps no match: the value is not kept alive, and validation matches it again.
+        line = '1-' + 'a' * 100000
+        references = sys.getrefcount(line)
+        self.assertTrue(self.Word.is_type(line))
+        self.assertTrue(c.maybe(self.Word).is_type(line))
+        self.assertTrue(c.union(self.Word, self.Letter).is_type(line))
+        self.assertEqual(references, sys.getrefcount(line))
+        self.assertEqual(line, c.maybe(c.subtype(self.Word, lambda d: True))(line))
+        self.assertEqual(line, c.union(self.Word, self.Letter)(line))
+        self.assertEqual(references, sys.getrefcount(line))
+        self.assertEqual(4, _CountingPattern.matches)
+
+        # Mutable values are matched again.
+        Bytes = c.regexp_group(rb'(a+)', c.ByteString)
+        value = bytearray(b'aa')
+        self.assertTrue(Bytes.is_type(value))
+        value[0] = ord('b')
+        self.assertFalse(Bytes.is_type(value))
+
+    def test_union(self):
+        Token = c.union(self.Pair, self.Word, self.Letter)
+        for value in ('1-2', '1-a', 'xy'):
+            self.assertTrue(Token.is_type(value))
+            self.assertEqual(value, Token(value))
+        # The joined pattern chose the branches, the ones of the members were never used.
+        self.assertEqual(0, _CountingPattern.matches)
+        # Pair matches but rejects its groups: the next members are tried one by one, and the
+        # one that matches validates the value.
+        self.assertEqual('1-20', Token('1-20'))
+        self.assertEqual(2, _CountingPattern.matches)
+
+        self.assertFalse(Token.is_type('zz'))
+        self.assertFalse(Token.is_type(1))
+        with util.throws_with_message('Error on Union(Pair, Word, Letter): expected Pair or Word or Letter but was str'):
+            Token('1-')
+        with util.throws_with_message('Error on Union(Pair, Letter): expected Pair or Letter but was str'):
+            c.union(self.Pair, self.Letter)('1-20')
+
+    def test_union_of_bytes(self):
+        Token = c.union(c.regexp_group(rb'(\d+)', c.ByteString), c.regexp_group(rb'([a-z]+)', c.ByteString))
+        self.assertTrue(Token.is_type(memoryview(b'abc')))
+        self.assertTrue(Token.is_type(bytearray(b'123')))
+        self.assertFalse(Token.is_type('123'))
+
+    def test_patterns_not_joined(self):
+        Repeated = c.regexp_group(r'(\w)\1', c.String)
+        Token = c.union(Repeated, self.Letter)
+        self.assertTrue(Token.is_type('aa'))
+        self.assertTrue(Token.is_type('xb'))
+        self.assertFalse(Token.is_type('ab'))
+        self.assertTrue(c.union(self.Pair, c.regexp_group(r'(?P<name>\w+)', c.String)).is_type('abc'))
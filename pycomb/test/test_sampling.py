@@ -0,0 +1,136 @@
+import threading
+import unittest
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from pycomb import combinators as c, context, exceptions, sampling
+from pycomb.decorators import returning
+
+
+class _FixedRandom:
+    def __init__(self, *values):
+        self.values = list(values)
+
+    def __call__(self):
+        return self.values.pop(0)
+
+
+class TestSampling(unittest.TestCase):
+    def test_returning_sample(self):
+        @returning(c.Int, sample=sampling.Sampler(0.5, rng=_FixedRandom(0.9, 0.1)))
+        def f(x):
+            return x
+
+        self.assertEqual('hello', f('hello'))
+        with self.assertRaises(exceptions.PyCombValidationError):
+            f('hello')
+        self.assertEqual({'rate': 0.5, 'validated': 1, 'skipped': 1, 'errors': 1}, f.sampler.stats)
+
+    def test_returning_sample_zero(self):
+        @returning(c.Int, sample=0)
+        def f(x):
+            return x
+
+        for _ in range(10):
+            f('hello')
+        self.assertEqual(10, f.sampler.skipped)
+        self.assertEqual(0, f.sampler.validated)
+
+    def test_function_sample(self):
+        sampler = sampling.Sampler(0.5, rng=_FixedRandom(0.9, 0.1))
+
+        @c.function(c.Int).with_sampling(sampler)
+        def f(x):
+            return x
+
+        self.assertEqual('hello', f('hello'))
+        with self.assertRaises(exceptions.PyCombValidationError):
+            f('hello')
+        self.assertIs(sampler, f.sampler)
+        self.assertEqual(1, sampler.validated)
+        self.assertEqual(1, sampler.skipped)
+
+    def test_adaptive(self):
+        sampler = sampling.Sampler(0.01, adaptive=True, decay_every=2, rng=lambda: 0.5)
+        observer = Mock()
+
+        @returning(c.Int, ctx=context.create(validation_error_observer=observer), sample=sampler)
+        def f(x):
+            return x
+
+        f('hello')
+        self.assertEqual(0, observer.on_error.call_count)
+        self.assertEqual(0.01, sampler.rate)
+
+        sampler.rate = 1.0
+        f('hello')
+        self.assertEqual(1, observer.on_error.call_count)
+        self.assertEqual(1, sampler.errors)
+        self.assertEqual(1.0, sampler.rate)
+
+        for _ in range(2):
+            f(1)
+        self.assertEqual(0.5, sampler.rate)
+        for _ in range(2):
+            f(1)
+        self.assertEqual(0.25, sampler.rate)
+        for _ in range(100):
+            f(1)
+        self.assertEqual(0.01, sampler.rate)
+
+    def test_error_reaches_custom_observer(self):
+        observer = Mock()
+        sampler = sampling.Sampler(1.0)
+        fun = c.function(c.Int).with_context(context.create(validation_error_observer=observer))
+        fun.with_sampling(sampler)
+
+        @fun
+        def f(x):
+            return x
+
+        f(1)
+        self.assertEqual(0, observer.on_error.call_count)
+        # The observer does not raise: the call goes on with the values it was given.
+        self.assertEqual('hello', f('hello'))
+        self.assertEqual(1, observer.on_error.call_count)
+        self.assertEqual(1, sampler.errors)
+
+    def test_values_are_not_converted(self):
+        seen = []
+
+        @c.function(c.enum({'red': 1}), c.list(c.Int)).with_sampling(sampling.Sampler(0.5, rng=_FixedRandom(0.9, 0.1)))
+        def f(color, numbers):
+            seen.append((color, numbers))
+
+        @returning(c.list(c.Int), sample=sampling.Sampler(0.5, rng=_FixedRandom(0.9, 0.1)))
+        def g(numbers):
+            return numbers
+
+        for _ in range(2):
+            f('red', [1])
+            self.assertEqual([1], g([1]))
+        self.assertEqual([('red', [1]), ('red', [1])], seen)
+
+    def test_concurrent_calls(self):
+        sampler = sampling.Sampler(0.5, rng=lambda: 0.4 if threading.current_thread().name.endswith('0') else 0.6)
+
+        @returning(c.Int, sample=sampler)
+        def f(x):
+            return x
+
+        def call():
+            for _ in range(2000):
+                f(1)
+
+        threads = [threading.Thread(target=call, name='caller-{}'.format(i)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual({'rate': 0.5, 'validated': 2000, 'skipped': 6000, 'errors': 0}, sampler.stats)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            sampling.Sampler(2)
@@ -0,0 +1,122 @@
+import threading
+import unittest
+
+from pycomb import combinators as c, context, shadow
+from pycomb.decorators import returning
+
+
+class _RecordingObserver(context.ValidationErrorObserver):
+    def __init__(self):
+        self.errors = []
+        self.threads = set()
+
+    def on_error(self, ctx, expected_type, found_type):
+        self.errors.append((ctx.path, expected_type, found_type))
+        self.threads.add(threading.current_thread().name)
+
+
+class TestShadow(unittest.TestCase):
+    def setUp(self):
+        self.validator = shadow.ShadowValidator(workers=2)
+        self.observer = _RecordingObserver()
+        self.ctx = context.create(validation_error_observer=self.observer, shadow=self.validator)
+
+    def tearDown(self):
+        self.validator.close()
+
+    def test_combinator(self):
+        Point = c.struct({'x': c.Int, 'y': c.list(c.Int)}, name='Point')
+        value = {'x': 'hello', 'y': [1, 'a']}
+        self.assertIs(value, Point(value, ctx=self.ctx))
+        self.validator.join()
+        self.assertEqual(
+            [('Point[x]', 'Int', str), ('Point[y][1]', 'Int', str)],
+            sorted(self.observer.errors, key=lambda d: d[0]))
+        self.assertEqual({'pycomb-shadow'}, self.observer.threads)
+        self.assertEqual(1, self.validator.validated)
+
+    def test_decorators(self):
+        fun = c.function(c.Int, b=c.String).with_context(self.ctx)
+
+        @fun
+        @returning(c.String, ctx=self.ctx)
+        def f(a, b=None):
+            return a
+
+        self.assertEqual(1, f(1, b=2))
+        self.validator.join()
+        self.assertEqual(
+            [('Function(Int, b=String)', 'String', int), ('String', 'String', int)],
+            sorted(self.observer.errors, key=lambda d: d[0]))
+
+    def test_snapshot(self):
+        validator = shadow.ShadowValidator(snapshot=True)
+        ctx = context.create(validation_error_observer=self.observer, shadow=validator)
+        value = ['a']
+        c.list(c.String)(value, ctx=ctx)
+        value.append(1)
+        validator.join()
+        validator.close()
+        self.assertEqual([], self.observer.errors)
+
+    def test_default_observer(self):
+        validator = shadow.ShadowValidator()
+        ctx = context.create(shadow=validator)
+        self.assertEqual('hello', c.Int('hello', ctx=ctx))
+        validator.join()
+        validator.close()
+        self.assertEqual(1, validator.raised)
+
+    def test_stats_under_load(self):
+        validator = shadow.ShadowValidator(workers=4, when_full=shadow.BLOCK)
+        ctx = context.create(shadow=validator)
+
+        def submit():
+            for i in range(2000):
+                c.Int(i if i % 2 else 'a', ctx=ctx)
+
+        threads = [threading.Thread(target=submit) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        validator.join()
+        validator.close()
+        self.assertEqual(
+            {'submitted': 8000, 'dropped': 0, 'validated': 8000, 'raised': 4000, 'queued': 0},
+            validator.stats)
+
+    def test_drop_newest(self):
+        self._test_policy(shadow.DROP_NEWEST, ['a', 'b'])
+
+    def test_drop_oldest(self):
+        self._test_policy(shadow.DROP_OLDEST, ['b', 'c'])
+
+    def _test_policy(self, policy, expected):
+        validator = shadow.ShadowValidator(max_queue=2, when_full=policy)
+        ctx = context.create(validation_error_observer=self.observer, shadow=validator)
+        seen = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(x, ctx=None):
+            if x == 'first':
+                started.set()
+                release.wait()
+            else:
+                seen.append(x)
+
+        validator.submit(slow, 'first', ctx)
+        started.wait()
+        for x in ('a', 'b', 'c'):
+            validator.submit(slow, x, ctx)
+        release.set()
+        validator.join()
+        validator.close()
+        self.assertEqual(expected, seen)
+        self.assertEqual(1, validator.dropped)
+        self.assertEqual(4, validator.submitted)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            shadow.ShadowValidator(when_full='whatever')
@@ -0,0 +1,62 @@
+import unittest
+
+from pycomb import combinators as c, context
+from pycomb.predicates import StructType
+from pycomb.test import util
+
+
+class TestTable(unittest.TestCase):
+    def setUp(self):
+        self.Row = c.struct({
+            'id': c.Int,
+            'name': c.String,
+            'score': c.maybe(c.Number),
+            'country': c.enum.of(['IT', 'FR']),
+            'visits': c.subtype(c.Int, lambda d: d >= 0),
+            'tags': c.list(c.String)
+        }, name='Row')
+        self.Table = c.table(self.Row)
+        self.rows = [
+            {'id': i, 'name': str(i), 'score': i / 2 if i % 2 else None, 'country': 'IT', 'visits': i, 'tags': []}
+            for i in range(10)]
+
+    def test_valid(self):
+        self.assertIs(self.rows, self.Table(self.rows))
+        self.assertTrue(self.Table.is_type(self.rows))
+        self.assertTrue(self.Table.is_type(()))
+        self.assertEqual('Table(Row)', self.Table.meta['name'])
+        self.assertEqual([self.Row.example] * 3, self.Table.example)
+
+    def test_errors(self):
+        self.rows[7]['visits'] = -1
+        self.rows[3]['country'] = 'DE'
+        with util.throws_with_message('Error on Table(Row)[3].country: expected FR or IT but was DE'):
+            self.Table(self.rows)
+        self.assertFalse(self.Table.is_type(self.rows))
+
+        errors = []
+        observer = type('Observer', (), {'on_error': lambda _, ctx, expected, found: errors.append(ctx.path)})()
+        self.rows[5].update(id='5', name=None)
+        self.rows[6] = 6
+        self.Table(self.rows, ctx=context.create(validation_error_observer=observer))
+        self.assertEqual([
+            'Table(Row)[3].country', 'Table(Row)[5].id', 'Table(Row)[5].name', 'Table(Row)[6]',
+            'Table(Row)[7].visits'], errors)
+
+        with util.throws_with_message('Error on Table(Row): expected Table(Row) but was dict'):
+            self.Table({})
+
+    def test_irregular_rows(self):
+        self.rows[2]['other'] = 1
+        self.rows[4] = StructType(self.rows[4])
+        del self.rows[6]['score']
+        self.assertTrue(self.Table.is_type(self.rows))
+        self.Table(self.rows)
+
+        strict = c.table(c.struct(self.Row.meta['fields'], name='Strict', strict=True))
+        with util.throws_with_message('Error on Table(Strict)[2]: expected Strict but was dict'):
+            strict(self.rows)
+
+    def test_not_a_struct(self):
+        with self.assertRaises(ValueError):
+            c.table(c.list(c.Int))
@@ -0,0 +1,103 @@
+import unittest
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+import pycomb
+from pycomb import combinators as c, context, exceptions
+from pycomb.test import util
+
+
+class TestTracking(unittest.TestCase):
+    def test_struct(self):
+        condition = Mock(return_value=True)
+        User = c.struct({
+            'name': c.subtype(c.String, condition),
+            'age': c.maybe(c.Int),
+            'gender': c.enum({'M': 'male', 'F': 'female'})
+        }, name='User')
+        user = pycomb.tracked(User, {'name': 'John', 'gender': 'M'})
+        self.assertEqual('male', user['gender'])
+        self.assertEqual('John', user.name)
+        self.assertIsNone(user.age)
+        condition.reset_mock()
+
+        user['age'] = 30
+        user.update(gender='F', extra=1)
+        self.assertEqual({'name': 'John', 'age': 30, 'gender': 'female', 'extra': 1}, dict(user))
+        self.assertEqual(0, condition.call_count)
+
+        with util.throws_with_message('Error on User[age].Maybe (Int): expected None or Int but was str'):
+            user['age'] = '31'
+        self.assertEqual(30, user.age)
+
+        del user['age']
+        with util.throws_with_message('Error on User[name]: expected String but was NoneType'):
+            del user['name']
+        with self.assertRaises(AttributeError):
+            user.age
+
+    def test_strict_struct(self):
+        User = c.struct({'name': c.String}, strict=True, name='User')
+        user = pycomb.tracked(User, {'name': 'John'})
+        with util.throws_with_message('Error on User: expected User but was dict'):
+            user['age'] = 30
+
+    def test_list(self):
+        condition = Mock(return_value=True)
+        Numbers = c.list(c.subtype(c.Int, condition), name='Numbers')
+        numbers = pycomb.tracked(Numbers, [1, 2])
+        self.assertEqual(2, condition.call_count)
+        condition.reset_mock()
+
+        numbers.append(3)
+        numbers.extend([4, 5])
+        numbers.insert(0, 0)
+        numbers[1] = 10
+        numbers[-1] = 50
+        self.assertEqual([0, 10, 2, 3, 4, 50], numbers)
+        self.assertEqual(6, condition.call_count)
+
+        with util.throws_with_message('Error on Numbers[6]: expected Int but was str'):
+            numbers.append('6')
+        with util.throws_with_message('Error on Numbers[0]: expected Int but was str'):
+            numbers.insert(-10, '6')
+        with util.throws_with_message('Error on Numbers[2]: expected Int but was float'):
+            numbers[1:3] = [1, 2.0]
+        self.assertEqual([0, 10, 2, 3, 4, 50], numbers)
+
+        empty = pycomb.tracked(c.sequence(c.Int), [])
+        empty.append(1)
+        self.assertEqual([1], empty)
+
+    def test_dictionary(self):
+        d = pycomb.tracked(c.dictionary(c.String, c.Int, name='D'), {'a': 1})
+        d['b'] = 2
+        self.assertEqual({'a': 1, 'b': 2}, dict(d))
+        with util.throws_with_message('Error on D.1: expected String but was int'):
+            d[1] = 2
+        with util.throws_with_message('Error on D[c]: expected Int but was str'):
+            d['c'] = 'x'
+        del d['a']
+        self.assertEqual({'b': 2}, dict(d))
+
+    def test_custom_context(self):
+        observer = Mock()
+        ctx = context.create(validation_error_observer=observer)
+        numbers = pycomb.tracked(c.list(c.Int), [1, 'a'], ctx=ctx)
+        self.assertEqual(1, observer.on_error.call_count)
+        numbers.append('b')
+        self.assertEqual(2, observer.on_error.call_count)
+        self.assertEqual([1, 'a', 'b'], numbers)
+
+    def test_production(self):
+        numbers = pycomb.tracked(c.list(c.Int), [1, 'a'], ctx=context.create(production_mode=True))
+        numbers.append('b')
+        self.assertEqual([1, 'a', 'b'], numbers)
+
+    def test_not_trackable(self):
+        with self.assertRaises(TypeError):
+            pycomb.tracked(c.Int, 1)
+        with self.assertRaises(exceptions.PyCombValidationError):
+            pycomb.tracked(c.list(c.Int), ['a'])
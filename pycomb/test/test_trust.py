@@ -0,0 +1,93 @@
+import array
+import unittest
+try:
+    from unittest.mock import Mock
+except ImportError:
+    from mock import Mock
+
+from pycomb import combinators as c, context, trust
+from pycomb import json as pjson
+
+
+class TestTrust(unittest.TestCase):
+    def setUp(self):
+        trust.registry.clear()
+        self.condition = Mock(return_value=True)
+        self.Element = c.subtype(c.Int, self.condition)
+
+    def test_list(self):
+        ctx = context.create(trust=True)
+        numbers = c.list(self.Element)
+        result = numbers([1, 2, 3], ctx=ctx)
+        self.assertEqual(3, self.condition.call_count)
+
+        self.assertIs(result, numbers(result))
+        self.assertIs(result, c.list(self.Element, name='Other')(result))
+        self.assertTrue(numbers.is_type(result))
+        self.assertEqual(3, self.condition.call_count)
+
+        sequence = c.sequence(self.Element)(result, ctx=ctx)
+        self.assertIs(sequence, c.sequence(self.Element)(sequence))
+        self.assertEqual(6, self.condition.call_count)
+
+        # Structurally equal.
+        c.list(c.subtype(c.Int, self.condition))(result)
+        self.assertEqual(6, self.condition.call_count)
+
+        # Not the same structure.
+        typed = c.list(c.subtype(c.Int, self.condition), typecode='q')(result)
+        self.assertEqual(array.array('q', [1, 2, 3]), typed)
+        self.assertEqual(9, self.condition.call_count)
+        other_condition = Mock(return_value=True)
+        c.list(c.subtype(c.Int, other_condition))(result)
+        self.assertEqual(3, other_condition.call_count)
+
+    def test_opt_in(self):
+        result = c.list(self.Element)([1, 2, 3])
+        c.sequence(self.Element)([1, 2, 3])
+        pjson.loads(c.list(self.Element), '[1, 2]')
+        self.assertEqual(0, len(trust.registry))
+        c.list(self.Element)(result)
+        self.assertEqual(11, self.condition.call_count)
+
+    def test_errors_are_not_trusted(self):
+        observer = Mock()
+        ctx = context.create(validation_error_observer=observer)
+        numbers = c.list(c.Int)
+        result = numbers([1, 'a'], ctx=context.create(validation_error_observer=observer, trust=True))
+        numbers(result, ctx=ctx)
+        self.assertEqual(2, observer.on_error.call_count)
+
+    def test_dictionary_and_object(self):
+        class Item:
+            def __init__(self, a):
+                self.a = a
+
+        item = c.generic_object({'a': self.Element}, Item, trusted=True)
+        items = c.dictionary(c.String, item, trusted=True)
+        value = {'x': Item(1), 'y': Item(2)}
+        items(value)
+        self.assertEqual(2, self.condition.call_count)
+        items(value)
+        item(value['x'])
+        self.assertEqual(2, self.condition.call_count)
+        self.assertEqual(3, len(trust.registry))
+
+        c.dictionary(c.String, c.Int)({'a': 1})
+        self.assertEqual(3, len(trust.registry))
+
+    def test_json(self):
+        numbers = c.list(self.Element)
+        result = pjson.loads(numbers, '[1, 2]', ctx=context.create(trust=True))
+        numbers(result)
+        self.assertEqual(2, self.condition.call_count)
+
+    def test_registry_size(self):
+        registry = trust.TrustRegistry(max_size=2)
+        values = [(1,), (2,), (3,)]
+        for x in values:
+            registry.mark(x, c.Int)
+        self.assertEqual(2, len(registry))
+        self.assertFalse(registry.is_trusted(values[0], c.Int))
+        self.assertTrue(registry.is_trusted(values[2], c.Int))
+        self.assertFalse(registry.is_trusted(values[2], c.String))
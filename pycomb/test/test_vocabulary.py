@@ -0,0 +1,93 @@
+import array
+import os
+import tempfile
+import unittest
+
+from pycomb import combinators as c, exceptions, vocabulary
+from pycomb.test import util
+
+
+class TestVocabulary(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        self.addCleanup(os.remove, self.path)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write('\n'.join('SKU{:05d}'.format(i) for i in range(0, 1000, 2)) + '\nàèì\n')
+
+    def test_vocabularies(self):
+        values = ['SKU{:05d}'.format(i) for i in range(0, 1000, 2)] + ['àèì']
+        for v in (vocabulary.SetVocabulary(values), vocabulary.SortedVocabulary(sorted(values)),
+                  vocabulary.FileVocabulary(self.path)):
+            self.assertEqual(501, len(v), msg=type(v))
+            self.assertEqual(set(values), set(v), msg=type(v))
+            for value in values:
+                self.assertIn(value, v)
+                self.assertEqual(value, v[value])
+            for value in ('SKU00001', 'SKU', 'SKU009980', 'A', 'zzz', '', 'SKU00000\nSKU00002', 1, None, []):
+                self.assertNotIn(value, v, msg=(type(v), value))
+            self.assertEqual(['SKU00000', 'SKU00002'], v.smallest(2))
+            self.assertEqual({'SKU00001', 'A'}, v.missing(['SKU00000', 'SKU00001', 'A', 'SKU00001']))
+
+    def test_empty_file(self):
+        with open(self.path, 'w'):
+            pass
+        v = vocabulary.FileVocabulary(self.path)
+        self.assertEqual(0, len(v))
+        self.assertNotIn('a', v)
+
+    def test_sorted_array(self):
+        Code = c.enum(vocabulary.SortedVocabulary(array.array('q', range(0, 100, 3))), name='Code')
+        self.assertEqual(3, Code(3))
+        self.assertTrue(Code.is_type(99))
+        self.assertFalse(Code.is_type(4))
+        self.assertFalse(Code.is_type(3.0))
+        self.assertFalse(Code.is_type('3'))
+        Codes = c.list(Code)
+        self.assertFalse(Codes.is_type([3, 3.0]))
+        self.assertFalse(Codes.is_type([3, True]))
+        self.assertTrue(Codes.is_type([3, 3, 0]))
+        with util.throws_with_message('Error on List(Code)[1]: expected 0 or 3 or 6 or 9 or 12 or 15 or 18 or 21 or 24 or '
+                                      '27 or 30 or 33 or 36 or 39 or 42 or 45 or 48 or 51 or 54 or 57 or ... (34 values) '
+                                      'but was 3.0'):
+            Codes([3, 3.0])
+        self.assertEqual(0, Code.example)
+
+    def test_enum_of(self):
+        Enum = c.enum.of(['b', 'a', 'c', 'a'])
+        self.assertIsInstance(Enum.meta['values'], vocabulary.SetVocabulary)
+        self.assertEqual('Enum(a: a, b: b, c: c)', Enum.meta['name'])
+        self.assertEqual('a', Enum.example)
+        self.assertEqual('b', Enum.b)
+        self.assertFalse(Enum.is_type(['a']))
+
+    def test_truncated_text(self):
+        Sku = c.enum(vocabulary.FileVocabulary(self.path))
+        self.assertTrue(Sku.meta['name'].startswith('Enum(SKU00000: SKU00000, SKU00002: SKU00002, '))
+        self.assertTrue(Sku.meta['name'].endswith(', SKU00038: SKU00038, ... (501 values))'))
+        with util.throws_with_message(
+                'Error on Sku: expected SKU00000 or SKU00002 or SKU00004 or SKU00006 or SKU00008 or SKU00010 or '
+                'SKU00012 or SKU00014 or SKU00016 or SKU00018 or SKU00020 or SKU00022 or SKU00024 or SKU00026 or '
+                'SKU00028 or SKU00030 or SKU00032 or SKU00034 or SKU00036 or SKU00038 or ... (501 values) '
+                'but was SKU00001'):
+            c.enum(vocabulary.FileVocabulary(self.path), name='Sku')('SKU00001')
+
+        with util.throws_with_message('Error on Digit: expected 0 or 1 or 2 or 3 or 4 or 5 or 6 or 7 or 8 or 9 '
+                                      'but was 10'):
+            c.enum({i: i for i in range(10)}, name='Digit')(10)
+
+    def test_enum_lists(self):
+        Skus = c.list(c.enum(vocabulary.FileVocabulary(self.path), name='Sku'))
+        self.assertEqual(('SKU00002', 'SKU00000', 'SKU00002'), Skus(['SKU00002', 'SKU00000', 'SKU00002']))
+        self.assertTrue(Skus.is_type(['SKU00002', 'àèì']))
+        self.assertFalse(Skus.is_type(['SKU00002', 'SKU00003']))
+        self.assertFalse(Skus.is_type(['SKU00002', ['SKU00003']]))
+        with self.assertRaises(exceptions.PyCombValidationError) as e:
+            Skus(['SKU00002', 'SKU00003'])
+        self.assertTrue(e.exception.args[0].startswith('Error on List(Sku)[1]: expected SKU00000 or'))
+
+        Genders = c.sequence(c.enum({'M': 'male', 'F': 'female'}))
+        self.assertEqual(('male', 'female', 'male'), Genders(['M', 'F', 'M']))
+        self.assertTrue(Genders.is_type('MFM'))
+        self.assertFalse(Genders.is_type(['M', 'X']))
+        with util.throws_with_message('Error on Sequence(Enum(F: female, M: male))[2]: expected F or M but was X'):
+            Genders(('M', 'F', 'X'))
@@ -0,0 +1,155 @@
+from collections import abc
+
+from pycomb import context, predicates as p
+from pycomb.combinators import assert_type
+
+
+class _Tracked:
+    def __init__(self, combinator, ctx):
+        self._combinator = combinator
+        self._ctx = context.create(ctx)
+        if self._ctx.empty:
+            self._ctx.append(combinator.meta['name'])
+
+    def _item_ctx(self, path_element, separator=''):
+        result = context.create(self._ctx)
+        result.append(path_element, separator=separator)
+        return result
+
+    def _check(self, combinator, value, path_element, separator=''):
+        if self._ctx.production_mode:
+            return value
+        return combinator(value, ctx=self._item_ctx(path_element, separator=separator))
+
+
+class TrackedStruct(_Tracked, abc.MutableMapping):
+    """
+    The fields of a validated struct, that are validated one by one when they are changed.
+    """
+    def __init__(self, combinator, fields, ctx):
+        _Tracked.__init__(self, combinator, ctx)
+        self._data = dict(fields)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __getattr__(self, item):
+        try:
+            return self.__dict__['_data'][item]
+        except KeyError:
+            raise AttributeError(item)
+
+    def __setitem__(self, key, value):
+        self._data[key] = self._check_field(key, value)
+
+    def __delitem__(self, key):
+        self._check_field(key, None)
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return 'TrackedStruct({!r})'.format(self._data)
+
+    def _check_field(self, key, value):
+        meta = self._combinator.meta
+        field = meta['fields'].get(key)
+        if field is not None:
+            return self._check(field, value, '[{}]'.format(key))
+        if meta['strict'] and not self._ctx.production_mode:
+            assert_type(False, ctx=self._ctx, expected=meta['name'], found_type=dict)
+        return value
+
+
+class TrackedDictionary(_Tracked, abc.MutableMapping):
+    """
+    A validated dictionary whose new keys and values are validated when they are set.
+    """
+    def __init__(self, combinator, items, ctx):
+        _Tracked.__init__(self, combinator, ctx)
+        self._data = dict(items)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        meta = self._combinator.meta
+        self._check(meta['key'], key, '{}'.format(key), separator='.')
+        self._check(meta['value'], value, '[{}]'.format(key))
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return 'TrackedDictionary({!r})'.format(self._data)
+
+
+class TrackedList(_Tracked, abc.MutableSequence):
+    """
+    A validated list whose new elements are validated when they are added.
+    """
+    def __init__(self, combinator, elements, ctx):
+        _Tracked.__init__(self, combinator, ctx)
+        self._data = [x for x in elements]
+
+    def __getitem__(self, index):
+        return self._data[index]
+
+    def __setitem__(self, index, value):
+        element = self._combinator.meta['element']
+        if isinstance(index, slice):
+            start = index.indices(len(self._data))[0]
+            value = [self._check(element, x, '[{}]'.format(start + i)) for i, x in enumerate(value)]
+        else:
+            value = self._check(element, value, '[{}]'.format(index % len(self._data) if self._data else index))
+        self._data[index] = value
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def __len__(self):
+        return len(self._data)
+
+    def insert(self, index, value):
+        position = min(index if index >= 0 else max(len(self._data) + index, 0), len(self._data))
+        self._data.insert(index, self._check(self._combinator.meta['element'], value, '[{}]'.format(position)))
+
+    def __eq__(self, other):
+        return self._data == (other._data if isinstance(other, TrackedList) else other)
+
+    def __repr__(self):
+        return 'TrackedList({!r})'.format(self._data)
+
+
+def tracked(combinator, value, ctx=None):
+    """
+    Validates ``value`` and returns a mutable container whose changes are validated incrementally,
+    by the combinators of the changed fields or elements only.
+
+    Structs, lists, sequences and dictionaries can be tracked.
+    """
+    kind = combinator.meta.get('kind')
+    if kind not in ('struct', 'list', 'sequence', 'dictionary'):
+        raise TypeError('Cannot track values of {}'.format(combinator.meta['name']))
+
+    result = combinator(value, ctx=ctx)
+    if kind == 'struct':
+        if type(result) is p.StructType:
+            fields = result.__dict__['x']
+        else:
+            fields = result if isinstance(result, dict) else {}
+        return TrackedStruct(combinator, fields, ctx)
+    if kind == 'dictionary':
+        return TrackedDictionary(combinator, result.items() if hasattr(result, 'items') else (), ctx)
+    return TrackedList(combinator, result or (), ctx)
@@ -0,0 +1,103 @@
+"""
+Tracking of the values already validated by pycomb.
+
+The tuples built by ``list`` and ``sequence`` when validating with ``context.create(trust=True)``,
+and the values accepted by ``dictionary`` and ``generic_object`` with ``trusted=True``, are recorded
+together with the structure of the combinator that validated them. When the same value goes through the same combinator,
+or through a structurally equal one, it is accepted at once.
+As for ``StructType``, values are trusted by identity: a dictionary or an object must not
+be changed after having been validated with ``trust=True``.
+"""
+import threading
+import weakref
+from collections import OrderedDict
+
+_keys = weakref.WeakKeyDictionary()
+
+
+def structural_key(combinator):
+    """
+    Returns a hashable key that is equal for combinators with the same structure,
+    regardless of their names.
+    """
+    try:
+        return _keys[combinator]
+    except KeyError:
+        pass
+    except TypeError:
+        return combinator
+
+    meta = getattr(combinator, 'meta', {})
+    kind = meta.get('kind')
+    if kind == 'irreducible':
+        key = (kind, combinator.is_type)
+    elif kind in ('list', 'sequence'):
+        # Lists with a typecode return arrays: a tuple trusted by list(Int) is not one.
+        key = (kind, structural_key(meta['element']), meta.get('typecode'))
+    elif kind == 'struct':
+        key = (kind, meta['strict'], tuple((k, structural_key(v)) for k, v in meta['fields'].items()))
+    elif kind == 'maybe':
+        key = (kind, structural_key(meta['combinator']))
+    elif kind in ('union', 'intersection'):
+        key = (kind, tuple(structural_key(x) for x in meta['combinators']))
+    elif kind == 'tagged_union':
+        key = (kind, meta['tag'], tuple((k, structural_key(v)) for k, v in meta['combinators'].items()))
+    elif kind == 'subtype':
+        key = (kind, structural_key(meta['combinator']), meta['condition'])
+    elif kind == 'dictionary':
+        key = (kind, structural_key(meta['key']), structural_key(meta['value']))
+    elif kind == 'object':
+        key = (kind, meta['object_type'], tuple((k, structural_key(v)) for k, v in meta['fields'].items()))
+    else:
+        key = combinator
+
+    _keys[combinator] = key
+    return key
+
+
+class TrustRegistry:
+    """
+    Remembers up to ``max_size`` validated values, the oldest ones are forgotten first.
+    Values that support weak references are not kept alive by the registry; the others, such as
+    tuples and dictionaries, are kept alive until they are forgotten: this is why recording them
+    is opt-in.
+    """
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mark(self, value, combinator):
+        key = structural_key(combinator)
+        try:
+            ref = weakref.ref(value)
+        except TypeError:
+            ref = None
+
+        with self._lock:
+            entry = self._entries.get(id(value))
+            if entry is None or not self._is_same(entry, value):
+                entry = (ref or value, ref is not None, set())
+                self._entries[id(value)] = entry
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+            entry[2].add(key)
+
+    def is_trusted(self, value, combinator):
+        entry = self._entries.get(id(value))
+        return entry is not None and self._is_same(entry, value) and structural_key(combinator) in entry[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _is_same(entry, value):
+        target, weak, _ = entry
+        return (target() if weak else target) is value
+
+
+registry = TrustRegistry()
@@ -0,0 +1,180 @@
+"""
+Vocabularies: the values of large enums, stored compactly.
+
+A vocabulary is a read-only mapping of each of its values to itself, that ``enum`` accepts in
+place of a dictionary:
+
+    Sku = combinators.enum(vocabulary.FileVocabulary('skus.txt'), name='Sku')
+
+* ``SetVocabulary``: the values in a frozenset
+* ``SortedVocabulary``: the values in a sorted sequence, e.g. an ``array.array`` of integer codes,
+  searched by bisection
+* ``FileVocabulary``: a sorted text file with one value per line, memory-mapped and searched by
+  bisection; the processes that open the same file share its pages
+"""
+import bisect
+import heapq
+import mmap
+from collections.abc import Mapping
+
+
+def smallest(values, n):
+    """
+    Returns the n smallest keys of a mapping, sorted; in iteration order if they cannot be compared.
+    """
+    if isinstance(values, Vocabulary):
+        return values.smallest(n)
+    return _smallest(values, n)
+
+
+def _smallest(values, n):
+    try:
+        return heapq.nsmallest(n, values) if len(values) > n else sorted(values)
+    except TypeError:
+        return [x for x, _ in zip(values, range(n))]
+
+
+def missing(values, batch):
+    """
+    Returns the set of the elements of batch that are not keys of values.
+    Raises TypeError if some element cannot be hashed.
+    """
+    if isinstance(values, Vocabulary):
+        return values.missing(batch)
+    # Looks up each distinct element in the dictionary, without iterating over it.
+    return set(batch).difference(values)
+
+
+class Vocabulary(Mapping):
+    """
+    A mapping of each value to itself; subclasses implement ``__contains__``, ``__iter__`` and ``__len__``.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key in self:
+            return key
+        raise KeyError(key)
+
+    def missing(self, batch):
+        # Distinct by type as well: 3 and 3.0 are equal, but only one of them may be a value.
+        return {x for _, x in {(type(x), x) for x in batch} if x not in self}
+
+    def smallest(self, n):
+        return _smallest(self, n)
+
+    # The vocabulary is compared by identity, a large one would be iterated otherwise.
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
+
+class SetVocabulary(Vocabulary):
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        self._values = values if type(values) is frozenset else frozenset(values)
+
+    def __contains__(self, key):
+        try:
+            return key in self._values
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def missing(self, batch):
+        return set(batch).difference(self._values)
+
+
+class SortedVocabulary(Vocabulary):
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        """
+        values: a sorted sequence without duplicates, e.g. a list or an array.array.
+        """
+        self._values = values
+
+    def __contains__(self, key):
+        values = self._values
+        try:
+            i = bisect.bisect_left(values, key)
+            return i < len(values) and values[i] == key and type(values[i]) is type(key)
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def smallest(self, n):
+        return list(self._values[:n])
+
+
+class FileVocabulary(Vocabulary):
+    __slots__ = ('path', 'encoding', '_map', '_len')
+
+    def __init__(self, path, encoding='utf-8'):
+        """
+        path: a text file with one value per line, sorted by the encoded bytes of the values
+        (``LC_ALL=C sort -u``); with UTF-8 this is the order of the strings.
+        """
+        self.path = path
+        self.encoding = encoding
+        self._len = None
+        with open(path, 'rb') as f:
+            # Empty files cannot be mapped.
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if f.seek(0, 2) else b''
+
+    def __contains__(self, key):
+        if type(key) is not str:
+            return False
+        key = key.encode(self.encoding)
+        if not key or b'\n' in key:
+            return False
+
+        data = self._map
+        # lo and hi are always at the start of a line.
+        lo, hi = 0, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = data.rfind(b'\n', 0, mid) + 1
+            end = data.find(b'\n', mid)
+            if end < 0:
+                end = len(data)
+            line = data[start:end]
+            if line < key:
+                lo = end + 1
+            elif line > key:
+                hi = start
+            else:
+                return True
+        return False
+
+    def _lines(self):
+        data, start = self._map, 0
+        while start < len(data):
+            end = data.find(b'\n', start)
+            if end < 0:
+                end = len(data)
+            if end > start:
+                yield data[start:end].decode(self.encoding)
+            start = end + 1
+
+    def __iter__(self):
+        return self._lines()
+
+    def __len__(self):
+        if self._len is None:
+            self._len = sum(1 for _ in self._lines())
+        return self._len
+
+    def smallest(self, n):
+        lines = self._lines()
+        return [x for x, _ in zip(lines, range(n))]